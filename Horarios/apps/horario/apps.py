@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 
 class HorarioConfig(AppConfig):
-    name = 'horario'
+    name = 'apps.horario'
+
+    def ready(self):
+        from apps.horario import signals
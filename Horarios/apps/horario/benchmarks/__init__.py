@@ -0,0 +1,4 @@
+"""
+	Benchmarks del generador de horarios: generadores sinteticos con semilla y los
+	escenarios que ejecuta el comando `benchmark_horarios`.
+"""
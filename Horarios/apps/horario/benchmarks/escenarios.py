@@ -0,0 +1,168 @@
+from apps.horario import pensums as horario_pensums
+from apps.horario import secciones as horario_secciones
+from apps.horario import services as horario_services
+from apps.horario import validations as horario_validations
+from apps.horario.benchmarks import generadores
+import gc
+import time
+import tracemalloc
+
+TAMANIOS = {
+    'iniciate': (6, 8, 10, 12),
+    'top_k': (10, 14, 18, 22),
+    'top_k_completo': (10, 14, 18, 22),
+    'top_k_primero_el_mejor': (10, 14, 18, 22),
+    'asigna_puntuacion': (6, 8, 10),
+    'secuencia_desbloqueo': (6, 8, 10),
+    'comprobar_combinacion_horario': (4, 5, 6, 7),
+    'pensum_sintetico': (60, 120, 240, 480),
+    'integrado': (8, 10, 12),
+}
+
+def caso_iniciate(carrera:str, tamanio:int, semilla:int):
+    peticion = generadores.generar_peticion(carrera, horario_pensums.obtener_pensum(carrera), tamanio, semilla)
+    return lambda: sum(1 for _ in horario_services.iniciate(peticion))
+
+def caso_top_k(carrera:str, tamanio:int, semilla:int):
+    peticion = generadores.generar_peticion(carrera, horario_pensums.obtener_pensum(carrera), tamanio, semilla)
+    return lambda: sum(1 for _ in horario_services.iniciate(peticion, top_k=10))
+
+def caso_top_k_completo(carrera:str, tamanio:int, semilla:int):
+    # Las mismas peticiones que 'top_k', eligiendo las 10 mejores de la generacion completa
+    peticion = generadores.generar_peticion(carrera, horario_pensums.obtener_pensum(carrera), tamanio, semilla)
+    return lambda: len(sorted(horario_services.iniciate(peticion), key=lambda resultado: -resultado['puntaje'])[:10])
+
+def caso_top_k_primero_el_mejor(carrera:str, tamanio:int, semilla:int):
+    # Las mismas peticiones que 'top_k' resueltas siempre con la busqueda primero-el-mejor
+    peticion = generadores.generar_peticion(carrera, horario_pensums.obtener_pensum(carrera), tamanio, semilla)
+    return lambda: sum(1 for _ in horario_services.Pensum(peticion).mejores_combinaciones(10))
+
+def caso_asigna_puntuacion(carrera:str, tamanio:int, semilla:int):
+    peticion = generadores.generar_peticion(carrera, horario_pensums.obtener_pensum(carrera), tamanio, semilla)
+    return lambda: sum(1 for _ in horario_services.iniciate(peticion, por_lotes=False))
+
+def caso_secuencia_desbloqueo(carrera:str, tamanio:int, semilla:int):
+    peticion = generadores.generar_peticion(carrera, horario_pensums.obtener_pensum(carrera), tamanio, semilla)
+    pensum = horario_services.Pensum(peticion)
+    mascaras = list(pensum.generarTodasPosibilidades())
+    return lambda: sum(len(pensum.secuencia_desbloqueo(mascara)) for mascara in mascaras)
+
+def caso_comprobar_combinacion_horario(carrera:str, tamanio:int, semilla:int):
+    codigos = [materia['codigo'] for materia in horario_pensums.obtener_pensum(carrera)]
+    secciones = horario_secciones.compilar_secciones(generadores.generar_horario(codigos, 5, 0.04, semilla))
+    combinacion = [{'codigo': codigo, 'materia': codigo, 'creditos': 3} for codigo in codigos[:tamanio]]
+
+    def ejecutar():
+        horario = horario_services.Horario()
+        horario.secciones = secciones
+        return len(horario.comprobar_combinacion_horario(combinacion, limite=100) or [])
+    return ejecutar
+
+def caso_pensum_sintetico(carrera:str, tamanio:int, semilla:int):
+    nombre = 'sintetico-%d-%d' % (tamanio, semilla)
+    materias = generadores.generar_pensum(tamanio, semestres=10, densidad=0.6, electivas=tamanio // 10, semilla=semilla)
+    horario_pensums.registrar_pensum(nombre, materias)
+    peticion = generadores.generar_peticion(nombre, materias, 10, semilla)
+    return lambda: sum(1 for _ in horario_services.iniciate(peticion))
+
+def caso_integrado(carrera:str, tamanio:int, semilla:int):
+    pensum = horario_pensums.obtener_pensum(carrera)
+    peticion = generadores.generar_peticion(carrera, pensum, tamanio, semilla)
+    codigos = [peticion[clave]['codigo'] for clave in peticion if clave != "0"]
+    matriz = horario_secciones.MatrizChoques(horario_secciones.compilar_secciones(generadores.generar_horario(codigos, 3, 0.1, semilla)))
+
+    def ejecutar():
+        generador = horario_services.Pensum(peticion, matriz)
+        return sum(1 for _ in generador.asigna_puntuacion_por_lotes(generador.generarTodasPosibilidades()))
+    return ejecutar
+
+ESCENARIOS = {
+    'iniciate': caso_iniciate,
+    'top_k': caso_top_k,
+    'top_k_completo': caso_top_k_completo,
+    'top_k_primero_el_mejor': caso_top_k_primero_el_mejor,
+    'asigna_puntuacion': caso_asigna_puntuacion,
+    'secuencia_desbloqueo': caso_secuencia_desbloqueo,
+    'comprobar_combinacion_horario': caso_comprobar_combinacion_horario,
+    'pensum_sintetico': caso_pensum_sintetico,
+    'integrado': caso_integrado,
+}
+
+# Los escenarios sinteticos no dependen de la carrera, se ejecutan una sola vez
+SIN_CARRERA = ('pensum_sintetico',)
+
+def medir(funcion, repeticiones:int=3)->dict:
+    """
+        Mide una funcion: el menor tiempo de `repeticiones` ejecuciones y, en una ejecucion
+        aparte bajo tracemalloc, el pico de memoria reservada
+
+        :return: {'segundos','pico_kb','resultados'}
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        resultados = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        funcion()
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'segundos': min(tiempos), 'pico_kb': pico / 1024, 'resultados': resultados}
+
+def ejecutar(escenarios:list=None, carreras:list=None, tamanios:list=None, repeticiones:int=3, semilla:int=0, progreso=None)->list:
+    """
+        Ejecuta los escenarios para cada carrera y tamaño
+
+        :parametro escenarios: nombres de ESCENARIOS, por defecto todos
+        :tipo de parametro escenarios: list
+        :parametro carreras: carreras reales, por defecto todas
+        :tipo de parametro carreras: list
+        :parametro tamanios: tamaños a usar en vez de los de TAMANIOS
+        :tipo de parametro tamanios: list
+        :parametro progreso: funcion que recibe cada fila al terminarla
+        :return: lista de filas {'escenario','carrera','tamanio','segundos','pico_kb','resultados'}
+        :raises: ValueError
+    """
+    escenarios = escenarios or list(ESCENARIOS)
+    carreras = carreras or list(horario_validations.CARRERAS)
+    for escenario in escenarios:
+        if escenario not in ESCENARIOS:
+            raise ValueError(str("Los escenarios disponibles son: %s" % ', '.join(ESCENARIOS)))
+    for carrera in carreras:
+        horario_validations.validate_carrera(carrera)
+    filas = []
+    for escenario in escenarios:
+        for carrera in (['-'] if escenario in SIN_CARRERA else carreras):
+            for tamanio in (tamanios or TAMANIOS[escenario]):
+                funcion = ESCENARIOS[escenario](carrera.lower() if carrera != '-' else carrera, tamanio, semilla)
+                fila = dict({'escenario': escenario, 'carrera': carrera, 'tamanio': tamanio}, **medir(funcion, repeticiones))
+                filas.append(fila)
+                if progreso is not None:
+                    progreso(fila)
+    return filas
+
+def comparar(filas:list, linea_base:list, tolerancia:float=0.25)->list:
+    """
+        Compara cada fila con la de la linea base del mismo escenario, carrera y tamaño
+
+        :parametro tolerancia: cuanto mas lento que la linea base se acepta antes de marcar
+            una regresion, como fraccion
+        :tipo de parametro tolerancia: float
+        :return: las filas con 'base_segundos', 'relacion' y 'regresion' agregados cuando
+            hay linea base para ellas
+    """
+    base = {(fila['escenario'], fila['carrera'], fila['tamanio']): fila for fila in linea_base}
+    comparadas = []
+    for fila in filas:
+        fila = dict(fila)
+        anterior = base.get((fila['escenario'], fila['carrera'], fila['tamanio']))
+        if anterior is not None and anterior['segundos'] > 0:
+            fila['base_segundos'] = anterior['segundos']
+            fila['relacion'] = fila['segundos'] / anterior['segundos']
+            fila['regresion'] = fila['relacion'] > 1 + tolerancia
+        comparadas.append(fila)
+    return comparadas
@@ -0,0 +1,103 @@
+from apps.horario import secciones as horario_secciones
+import random
+
+CREDITOS = (2, 3, 3, 4, 4, 5)
+
+def generar_pensum(materias:int=60, semestres:int=10, densidad:float=0.5, electivas:int=6, semilla:int=0)->list:
+    """
+        Genera un pensum sintetico con el esquema de datos/pensums
+
+        :parametro materias: cantidad total de materias, incluidas las electivas
+        :tipo de parametro materias: int
+        :parametro semestres: semestres en los que se reparten las materias obligatorias
+        :tipo de parametro semestres: int
+        :parametro densidad: probabilidad de que una materia tenga un precedente; la mitad
+            de esa probabilidad es la de tener un segundo precedente
+        :tipo de parametro densidad: float
+        :parametro electivas: cuantas de las materias son electivas (semestre 99)
+        :tipo de parametro electivas: int
+        :parametro semilla: semilla del generador, el mismo valor da el mismo pensum
+        :tipo de parametro semilla: int
+        :return: lista de materias
+    """
+    aleatorio = random.Random(semilla)
+    obligatorias = materias - electivas
+    pensum = []
+    for indice in range(materias):
+        semestre = 1 + indice * semestres // obligatorias if indice < obligatorias else 99
+        anteriores = [materia['codigo'] for materia in pensum if materia['semestre'] < semestre]
+        p1 = p2 = ''
+        if semestre != 99 and anteriores and aleatorio.random() < densidad:
+            p1 = aleatorio.choice(anteriores)
+            if len(anteriores) > 1 and aleatorio.random() < densidad / 2:
+                p2 = aleatorio.choice([codigo for codigo in anteriores if codigo != p1])
+        pensum.append({
+            'codigo': '%07d' % (9000000 + indice),
+            'materia': 'Materia %d' % indice,
+            'creditos': aleatorio.choice(CREDITOS),
+            'semestre': semestre,
+            'presedentes': {'p1': p1, 'p2': p2},
+        })
+    return pensum
+
+def generar_horario(codigos:list, secciones:int=4, densidad:float=0.05, semilla:int=0)->dict:
+    """
+        Genera un horario general sintetico con el formato del campo horario
+
+        :parametro codigos: materias que tendran secciones
+        :tipo de parametro codigos: list
+        :parametro secciones: secciones por materia
+        :tipo de parametro secciones: int
+        :parametro densidad: fraccion de los bloques de la semana que ocupa cada seccion,
+            repartida en dos reuniones de dias distintos
+        :tipo de parametro densidad: float
+        :parametro semilla: semilla del generador
+        :tipo de parametro semilla: int
+        :return: diccionario de reuniones
+    """
+    aleatorio = random.Random(semilla)
+    dias = ('Lun', 'Mar', 'Mie', 'Jue', 'Vie')
+    ultimo = len(horario_secciones.HORAS) - 1
+    bloques = max(1, round(densidad * horario_secciones.DIAS_SEMANA * horario_secciones.BLOQUES_POR_DIA / 2))
+    bloques = min(bloques, ultimo + 1)
+    horario = {}
+    for codigo in codigos:
+        for numero in range(1, secciones + 1):
+            for dia in aleatorio.sample(dias, 2):
+                desde = aleatorio.randint(0, ultimo - bloques + 1)
+                horario[str(len(horario))] = {
+                    'codigo': codigo,
+                    'materia': codigo,
+                    'seccion': '%02d' % numero,
+                    'dia': dia,
+                    'desde': horario_secciones.HORAS[desde],
+                    'hasta': horario_secciones.HORAS[desde + bloques - 1],
+                    'aula': 'A-%d' % aleatorio.randint(1, 60),
+                    'profesor': 'Profesor %d' % aleatorio.randint(1, 200),
+                }
+    return horario
+
+def generar_peticion(carrera:str, pensum, materias:int, semilla:int=0, minimo:int=10, limite:int=18, aprobados:int=80, electivas:int=1)->dict:
+    """
+        Arma una peticion de generacion con `materias` materias al azar del pensum, de las
+        cuales `electivas` son electivas elegidas
+
+        :return: dict con el formato que recibe GenerarHorarioParticular
+    """
+    aleatorio = random.Random(semilla)
+    normales = [materia for materia in pensum if materia['semestre'] not in (99, 88, 77)]
+    disponibles = [materia for materia in pensum if materia['semestre'] in (99, 88)]
+    electivas = min(electivas, len(disponibles))
+    elegidas = aleatorio.sample(normales, materias - electivas) + aleatorio.sample(disponibles, electivas)
+    peticion = {"0": {"minimoCreditos": minimo, "limiteCreditos": limite, "creditosaprobados": aprobados, "carrera": carrera}}
+    for indice, materia in enumerate(elegidas, 1):
+        peticion[str(indice)] = {
+            'materia': materia['materia'],
+            'codigo': materia['codigo'],
+            'aprobada': 'false',
+            'creditos': materia['creditos'],
+            'presedentes': dict(materia['presedentes']),
+            'semestre': materia['semestre'],
+            'elejible': 'true' if materia['semestre'] in (99, 88) else 'false',
+        }
+    return peticion
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.db import models
+import json
+import zlib
+
+def codificar_json(valor)->bytes:
+    """
+        JSON canonico (UTF-8, sin espacios, en el orden de las claves) del valor, comprimido
+        con zlib si ocupa al menos HORARIO_COMPRESION_DESDE bytes
+    """
+    datos = json.dumps(valor, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    desde = getattr(settings, 'HORARIO_COMPRESION_DESDE', 0)
+    if desde and len(datos) >= desde:
+        return zlib.compress(datos)
+    return datos
+
+def decodificar_json(datos:bytes):
+    # Un flujo zlib empieza con 0x78 ('x'), que no puede ser el primer byte de un JSON
+    if datos[:1] == b'x':
+        datos = zlib.decompress(datos)
+    return json.loads(datos.decode('utf-8'))
+
+class JSONComprimido(models.BinaryField):
+    """
+        Guarda un valor serializable a JSON en una columna binaria, comprimida con zlib
+        cuando es grande. Se decodifica una sola vez al leer la fila, asi que el atributo
+        del modelo siempre tiene el objeto de Python (dict, list, ...).
+    """
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return decodificar_json(bytes(value))
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return decodificar_json(bytes(value))
+        if isinstance(value, str):
+            # Texto JSON, como el que escribe value_to_string para los fixtures
+            try:
+                return json.loads(value)
+            except ValueError:
+                return value
+        return value
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        return codificar_json(value)
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj), ensure_ascii=False)
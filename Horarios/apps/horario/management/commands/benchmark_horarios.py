@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.horario.benchmarks import escenarios as horario_escenarios
+import json
+
+class Command(BaseCommand):
+    """
+        Mide tiempo y pico de memoria del generador de horarios para cada carrera y tamaño
+        de entrada, y opcionalmente compara contra una linea base guardada.
+    """
+    help = 'Ejecuta los benchmarks del generador de horarios'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--escenarios', nargs='*', help='Escenarios a ejecutar: %s' % ', '.join(horario_escenarios.ESCENARIOS))
+        parser.add_argument('--carreras', nargs='*', help='Carreras reales a usar, por defecto todas')
+        parser.add_argument('--tamanios', nargs='*', type=int, help='Tamaños de entrada en vez de los de cada escenario')
+        parser.add_argument('--repeticiones', type=int, default=3, help='Ejecuciones por caso, se reporta la mas rapida')
+        parser.add_argument('--semilla', type=int, default=0)
+        parser.add_argument('--guardar', help='Archivo JSON donde guardar los resultados como nueva linea base')
+        parser.add_argument('--linea-base', help='Archivo JSON con la linea base contra la que comparar')
+        parser.add_argument('--tolerancia', type=float, default=0.25,
+            help='Fraccion mas lenta que la linea base que se acepta antes de fallar')
+
+    def handle(self, *args, **options):
+        linea_base = None
+        if options['linea_base']:
+            try:
+                with open(options['linea_base'], encoding='utf-8') as archivo:
+                    linea_base = json.load(archivo)
+            except (OSError, ValueError) as e:
+                raise CommandError('No se pudo leer la linea base: %s' % e)
+        self.stdout.write('%-30s %-15s %7s %11s %11s %10s' % ('escenario', 'carrera', 'tamaño', 'ms', 'pico KB', 'resultados'))
+        try:
+            filas = horario_escenarios.ejecutar(
+                options['escenarios'], options['carreras'], options['tamanios'],
+                options['repeticiones'], options['semilla'], progreso=self.escribir_fila
+            )
+        except ValueError as e:
+            raise CommandError(e)
+        if options['guardar']:
+            with open(options['guardar'], 'w', encoding='utf-8') as archivo:
+                json.dump(filas, archivo, indent=1)
+            self.stdout.write('Linea base guardada en %s' % options['guardar'])
+        if linea_base is None:
+            return
+        regresiones = []
+        for fila in horario_escenarios.comparar(filas, linea_base, options['tolerancia']):
+            if 'relacion' not in fila:
+                continue
+            self.stdout.write('%-30s %-15s %7d %10.2fx%s' % (
+                fila['escenario'], fila['carrera'], fila['tamanio'], fila['relacion'], '  REGRESION' if fila['regresion'] else ''))
+            if fila['regresion']:
+                regresiones.append(fila)
+        if regresiones:
+            raise CommandError('%d casos mas lentos que la linea base' % len(regresiones))
+
+    def escribir_fila(self, fila:dict):
+        self.stdout.write('%-30s %-15s %7d %11.2f %11.1f %10d' % (
+            fila['escenario'], fila['carrera'], fila['tamanio'], fila['segundos'] * 1000, fila['pico_kb'], fila['resultados']))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.horario import pensums as horario_pensums
+from apps.horario import validations as horario_validations
+import json
+import os
+
+class Command(BaseCommand):
+    """
+        Compila los archivos de datos de datos/pensums al formato precalculado de
+        datos/compilados que cargan los workers la primera vez que usan cada carrera.
+    """
+    help = 'Valida y compila los pensums de cada carrera'
+
+    def add_arguments(self, parser):
+        parser.add_argument('carreras', nargs='*', help='Carreras a compilar, por defecto todas')
+        parser.add_argument('--comprobar', action='store_true',
+            help='Solo comprueba que los artefactos existan y esten al dia con sus datos')
+
+    def handle(self, *args, **options):
+        carreras = options['carreras'] or horario_validations.CARRERAS
+        desactualizadas = []
+        for carrera in carreras:
+            try:
+                horario_validations.validate_carrera(carrera)
+                artefacto = horario_pensums.compilar_pensum(carrera)
+            except ValueError as e:
+                raise CommandError('%s: %s' % (carrera, e))
+            ruta = horario_pensums.ruta_artefacto(artefacto['carrera'])
+            if options['comprobar']:
+                try:
+                    with open(ruta, encoding='utf-8') as archivo:
+                        actual = json.load(archivo)
+                except FileNotFoundError:
+                    actual = None
+                if actual != artefacto:
+                    desactualizadas.append(artefacto['carrera'])
+                continue
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                json.dump(artefacto, archivo, ensure_ascii=False, separators=(',', ':'))
+            self.stdout.write('%s: %d materias compiladas' % (artefacto['carrera'], len(artefacto['materias']['codigo'])))
+        if desactualizadas:
+            raise CommandError('Pensums sin compilar o desactualizados: %s' % ', '.join(desactualizadas))
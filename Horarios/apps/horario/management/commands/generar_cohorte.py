@@ -0,0 +1,85 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.horario import medicion as horario_medicion
+from apps.horario import services as horario_services
+from apps.horario import validations as horario_validations
+import json
+import os
+import sys
+import time
+
+class Command(BaseCommand):
+    """
+        Genera las combinaciones de toda una cohorte de estudiantes de una vez. Los
+        resultados se escriben una linea JSON por estudiante a medida que se terminan y,
+        con --guardar, tambien se guardan por bloques como horarios particulares.
+    """
+    help = 'Genera los horarios de muchos estudiantes a partir de un archivo de peticiones'
+
+    def add_arguments(self, parser):
+        parser.add_argument('entrada',
+            help="Archivo JSON con la lista de {'estudiante','peticion'}, o .ndjson con uno por linea")
+        parser.add_argument('--salida', help="Archivo NDJSON de resultados; '-' o sin indicar es la salida estandar")
+        parser.add_argument('--guardar', action='store_true', help='Guarda cada resultado como horario particular')
+        parser.add_argument('--top-k', type=int, help='Mejores combinaciones por estudiante')
+        parser.add_argument('--procesos', type=int, default=os.cpu_count(), help='Procesos del pool, 0 o 1 genera en este proceso')
+        parser.add_argument('--formato', default='completo', help='completo o compacto')
+        parser.add_argument('--bloque', type=int, default=500, help='Resultados por insercion con --guardar')
+
+    def handle(self, *args, **options):
+        try:
+            compacto = horario_validations.validate_formato(options['formato']) == 'compacto'
+            estudiantes = self.leer_entrada(options['entrada'])
+            medicion = horario_medicion.Medicion()
+            lineas = horario_services.generar_cohorte(estudiantes, options['top_k'], options['procesos'], medicion)
+        except (OSError, ValueError) as e:
+            raise CommandError(e)
+        escribir = options['salida'] is not None or not options['guardar']
+        salida = sys.stdout if options['salida'] in (None, '-') else open(options['salida'], 'w', encoding='utf-8')
+        inicio = time.perf_counter()
+        self.ultimos_resultados = None
+        total = 0
+        errores = 0
+        guardados = 0
+        bloque = []
+        try:
+            for linea in lineas:
+                total += 1
+                if 'detail' in linea:
+                    errores += 1
+                if options['guardar']:
+                    bloque.append(linea)
+                    if len(bloque) >= options['bloque']:
+                        guardados += horario_services.guardar_resultados_cohorte(bloque)
+                        bloque = []
+                if escribir:
+                    salida.write(self.serializar(linea, compacto) + '\n')
+            if bloque:
+                guardados += horario_services.guardar_resultados_cohorte(bloque)
+        finally:
+            if salida is not sys.stdout:
+                salida.close()
+        self.stderr.write('%d estudiantes, %d perfiles distintos, %d desde la cache, %d con errores, %d guardados en %.2f s' % (
+            total, medicion.contadores.get('perfiles', 0), medicion.contadores.get('cache_aciertos', 0),
+            errores, guardados, time.perf_counter() - inicio))
+
+    def serializar(self, linea:dict, compacto:bool)->str:
+        # Los estudiantes de un mismo perfil llegan seguidos y comparten la lista de
+        # resultados, que se serializa una sola vez
+        if 'resultados' not in linea:
+            return self.a_json(linea)
+        if linea['resultados'] is not self.ultimos_resultados:
+            resultados = horario_services.compactar_resultados(linea['resultados']) if compacto else linea['resultados']
+            self.ultimos_resultados = linea['resultados']
+            self.ultimo_texto = self.a_json(resultados)
+        return '{"estudiante":%s,"carrera":%s,"resultados":%s}' % (
+            self.a_json(linea['estudiante']), self.a_json(linea['carrera']), self.ultimo_texto)
+
+    def a_json(self, valor)->str:
+        return json.dumps(valor, ensure_ascii=False, separators=(',', ':'))
+
+    def leer_entrada(self, ruta:str)->list:
+        with open(ruta, encoding='utf-8') as archivo:
+            if ruta.endswith('.ndjson'):
+                return [json.loads(linea) for linea in archivo if linea.strip()]
+            datos = json.load(archivo)
+        return datos.get('estudiantes') if isinstance(datos, dict) else datos
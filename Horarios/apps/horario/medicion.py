@@ -0,0 +1,60 @@
+import contextlib
+import time
+
+class Medicion():
+    """
+        Tiempos por fase y contadores de una generacion de horarios. Solo se crea cuando se
+        piden las metricas; sin una Medicion el generador no toma tiempos ni cuenta nada.
+
+        Las fases pueden anidarse: 'generacion' contiene a 'enumeracion', 'desbloqueo',
+        'puntuacion' y 'secciones', y 'busqueda' (top_k) contiene a 'secciones' y, cuando se
+        resuelve por lotes, tambien a 'desbloqueo' y 'puntuacion'.
+    """
+    fases:dict
+    contadores:dict
+
+    def __init__(self):
+        self.fases = {}
+        self.contadores = {}
+
+    def agregar(self, fase:str, segundos:float):
+        self.fases[fase] = self.fases.get(fase, 0.0) + segundos
+
+    def sumar(self, contador:str, cantidad:int=1):
+        self.contadores[contador] = self.contadores.get(contador, 0) + cantidad
+
+    @contextlib.contextmanager
+    def fase(self, nombre:str):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.agregar(nombre, time.perf_counter() - inicio)
+
+    def medir_iterador(self, fase:str, iterador):
+        """
+            Envuelve un iterador sumando a `fase` el tiempo que tarda en producir cada
+            elemento, sin contar lo que hace quien lo consume
+        """
+        iterador = iter(iterador)
+        while True:
+            inicio = time.perf_counter()
+            try:
+                elemento = next(iterador)
+            except StopIteration:
+                self.agregar(fase, time.perf_counter() - inicio)
+                return
+            self.agregar(fase, time.perf_counter() - inicio)
+            yield elemento
+
+    def server_timing(self)->str:
+        """
+            Valor del encabezado Server-Timing, una metrica por fase en milisegundos
+        """
+        return ', '.join('%s;dur=%.3f' % (fase, segundos * 1000) for fase, segundos in self.fases.items())
+
+    def como_dict(self)->dict:
+        return {
+            'fases_ms': {fase: round(segundos * 1000, 3) for fase, segundos in self.fases.items()},
+            'contadores': dict(self.contadores),
+        }
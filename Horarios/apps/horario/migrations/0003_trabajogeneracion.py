@@ -0,0 +1,26 @@
+# Generated by Django 2.2 on 2026-10-18 12:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('horario', '0002_horariogeneral_fecha'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrabajoGeneracion',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('estado', models.CharField(default='pendiente', max_length=15)),
+                ('peticion', models.TextField(blank=True)),
+                ('top_k', models.IntegerField(null=True)),
+                ('resultado', models.TextField(blank=True, null=True)),
+                ('detalle', models.TextField(blank=True, null=True)),
+                ('creado', models.DateTimeField(auto_now_add=True)),
+                ('actualizado', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
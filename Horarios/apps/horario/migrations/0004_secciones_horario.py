@@ -0,0 +1,82 @@
+# Generated by Django 2.2 on 2026-10-18 12:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from apps.horario import secciones as horario_secciones
+
+
+def poblar_secciones(apps, schema_editor):
+    """
+        Crea las secciones y reuniones de los horarios generales ya registrados a partir
+        de su campo horario; los horarios que no se pueden interpretar se dejan sin secciones.
+    """
+    HorarioGeneral = apps.get_model('horario', 'HorarioGeneral')
+    SeccionHorario = apps.get_model('horario', 'SeccionHorario')
+    ReunionSeccion = apps.get_model('horario', 'ReunionSeccion')
+    for horario_general in HorarioGeneral.objects.all():
+        try:
+            horarios = horario_secciones.interpretar_horario(horario_general.horario)
+            secciones = horario_secciones.compilar_secciones(horarios)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            continue
+        for por_codigo in secciones.values():
+            for seccion in por_codigo.values():
+                fila = SeccionHorario.objects.create(
+                    horario=horario_general,
+                    codigo=seccion.codigo,
+                    materia=seccion.reuniones[0].get('materia') or '',
+                    seccion=seccion.seccion,
+                )
+                ReunionSeccion.objects.bulk_create([
+                    ReunionSeccion(
+                        seccion=fila,
+                        dia=reunion['dia'],
+                        desde=reunion['desde'],
+                        hasta=reunion['hasta'],
+                        aula=reunion.get('aula') or '',
+                        profesor=reunion.get('profesor') or '',
+                    )
+                    for reunion in seccion.reuniones
+                ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('horario', '0003_trabajogeneracion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeccionHorario',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('codigo', models.CharField(max_length=20)),
+                ('materia', models.CharField(blank=True, max_length=150)),
+                ('seccion', models.CharField(max_length=10)),
+                ('horario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='secciones', to='horario.HorarioGeneral')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ReunionSeccion',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('dia', models.CharField(blank=True, max_length=10)),
+                ('desde', models.CharField(blank=True, max_length=10)),
+                ('hasta', models.CharField(blank=True, max_length=10)),
+                ('aula', models.CharField(blank=True, max_length=50)),
+                ('profesor', models.CharField(blank=True, max_length=150)),
+                ('seccion', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reuniones', to='horario.SeccionHorario')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='seccionhorario',
+            index=models.Index(fields=['horario', 'codigo'], name='seccion_horario_codigo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seccionhorario',
+            index=models.Index(fields=['horario', 'codigo', 'seccion'], name='seccion_horario_seccion_idx'),
+        ),
+        migrations.RunPython(poblar_secciones, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2 on 2026-10-18 12:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('horario', '0004_secciones_horario'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='horariogeneral',
+            name='version',
+            field=models.IntegerField(default=1),
+        ),
+    ]
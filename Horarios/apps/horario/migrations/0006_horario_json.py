@@ -0,0 +1,83 @@
+# Generated by Django 2.2 on 2026-10-18 12:48
+
+import apps.horario.campos
+from django.db import migrations, models
+import json
+
+from apps.horario import secciones as horario_secciones
+
+
+MODELOS = ('HorarioGeneral', 'HorarioParticular')
+
+
+def convertir_a_json(apps, schema_editor):
+    """
+        Pasa el texto de cada horario (JSON o la representacion de Python del diccionario)
+        a la nueva columna; lo que no se puede interpretar se conserva como texto.
+    """
+    for nombre in MODELOS:
+        modelo = apps.get_model('horario', nombre)
+        for fila in modelo.objects.only('id', 'horario').iterator():
+            try:
+                fila.horario_json = horario_secciones.interpretar_horario(fila.horario)
+            except ValueError:
+                fila.horario_json = fila.horario
+            fila.save(update_fields=['horario_json'])
+
+
+def convertir_a_texto(apps, schema_editor):
+    for nombre in MODELOS:
+        modelo = apps.get_model('horario', nombre)
+        for fila in modelo.objects.only('id', 'horario_json').iterator():
+            valor = fila.horario_json
+            fila.horario = valor if isinstance(valor, str) else json.dumps(valor, ensure_ascii=False)
+            fila.save(update_fields=['horario'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('horario', '0005_horariogeneral_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='horariogeneral',
+            name='horario_json',
+            field=apps.horario.campos.JSONComprimido(null=True),
+        ),
+        migrations.AddField(
+            model_name='horarioparticular',
+            name='horario_json',
+            field=apps.horario.campos.JSONComprimido(null=True),
+        ),
+        migrations.RunPython(convertir_a_json, convertir_a_texto),
+        migrations.RemoveField(
+            model_name='horariogeneral',
+            name='horario',
+        ),
+        migrations.RemoveField(
+            model_name='horarioparticular',
+            name='horario',
+        ),
+        migrations.RenameField(
+            model_name='horariogeneral',
+            old_name='horario_json',
+            new_name='horario',
+        ),
+        migrations.RenameField(
+            model_name='horarioparticular',
+            old_name='horario_json',
+            new_name='horario',
+        ),
+        migrations.AlterField(
+            model_name='horariogeneral',
+            name='horario',
+            field=apps.horario.campos.JSONComprimido(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='horarioparticular',
+            name='horario',
+            field=apps.horario.campos.JSONComprimido(blank=True, default=dict),
+        ),
+    ]
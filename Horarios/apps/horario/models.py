@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.horario import campos as horario_campos
+
 """
 	Horarios general de cada carrera por semestre, contiene el horario de cada materia,
 	en sus diferentes secciones .
@@ -8,7 +10,8 @@ class HorarioGeneral(models.Model):
     id 			= models.AutoField(primary_key=True) 
     carrera     = models.CharField(max_length=30,null=True)
     fecha       = models.DateTimeField(auto_now=False, auto_now_add=False,null=True,blank=True)
-    horario    	= models.TextField(null=False, blank=True)
+    horario    	= horario_campos.JSONComprimido(default=dict, blank=True)
+    version     = models.IntegerField(default=1)
     def __str__(self):
         return self.carrera
 
@@ -19,9 +22,67 @@ class HorarioGeneral(models.Model):
 class HorarioParticular(models.Model):
 
     id 			= models.AutoField(primary_key=True)
-    horario     = models.TextField(null=False, blank=True)
+    horario     = horario_campos.JSONComprimido(default=dict, blank=True)
     puntuacion  = models.IntegerField(null=True)
     creditos    = models.IntegerField(null=True)
     carrera     = models.CharField(max_length=30,null=True)
     def __str__(self):
-        return self.id
\ No newline at end of file
+        return self.id
+
+
+"""
+	Trabajo asincrono de generacion de horarios particulares, guarda la peticion,
+	el estado del trabajo y su resultado.
+"""
+class TrabajoGeneracion(models.Model):
+    PENDIENTE   = 'pendiente'
+    PROCESANDO  = 'procesando'
+    TERMINADO   = 'terminado'
+    ERROR       = 'error'
+
+    id 			= models.AutoField(primary_key=True)
+    estado      = models.CharField(max_length=15, default=PENDIENTE)
+    peticion    = models.TextField(null=False, blank=True)
+    top_k       = models.IntegerField(null=True)
+    resultado   = models.TextField(null=True, blank=True)
+    detalle     = models.TextField(null=True, blank=True)
+    creado      = models.DateTimeField(auto_now_add=True)
+    actualizado = models.DateTimeField(auto_now=True)
+    def __str__(self):
+        return str(self.id)
+
+
+"""
+	Seccion de una materia dentro de un horario general, con sus reuniones en
+	ReunionSeccion. Se llenan a partir del campo horario al registrar o editar.
+"""
+class SeccionHorario(models.Model):
+    id 			= models.AutoField(primary_key=True)
+    horario     = models.ForeignKey(HorarioGeneral, on_delete=models.CASCADE, related_name='secciones')
+    codigo      = models.CharField(max_length=20)
+    materia     = models.CharField(max_length=150, blank=True)
+    seccion     = models.CharField(max_length=10)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['horario', 'codigo'], name='seccion_horario_codigo_idx'),
+            models.Index(fields=['horario', 'codigo', 'seccion'], name='seccion_horario_seccion_idx'),
+        ]
+
+    def __str__(self):
+        return '%s-%s' % (self.codigo, self.seccion)
+
+
+"""
+	Reunion semanal de una seccion: dia, bloque horario, aula y profesor.
+"""
+class ReunionSeccion(models.Model):
+    id 			= models.AutoField(primary_key=True)
+    seccion     = models.ForeignKey(SeccionHorario, on_delete=models.CASCADE, related_name='reuniones')
+    dia         = models.CharField(max_length=10, blank=True)
+    desde       = models.CharField(max_length=10, blank=True)
+    hasta       = models.CharField(max_length=10, blank=True)
+    aula        = models.CharField(max_length=50, blank=True)
+    profesor    = models.CharField(max_length=150, blank=True)
+    def __str__(self):
+        return '%s %s-%s' % (self.dia, self.desde, self.hasta)
@@ -0,0 +1,367 @@
+from apps.horario import validations as horario_validations
+from types import MappingProxyType
+import hashlib
+import json
+import os
+import threading
+import numpy
+
+DIRECTORIO_COMPILADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datos', 'compilados')
+VERSION_ARTEFACTO = 1
+
+""" -------------------------- Registro de pensums -----------------------"""
+
+pensums_compilados:dict = {}
+candado_pensums = threading.Lock()
+
+def obtener_pensum(carrera:str)->tuple:
+	"""
+		Devuelve el pensum de la carrera desde el registro del proceso. Se carga una
+		sola vez por carrera y se comparte en solo lectura: cada materia es un
+		MappingProxyType sin los campos 'aprobada' y 'elejida', porque el estado de cada
+		evaluacion vive en mascaras de bits sobre las posiciones de esta tupla.
+
+		:parametro carrera: nombre de la carrera
+		:tipo de parametro carrera: str
+		:return: tupla de materias de solo lectura
+		:raises: ValueError
+	"""
+	return obtener_pensum_compilado(carrera).materias
+
+def obtener_pensum_compilado(carrera:str):
+	"""
+		Devuelve el pensum compilado de la carrera, cargando su artefacto solo la primera
+		vez que se pide en el proceso.
+
+		:parametro carrera: nombre de la carrera
+		:tipo de parametro carrera: str
+		:return: PensumCompilado
+		:raises: ValueError
+	"""
+	carrera = carrera.lower()
+	pensum = pensums_compilados.get(carrera)
+	if pensum is None:
+		with candado_pensums:
+			pensum = pensums_compilados.get(carrera)
+			if pensum is None:
+				pensum = PensumCompilado(cargar_artefacto(carrera))
+				pensums_compilados[carrera] = pensum
+	return pensum
+
+def registrar_pensum(carrera:str, materias:list)->'PensumCompilado':
+	"""
+		Compila y registra en el proceso un pensum que no viene de datos/pensums, como los
+		pensums sinteticos de los benchmarks. Las peticiones con esa carrera lo usan igual
+		que a los pensums reales.
+
+		:parametro carrera: nombre con el que se registra
+		:tipo de parametro carrera: str
+		:parametro materias: materias con el esquema de datos/pensums
+		:tipo de parametro materias: list
+		:return: PensumCompilado
+		:raises: ValueError
+	"""
+	carrera = carrera.lower()
+	horario_validations.validate_esquema_pensum(materias)
+	origen = hashlib.sha256(json.dumps(materias, sort_keys=True).encode('utf-8')).hexdigest()
+	pensum = PensumCompilado(compilar_materias(carrera, materias, origen))
+	with candado_pensums:
+		pensums_compilados[carrera] = pensum
+	return pensum
+
+def ruta_artefacto(carrera:str)->str:
+	return os.path.join(DIRECTORIO_COMPILADOS, carrera + '.json')
+
+def cargar_artefacto(carrera:str)->dict:
+	"""
+		Lee el artefacto compilado de una carrera.
+
+		:raises: ValueError
+	"""
+	carrera = carrera.lower()
+	if carrera not in horario_validations.CARRERAS:
+		raise ValueError(str("El campo 'carrera' no tiene el valor apropiado"))
+	try:
+		with open(ruta_artefacto(carrera), encoding='utf-8') as archivo:
+			artefacto = json.load(archivo)
+	except FileNotFoundError:
+		raise ValueError(str("El pensum de '%s' no esta compilado, ejecute 'python manage.py compilar_pensums'" % carrera))
+	if artefacto.get('version') != VERSION_ARTEFACTO:
+		raise ValueError(str("El pensum compilado de '%s' es de otra version, ejecute 'python manage.py compilar_pensums'" % carrera))
+	return artefacto
+
+def huella_origen(carrera:str)->str:
+	"""
+		Huella del archivo de datos de la carrera, para saber si su artefacto esta al dia.
+	"""
+	with open(os.path.join(horario_validations.DIRECTORIO_PENSUMS, carrera + '.json'), 'rb') as archivo:
+		return hashlib.sha256(archivo.read()).hexdigest()
+
+def compilar_pensum(carrera:str)->dict:
+	"""
+		Paso de construccion: valida contra el esquema el archivo de datos de la carrera y
+		precalcula el indice de prerrequisitos que usa PensumCompilado.
+
+		:parametro carrera: nombre de la carrera
+		:tipo de parametro carrera: str
+		:return: artefacto listo para guardarse como JSON
+		:raises: ValueError
+	"""
+	carrera = carrera.lower()
+	materias = horario_validations.validate_pensum(carrera)
+	horario_validations.validate_esquema_pensum(materias)
+	return compilar_materias(carrera, materias, huella_origen(carrera))
+
+def compilar_materias(carrera:str, materias:list, origen:str)->dict:
+	"""
+		Precalcula el indice de prerrequisitos de una lista de materias ya validada.
+
+		:parametro carrera: nombre con el que se registra el pensum
+		:tipo de parametro carrera: str
+		:parametro materias: materias del pensum
+		:tipo de parametro materias: list
+		:parametro origen: huella de los datos de los que salen las materias
+		:tipo de parametro origen: str
+		:return: artefacto listo para guardarse como JSON
+	"""
+	codigos = {}
+	for materia in materias:
+		for codigo in (materia['codigo'], materia['presedentes']['p1'], materia['presedentes']['p2']):
+			if codigo != '' and codigo not in codigos:
+				codigos[codigo] = len(codigos)
+	hijos_simples = [0] * len(codigos)
+	pares = [[] for _ in range(len(codigos))]
+	mascara_electivas = 0
+	for indice, materia in enumerate(materias):
+		bit = 1 << indice
+		if materia['semestre'] == 99 or materia['semestre'] == 88:
+			mascara_electivas |= bit
+		p1 = materia['presedentes']['p1']
+		p2 = materia['presedentes']['p2']
+		if p1 == '':
+			continue
+		if p2 == '':
+			hijos_simples[codigos[p1]] |= bit
+		else:
+			requisito = (1 << codigos[p1]) | (1 << codigos[p2])
+			pares[codigos[p1]].append([requisito, bit])
+			if p2 != p1:
+				pares[codigos[p2]].append([requisito, bit])
+	return {
+		'version': VERSION_ARTEFACTO,
+		'carrera': carrera,
+		'origen': origen,
+		'materias': {
+			'codigo': [materia['codigo'] for materia in materias],
+			'materia': [materia['materia'] for materia in materias],
+			'creditos': [materia['creditos'] for materia in materias],
+			'semestre': [materia['semestre'] for materia in materias],
+			'p1': [materia['presedentes']['p1'] for materia in materias],
+			'p2': [materia['presedentes']['p2'] for materia in materias],
+		},
+		'codigos': list(codigos),
+		'hijos_simples': hijos_simples,
+		'pares': pares,
+		'codigo_materia': [codigos[materia['codigo']] for materia in materias],
+		'mascara_electivas': mascara_electivas,
+	}
+
+def congelar_materias(columnas:dict)->tuple:
+	materias = []
+	for i in range(len(columnas['codigo'])):
+		materias.append(MappingProxyType({
+			'codigo': columnas['codigo'][i],
+			'materia': columnas['materia'][i],
+			'creditos': columnas['creditos'][i],
+			'semestre': columnas['semestre'][i],
+			'presedentes': MappingProxyType({'p1': columnas['p1'][i], 'p2': columnas['p2'][i]}),
+		}))
+	return tuple(materias)
+
+""" -------------------------- Pensum compilado -----------------------"""
+
+def bits(mascara:int):
+	"""
+		Posiciones de los bits encendidos de la mascara, de menor a mayor.
+	"""
+	while mascara:
+		bit = mascara & -mascara
+		yield bit.bit_length() - 1
+		mascara ^= bit
+
+def contar_bits(mascara:int)->int:
+	return bin(mascara).count('1')
+
+class PensumCompilado():
+	"""
+		Grafo de prerrequisitos de un pensum compilado a mascaras de bits, construido a
+		partir del artefacto que genera `compilar_pensum`.
+
+		Cada codigo que aparece en el pensum (como materia o como precedente) tiene un bit
+		en el espacio de codigos y cada materia del pensum un bit en el espacio de materias.
+		Se guardan:
+		- hijos_simples[c]: materias cuyo unico precedente es el codigo c.
+		- pares[c]: (requisito, materia) de las materias con dos precedentes en las que
+		  participa el codigo c; requisito es la mascara con los dos codigos.
+		- codigo_materia[i]: bit de codigo de la materia i.
+		- mascara_electivas: materias de semestre 99 u 88, que valen la mitad al contar.
+	"""
+	carrera:str
+	origen:str
+	materias:tuple
+	bit_codigo:dict
+	hijos_simples:list
+	pares:list
+	codigo_materia:list
+	mascara_electivas:int
+
+	def __init__(self, artefacto:dict):
+		self.carrera = artefacto['carrera']
+		self.origen = artefacto['origen']
+		self.materias = congelar_materias(artefacto['materias'])
+		self.bit_codigo = {codigo: bit for bit, codigo in enumerate(artefacto['codigos'])}
+		self.hijos_simples = artefacto['hijos_simples']
+		self.pares = [[tuple(par) for par in pares] for pares in artefacto['pares']]
+		self.codigo_materia = [1 << bit for bit in artefacto['codigo_materia']]
+		self.mascara_electivas = artefacto['mascara_electivas']
+		self.matrices = None
+
+	def mascara_codigos(self, codigos)->int:
+		"""
+			Mascara de codigos de una lista de codigos; los que no estan en el pensum
+			no pueden desbloquear nada y se ignoran.
+		"""
+		mascara = 0
+		for codigo in codigos:
+			bit = self.bit_codigo.get(codigo)
+			if bit is not None:
+				mascara |= 1 << bit
+		return mascara
+
+	def codigos_de_materias(self, mascara_materias:int)->int:
+		mascara = 0
+		for i in bits(mascara_materias):
+			mascara |= self.codigo_materia[i]
+		return mascara
+
+	def candidatas(self, oleada:int, alcanzados:int)->int:
+		"""
+			Materias que desbloquea una oleada de codigos: las de precedente unico en la
+			oleada y las de dos precedentes contenidos en `alcanzados`.
+		"""
+		nuevas = 0
+		for c in bits(oleada):
+			nuevas |= self.hijos_simples[c]
+			for requisito, materia in self.pares[c]:
+				if alcanzados & requisito == requisito:
+					nuevas |= materia
+		return nuevas
+
+	def desbloqueadas(self, mascara_codigos:int, medicion=None)->int:
+		"""
+			Materias que se desbloquean por oleadas a partir de los codigos de una combinacion.
+			Igual que el recorrido original, cada oleada parte solo de las materias recien
+			desbloqueadas y una materia con dos precedentes exige que ambos esten en la misma
+			oleada.
+
+			:parametro medicion: si se indica, cuenta las oleadas en 'oleadas_desbloqueo'
+			:return: mascara de materias del pensum
+		"""
+		oleada = mascara_codigos
+		marcadas = 0
+		while oleada:
+			if medicion is not None:
+				medicion.sumar('oleadas_desbloqueo')
+			nuevas = self.candidatas(oleada, oleada) & ~marcadas
+			if not nuevas:
+				break
+			marcadas |= nuevas
+			oleada = self.codigos_de_materias(nuevas)
+		return marcadas
+
+	def cierre(self, mascara_codigos:int)->int:
+		"""
+			Cierre de prerrequisitos sin exigir que los dos precedentes esten en la misma
+			oleada. Contiene a `desbloqueadas` de cualquier subconjunto de los codigos, por lo
+			que sirve como cota superior.
+
+			:return: mascara de materias del pensum
+		"""
+		alcanzados = mascara_codigos
+		frontera = mascara_codigos
+		marcadas = 0
+		while frontera:
+			nuevas = self.candidatas(frontera, alcanzados) & ~marcadas
+			marcadas |= nuevas
+			codigos = self.codigos_de_materias(nuevas)
+			frontera = codigos & ~alcanzados
+			alcanzados |= codigos
+		return marcadas
+
+	def peso(self, mascara_materias:int)->float:
+		"""
+			Cantidad de materias de la mascara, las electivas cuentan como media materia.
+		"""
+		electivas = contar_bits(mascara_materias & self.mascara_electivas)
+		return (contar_bits(mascara_materias) - electivas) + (electivas/2)
+
+	def materializar(self, mascara_materias:int)->list:
+		return [self.materias[i] for i in bits(mascara_materias)]
+
+	def obtener_matrices(self)->dict:
+		"""
+			Version matricial del grafo para desbloquear lotes de combinaciones con NumPy:
+			- hijos: (codigos x materias) 1 si la materia tiene ese codigo como precedente unico.
+			- par_p1, par_p2, par_materia: codigos y posicion de las materias con dos precedentes.
+			- codigo: (materias x codigos) 1 en el codigo de cada materia.
+			- pesos: 1 por materia y 0.5 por electiva.
+		"""
+		if self.matrices is None:
+			total_codigos = len(self.bit_codigo)
+			total_materias = len(self.materias)
+			hijos = numpy.zeros((total_codigos, total_materias), dtype=numpy.float32)
+			for c, mascara in enumerate(self.hijos_simples):
+				for i in bits(mascara):
+					hijos[c, i] = 1
+			pares = {}
+			for pares_codigo in self.pares:
+				for requisito, materia in pares_codigo:
+					codigos = list(bits(requisito))
+					pares[materia] = (codigos[0], codigos[-1])
+			codigo = numpy.zeros((total_materias, total_codigos), dtype=numpy.float32)
+			for i, mascara in enumerate(self.codigo_materia):
+				codigo[i, mascara.bit_length() - 1] = 1
+			pesos = numpy.ones(total_materias)
+			for i in bits(self.mascara_electivas):
+				pesos[i] = 0.5
+			materias_pares = sorted(pares)
+			self.matrices = {
+				'hijos': hijos,
+				'par_p1': numpy.array([pares[m][0] for m in materias_pares], dtype=numpy.intp),
+				'par_p2': numpy.array([pares[m][1] for m in materias_pares], dtype=numpy.intp),
+				'par_materia': numpy.array([m.bit_length() - 1 for m in materias_pares], dtype=numpy.intp),
+				'codigo': codigo,
+				'pesos': pesos,
+			}
+		return self.matrices
+
+	def desbloqueadas_lote(self, oleadas:numpy.ndarray, medicion=None)->numpy.ndarray:
+		"""
+			`desbloqueadas` para un lote: recibe una matriz booleana (combinaciones x codigos)
+			con los codigos de cada combinacion y devuelve otra (combinaciones x materias) con
+			las materias desbloqueadas, aplicando las oleadas a todas las filas a la vez.
+		"""
+		matrices = self.obtener_matrices()
+		marcadas = numpy.zeros((oleadas.shape[0], len(self.materias)), dtype=bool)
+		while oleadas.any():
+			if medicion is not None:
+				medicion.sumar('oleadas_desbloqueo')
+			nuevas = (oleadas.astype(numpy.float32) @ matrices['hijos']) > 0
+			if len(matrices['par_materia']):
+				nuevas[:, matrices['par_materia']] |= oleadas[:, matrices['par_p1']] & oleadas[:, matrices['par_p2']]
+			nuevas &= ~marcadas
+			if not nuevas.any():
+				break
+			marcadas |= nuevas
+			oleadas = (nuevas.astype(numpy.float32) @ matrices['codigo']) > 0
+		return marcadas
@@ -0,0 +1,26 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+class NDJSONRenderer(BaseRenderer):
+    """
+        JSON delimitado por saltos de linea: un documento JSON por linea. Permite que un
+        cliente pida `Accept: application/x-ndjson`; las vistas que generan en flujo
+        escriben las lineas con `lineas` y las respuestas normales (los errores, por
+        ejemplo) se renderizan aqui, una linea por elemento si son una lista.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return b''.join(self.lineas(data if isinstance(data, list) else [data]))
+
+    def lineas(self, elementos):
+        """
+            Genera una linea por elemento a medida que el iterador los produce
+        """
+        json_renderer = JSONRenderer()
+        for elemento in elementos:
+            yield json_renderer.render(elemento) + b'\n'
@@ -0,0 +1,253 @@
+"""
+	Representacion compilada de las secciones de un horario general.
+
+	La semana se divide en 5 dias de 34 bloques; cada seccion se compila una sola vez a
+	una mascara de bits con el bloque `bloque` del dia `dia` en el bit
+	dia * BLOQUES_POR_DIA + bloque. Dos secciones chocan si sus mascaras se intersectan.
+"""
+from apps.horario import pensums as horario_pensums
+import ast
+import json
+import numpy
+
+DIAS_SEMANA = 5
+BLOQUES_POR_DIA = 34
+
+# Cualquier otro dia cae en el viernes, igual que en la conversion original
+DIAS = {'Lun': 0, 'Mar': 1, 'Mie': 2, 'Jue': 3}
+
+# Cualquier otra hora cae en el ultimo bloque del dia
+HORAS = (
+	'07:00', '07:50', '08:35', '08:40', '09:25', '09:30', '10:15', '10:20', '11:05',
+	'11:10', '11:55', '12:00', '12:45', '12:50', '13:35', '13:40', '14:00', '14:25',
+	'14:35', '14:45', '14:50', '15:15', '15:20', '15:35', '15:40', '16:05', '16:25',
+	'16:30', '16:55', '17:15', '17:20', '18:05', '18:55',
+)
+INDICE_HORA = {hora: indice for indice, hora in enumerate(HORAS)}
+
+def indice_dia(dia:str)->int:
+	return DIAS.get(dia, DIAS_SEMANA - 1)
+
+def indice_hora(hora:str)->int:
+	return INDICE_HORA.get(hora, BLOQUES_POR_DIA - 1)
+
+def mascara_reunion(reunion:dict)->int:
+	"""
+		Bloques que ocupa una reunion, de `desde` a `hasta` inclusive
+	"""
+	desde = indice_hora(reunion['desde'])
+	hasta = indice_hora(reunion['hasta'])
+	if hasta < desde:
+		return 0
+	bloques = (1 << (hasta - desde + 1)) - 1
+	return bloques << (indice_dia(reunion['dia']) * BLOQUES_POR_DIA + desde)
+
+def interpretar_horario(horario)->dict:
+	"""
+		Devuelve las entradas de un horario general. Acepta el objeto ya decodificado, su
+		JSON o el texto que guardaba el campo horario (la representacion del diccionario
+		de Python, con comillas simples).
+
+		:raises: ValueError
+	"""
+	if isinstance(horario, dict):
+		return horario
+	if isinstance(horario, str):
+		try:
+			return json.loads(horario)
+		except ValueError:
+			pass
+		try:
+			return ast.literal_eval(horario)
+		except (ValueError, SyntaxError):
+			pass
+	raise ValueError(str("El horario no tiene un formato valido"))
+
+class Seccion():
+	"""
+		Una seccion de una materia con sus reuniones y la mascara de bloques que ocupan
+	"""
+	__slots__ = ('codigo', 'seccion', 'mascara', 'reuniones')
+
+	def __init__(self, codigo:str, seccion:str):
+		self.codigo = codigo
+		self.seccion = seccion
+		self.mascara = 0
+		self.reuniones = []
+
+	def agregar_reunion(self, reunion:dict):
+		self.mascara |= mascara_reunion(reunion)
+		self.reuniones.append(reunion)
+
+	def choca_con(self, otra:'Seccion')->bool:
+		return (self.mascara & otra.mascara) != 0
+
+def compilar_secciones(horarios:dict)->dict:
+	"""
+		Agrupa las entradas de un horario general por codigo y seccion
+
+		:parametro horarios: entradas del horario general
+		:tipo de parametro horarios: dict
+		:return: diccionario codigo -> seccion -> Seccion
+	"""
+	secciones = {}
+	for reunion in horarios.values():
+		por_codigo = secciones.setdefault(reunion['codigo'], {})
+		seccion = por_codigo.get(reunion['seccion'])
+		if seccion is None:
+			seccion = por_codigo[reunion['seccion']] = Seccion(reunion['codigo'], reunion['seccion'])
+		seccion.agregar_reunion(reunion)
+	return secciones
+
+class MatrizChoques():
+	"""
+		Choques entre cada par de secciones de materias distintas de un horario general,
+		calculados una sola vez.
+
+		Las secciones se numeran en el orden de `secciones` y se guardan:
+		- choques: matriz booleana de NumPy, choques[i, j] si las secciones i y j son de
+		  materias distintas y sus reuniones se solapan.
+		- compatibles[i]: mascara de bits con las secciones de otras materias que no chocan
+		  con i; lo compatible con todo lo ya elegido es la interseccion de sus filas.
+		- mascara_materia[codigo]: mascara de bits con las secciones de la materia.
+		- alcanzables[codigo]: union de las filas compatibles de las secciones de la materia.
+	"""
+	secciones:dict
+	lista:list
+	indice:dict
+	mascara_materia:dict
+	choques:numpy.ndarray
+	compatibles:list
+	alcanzables:dict
+
+	def __init__(self, secciones:dict):
+		self.secciones = secciones
+		self.lista = [seccion for por_codigo in secciones.values() for seccion in por_codigo.values()]
+		self.indice = {(seccion.codigo, seccion.seccion): i for i, seccion in enumerate(self.lista)}
+		self.mascara_materia = {}
+		for i, seccion in enumerate(self.lista):
+			self.mascara_materia[seccion.codigo] = self.mascara_materia.get(seccion.codigo, 0) | (1 << i)
+		posicion = {codigo: i for i, codigo in enumerate(secciones)}
+		materias = numpy.array([posicion[seccion.codigo] for seccion in self.lista], dtype=numpy.int32)
+		bloques_dia = (1 << BLOQUES_POR_DIA) - 1
+		dias = numpy.array(
+			[[(seccion.mascara >> (dia * BLOQUES_POR_DIA)) & bloques_dia for dia in range(DIAS_SEMANA)] for seccion in self.lista],
+			dtype=numpy.uint64
+		).reshape(len(self.lista), DIAS_SEMANA)
+		self.choques = numpy.zeros((len(self.lista), len(self.lista)), dtype=bool)
+		for dia in range(DIAS_SEMANA):
+			self.choques |= (dias[:, None, dia] & dias[None, :, dia]) != 0
+		distinta_materia = materias[:, None] != materias[None, :]
+		self.choques &= distinta_materia
+		compatibles = numpy.packbits(distinta_materia & ~self.choques, axis=1, bitorder='little')
+		self.compatibles = [int.from_bytes(fila.tobytes(), 'little') for fila in compatibles]
+		self.alcanzables = {}
+		for i, seccion in enumerate(self.lista):
+			self.alcanzables[seccion.codigo] = self.alcanzables.get(seccion.codigo, 0) | self.compatibles[i]
+
+	def materias_compatibles(self, codigo:str, otro:str)->bool:
+		"""
+			Si alguna seccion de `codigo` no choca con alguna seccion de `otro`
+		"""
+		return (self.alcanzables.get(codigo, 0) & self.mascara_materia.get(otro, 0)) != 0
+
+	def restringir(self, codigos:list)->'MatrizChoques':
+		"""
+			Matriz con solo las secciones de las materias indicadas
+		"""
+		return MatrizChoques({codigo: self.secciones[codigo] for codigo in codigos if codigo in self.secciones})
+
+	def chocan(self, primera:Seccion, segunda:Seccion)->bool:
+		return bool(self.choques[self.indice[(primera.codigo, primera.seccion)], self.indice[(segunda.codigo, segunda.seccion)]])
+
+	def asignaciones(self, codigos:list):
+		"""
+			Genera las asignaciones de secciones sin choques, una seccion por materia.
+
+			Busqueda en profundidad que coloca primero las materias con menos secciones.
+			Las candidatas se mantienen como la interseccion de las filas compatibles de las
+			secciones ya elegidas, y una rama se abandona en cuanto alguna materia pendiente
+			se queda sin candidatas.
+
+			:parametro codigos: codigos de las materias
+			:tipo de parametro codigos: list
+			:return: generador de tuplas de Seccion en el mismo orden que codigos
+		"""
+		dominios = [self.mascara_materia.get(codigo, 0) for codigo in codigos]
+		if any(dominio == 0 for dominio in dominios):
+			return
+		orden = sorted(range(len(dominios)), key=lambda indice: horario_pensums.contar_bits(dominios[indice]))
+		elegidas = [None] * len(dominios)
+		todas = 0
+		for dominio in dominios:
+			todas |= dominio
+
+		def ramificar(nivel:int, candidatas:int):
+			if nivel == len(orden):
+				yield tuple(elegidas)
+				return
+			indice = orden[nivel]
+			for bit in horario_pensums.bits(candidatas & dominios[indice]):
+				siguientes = candidatas & self.compatibles[bit]
+				if all(siguientes & dominios[pendiente] for pendiente in orden[nivel + 1:]):
+					elegidas[indice] = self.lista[bit]
+					yield from ramificar(nivel + 1, siguientes)
+
+		yield from ramificar(0, todas)
+
+	def filtrar_lote(self, asignaciones:numpy.ndarray)->numpy.ndarray:
+		"""
+			Filtra en una sola pasada vectorizada un lote de asignaciones candidatas
+
+			:parametro asignaciones: matriz (candidatas, materias) con los indices de las secciones
+			:tipo de parametro asignaciones: numpy.ndarray
+			:return: vector booleano con las asignaciones que no tienen choques
+		"""
+		validas = numpy.ones(len(asignaciones), dtype=bool)
+		for primera in range(asignaciones.shape[1]):
+			for segunda in range(primera + 1, asignaciones.shape[1]):
+				validas &= ~self.choques[asignaciones[:, primera], asignaciones[:, segunda]]
+		return validas
+
+def bloque_vacio()->dict:
+	return {
+		'estado': False,
+		'materia': '',
+		'codigo': '',
+		'creditos': '',
+		'seccion': '',
+		'dia': '',
+		'desde': '',
+		'hasta': '',
+		'aula': '',
+		'profesor': '',
+	}
+
+def construir_cuadricula(asignacion:list)->list:
+	"""
+		Cuadricula detallada de 5 dias por 34 bloques de un horario ya comprobado. Solo se
+		arma para los horarios que se devuelven.
+
+		:parametro asignacion: pares (creditos, Seccion) sin choques entre si
+		:tipo de parametro asignacion: list
+		:return: lista de 5 dias con 34 bloques cada uno
+	"""
+	cuadricula = [[bloque_vacio() for _ in range(BLOQUES_POR_DIA)] for _ in range(DIAS_SEMANA)]
+	# materia, aula y profesor son opcionales en el horario general, igual que al guardarlo
+	for creditos, seccion in asignacion:
+		for reunion in seccion.reuniones:
+			dia = indice_dia(reunion['dia'])
+			for bloque in range(indice_hora(reunion['desde']), indice_hora(reunion['hasta']) + 1):
+				cuadricula[dia][bloque] = {
+					'estado': True,
+					'materia': reunion.get('materia') or '',
+					'codigo': reunion['codigo'],
+					'creditos': creditos,
+					'seccion': reunion['seccion'],
+					'dia': reunion['dia'],
+					'desde': reunion['desde'],
+					'hasta': reunion['hasta'],
+					'aula': reunion.get('aula') or '',
+					'profesor': reunion.get('profesor') or '',
+				}
+	return cuadricula
@@ -1,13 +1,34 @@
 import serpy
+import json
+
+def horario_como_texto(horario)->str:
+    """
+        El modelo guarda el horario decodificado, pero la API lo sigue entregando como texto
+        JSON, igual que cuando la columna era de texto
+    """
+    if isinstance(horario, str):
+        return horario
+    return json.dumps(horario, ensure_ascii=False)
 
 class HorarioParticular(serpy.Serializer):
     id 		= serpy.Field()
-    horario = serpy.Field()
+    horario = serpy.MethodField()
+
+    def get_horario(self, obj)->str:
+        return horario_como_texto(obj.horario)
 		
 class HorarioGeneral(serpy.Serializer):
 	id 		= serpy.Field()
 	carrera = serpy.Field()
-	horario = serpy.Field()
+	horario = serpy.MethodField()
 	fecha 	= serpy.Field()
 
-		
\ No newline at end of file
+	def get_horario(self, obj)->str:
+		return horario_como_texto(obj.horario)
+
+class TrabajoGeneracion(serpy.Serializer):
+	id 			= serpy.Field()
+	estado 		= serpy.Field()
+	detalle 	= serpy.Field()
+	creado 		= serpy.Field()
+	actualizado = serpy.Field()
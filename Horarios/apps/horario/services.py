@@ -1,8 +1,25 @@
 from apps.horario import models as horario_models
-from apps.horario import serializers as horario_serializers
 from django.db import transaction
+from django.db.models import F, Q
+from django.conf import settings
+from django.core.cache import caches
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor
 from apps.horario import validations as horario_validations
+from apps.horario import pensums as horario_pensums
+from apps.horario import secciones as horario_secciones
+from apps.horario import medicion as horario_medicion
+import hashlib
+import heapq
+import itertools
 import json
+import numpy
+import threading
+import time
+import uuid
+
+TAMANIO_LOTE = 4096
+MAXIMO_TOP_K_LOTES = 20000000
 
 def registrar_horario_del_semestre(data:dict)->horario_models.HorarioGeneral:
     """
@@ -25,17 +42,180 @@ def registrar_horario_del_semestre(data:dict)->horario_models.HorarioGeneral:
         horario_validations.validate_fecha(data.get('fecha'))
     else:
         raise ValueError(str("Debe de indicar para que semestre es el horario por medio de la fecha"))
+    if data.get('horario') is not None:
+        horarios = horario_secciones.interpretar_horario(data.get('horario'))
+        horario_validations.validate_horario_general(horarios)
+    else:
+        raise ValueError(str("Debe de indicar las secciones del horario"))
     with transaction.atomic():
         try:
             nuevo_horario = horario_models.HorarioGeneral.objects.create(
                 carrera = data.get('carrera').lower(),
-                horario = data.get('horario'),
+                horario = horarios,
                 fecha   = data.get('fecha')
             )
+            guardar_secciones_horario(nuevo_horario, horarios)
         except Exception as e:
             raise ValueError(e)
     return nuevo_horario
 
+def guardar_secciones_horario(horario_general:horario_models.HorarioGeneral, horarios:dict):
+    """
+        Reemplaza las secciones y reuniones de un horario general por las de `horarios`.
+        Se llama dentro de la transaccion que guarda el horario general.
+
+        :parametro horario_general: horario al que pertenecen las secciones
+        :tipo de parametro horario_general: HorarioGeneral
+        :parametro horarios: entradas validadas del horario
+        :tipo de parametro horarios: dict
+    """
+    guardar_secciones_horarios([(horario_general, horarios)])
+
+def guardar_secciones_horarios(pares:list):
+    """
+        Reemplaza las secciones y reuniones de varios horarios generales a la vez. Escribe
+        en bloque sin importar cuantos horarios sean: un borrado, una insercion para las
+        secciones, una consulta para recuperar sus ids y una insercion para las reuniones.
+
+        :parametro pares: tuplas (HorarioGeneral, entradas validadas del horario)
+        :tipo de parametro pares: list
+    """
+    compiladas = [(horario_general.id, horario_secciones.compilar_secciones(horarios)) for horario_general, horarios in pares]
+    ids_horarios = [id for id, _ in compiladas]
+    horario_models.SeccionHorario.objects.filter(horario_id__in=ids_horarios).delete()
+    horario_models.SeccionHorario.objects.bulk_create([
+        horario_models.SeccionHorario(
+            horario_id = id_horario,
+            codigo     = seccion.codigo,
+            materia    = seccion.reuniones[0].get('materia') or '',
+            seccion    = seccion.seccion
+        )
+        for id_horario, secciones in compiladas for por_codigo in secciones.values() for seccion in por_codigo.values()
+    ])
+    ids = {
+        (id_horario, codigo, seccion): id
+        for id, id_horario, codigo, seccion in horario_models.SeccionHorario.objects.filter(
+            horario_id__in=ids_horarios).values_list('id', 'horario_id', 'codigo', 'seccion')
+    }
+    horario_models.ReunionSeccion.objects.bulk_create([
+        horario_models.ReunionSeccion(
+            seccion_id = ids[(id_horario, seccion.codigo, seccion.seccion)],
+            dia        = reunion['dia'],
+            desde      = reunion['desde'],
+            hasta      = reunion['hasta'],
+            aula       = reunion.get('aula') or '',
+            profesor   = reunion.get('profesor') or ''
+        )
+        for id_horario, secciones in compiladas for por_codigo in secciones.values()
+        for seccion in por_codigo.values() for reunion in seccion.reuniones
+    ])
+
+def obtener_secciones_horario(id:int, codigos:list=None)->dict:
+    """
+        Servicio para obtener solo las secciones de las materias indicadas de un horario
+        general, usando el indice (horario, codigo)
+
+        :parametro id: id del horario general
+        :tipo de parametro id: int
+        :parametro codigos: codigos de las materias, por defecto todas
+        :tipo de parametro codigos: list
+        :return: diccionario codigo -> seccion -> Seccion
+    """
+    secciones = {}
+    consulta = horario_models.SeccionHorario.objects.filter(horario_id=id)
+    if codigos is not None:
+        consulta = consulta.filter(codigo__in=list(codigos))
+    consulta = consulta.order_by('id').prefetch_related('reuniones')
+    for fila in consulta:
+        seccion = horario_secciones.Seccion(fila.codigo, fila.seccion)
+        for reunion in sorted(fila.reuniones.all(), key=lambda reunion: reunion.id):
+            seccion.agregar_reunion({
+                'codigo': fila.codigo,
+                'materia': fila.materia,
+                'seccion': fila.seccion,
+                'dia': reunion.dia,
+                'desde': reunion.desde,
+                'hasta': reunion.hasta,
+                'aula': reunion.aula,
+                'profesor': reunion.profesor,
+            })
+        secciones.setdefault(fila.codigo, {})[fila.seccion] = seccion
+    return secciones
+
+horarios_indexados = {}
+candado_horarios = threading.Lock()
+
+def obtener_matriz_choques(id:int)->horario_secciones.MatrizChoques:
+    """
+        Horario general indexado (codigo -> seccion -> Seccion con sus reuniones) junto con
+        la matriz de choques de sus secciones. Se arma una vez por (carrera, fecha, version)
+        del horario a partir de sus secciones ya normalizadas y se conserva en el proceso;
+        cada peticion solo consulta la version vigente del horario.
+
+        :parametro id: id del horario general
+        :tipo de parametro id: int
+        :raises: ValueError
+        :return: MatrizChoques
+    """
+    try:
+        carrera, fecha, version = horario_models.HorarioGeneral.objects.values_list(
+            'carrera', 'fecha', 'version').get(id=id)
+    except horario_models.HorarioGeneral.DoesNotExist:
+        raise ValueError(str("El horario solicitado no existe"))
+    clave = (carrera, fecha, version, id)
+    with candado_horarios:
+        matriz = horarios_indexados.get(clave)
+    if matriz is not None:
+        return matriz
+    matriz = horario_secciones.MatrizChoques(obtener_secciones_horario(id))
+    with candado_horarios:
+        for anterior in [anterior for anterior in horarios_indexados if anterior[3] == id]:
+            del horarios_indexados[anterior]
+        horarios_indexados[clave] = matriz
+    return matriz
+
+def obtener_horario_de_carrera(carrera:str, fecha:str=None)->int:
+    """
+        Servicio para obtener el id del horario general de una carrera, el del semestre de
+        la fecha indicada o, si no se indica, el mas reciente
+
+        :parametro carrera: carrera del horario
+        :tipo de parametro carrera: str
+        :parametro fecha: fecha del semestre en formato 'YYYY-MM-DD'
+        :tipo de parametro fecha: str
+        :raises: ValueError
+        :return: id del horario general
+    """
+    id = consulta_horario_de_carrera(carrera, fecha).values_list('id', flat=True).first()
+    if id is None:
+        raise ValueError(str("No hay un horario registrado para la carrera '%s'" % carrera))
+    return id
+
+def consulta_horario_de_carrera(carrera:str, fecha:str=None):
+    """
+        Horarios generales de la carrera (de la fecha indicada, si la hay) ordenados del mas
+        reciente al mas viejo
+
+        :raises: ValueError
+        :return: QuerySet de HorarioGeneral
+    """
+    horario_validations.validate_carrera(carrera)
+    consulta = horario_models.HorarioGeneral.objects.filter(carrera=carrera.lower())
+    if fecha is not None:
+        horario_validations.validate_fecha(fecha)
+        consulta = consulta.filter(fecha__date=fecha)
+    # En PostgreSQL los NULL van primero en orden descendente: sin nulls_last un horario
+    # sin fecha seria el "mas reciente"
+    return consulta.order_by(F('fecha').desc(nulls_last=True), '-id')
+
+def descartar_horario_indexado(id:int):
+    """
+        Libera los horarios indexados de un horario general que cambio o se elimino
+    """
+    with candado_horarios:
+        for clave in [clave for clave in horarios_indexados if clave[3] == id]:
+            del horarios_indexados[clave]
+
 def eliminar_horario_del_semestre(id:int):
     """
         Servicio para eliminar los horarios de cada periodo semestral por el id
@@ -97,19 +277,157 @@ def editar_horario_del_semestre(data:dict,id:int)->horario_models.HorarioGeneral
         if data.get('carrera') is not None:
             horario_validations.validate_carrera(data.get('carrera'))
             horario_a_editar.carrera = data.get('carrera').lower()
+        horarios = None
         if data.get('horario') is not None:
-            horario_a_editar.horario = data.get('horario')
+            horarios = horario_secciones.interpretar_horario(data.get('horario'))
+            horario_validations.validate_horario_general(horarios)
+            horario_a_editar.horario = horarios
+            horario_a_editar.version += 1
         if data.get('fecha') is not None:
             horario_validations.validate_fecha(data.get('fecha'))
             horario_a_editar.fecha = data.get('fecha')
         with transaction.atomic():
             horario_a_editar.save()
+            if horarios is not None:
+                guardar_secciones_horario(horario_a_editar, horarios)
     except horario_models.HorarioGeneral.DoesNotExist:
         raise ValueError(str('El horario solicitado no existe'))
     except Exception as e:
         raise ValueError(str('Hubo un error editando el horario'))
     return horario_a_editar
 
+def registrar_horarios_del_semestre(data:list)->list:
+    """
+        Servicio para registrar o reemplazar de una vez los horarios de varias carreras,
+        en una sola transaccion. Cada elemento lleva carrera, fecha y horario como en
+        registrar_horario_del_semestre; si ya hay un horario de esa carrera para esa fecha,
+        o si el elemento trae el 'id' de un horario existente, se reemplaza y sube su version.
+
+        Los horarios nuevos se crean con bulk_create y los reemplazados se guardan con
+        bulk_update, asi que no se emiten las señales de HorarioGeneral: las caches que
+        dependen de ellos se invalidan aqui al terminar.
+
+        :parametro data: lista de diccionarios {'carrera','fecha','horario'} y opcionalmente 'id'
+        :tipo de parametro data: list
+        :raises: ValueError
+        :return: lista de HorarioGeneral en el orden de data
+    """
+    if not isinstance(data, list) or not data:
+        raise ValueError(str("Debe de indicar una lista con los horarios a registrar"))
+    elementos = []
+    for posicion, datos in enumerate(data, 1):
+        try:
+            if not isinstance(datos, dict):
+                raise ValueError(str("Debe de ser un objeto con carrera, fecha y horario"))
+            if datos.get('carrera') is None:
+                raise ValueError(str("Debe de indicar para que carrera es este horario"))
+            horario_validations.validate_carrera(datos.get('carrera'))
+            if datos.get('fecha') is None:
+                raise ValueError(str("Debe de indicar para que semestre es el horario por medio de la fecha"))
+            # La misma forma de la fecha sirve para detectar repetidos y buscar los existentes
+            fecha = horario_validations.validate_fecha_iso(datos.get('fecha'))
+            if datos.get('horario') is None:
+                raise ValueError(str("Debe de indicar las secciones del horario"))
+            horarios = horario_secciones.interpretar_horario(datos.get('horario'))
+            horario_validations.validate_horario_general(horarios)
+            id = int(datos['id']) if datos.get('id') is not None else None
+        except (ValueError, TypeError) as e:
+            raise ValueError(str("Horario %d: %s" % (posicion, e)))
+        elementos.append((id, datos.get('carrera').lower(), fecha, horarios))
+    claves = [(carrera, fecha) for id, carrera, fecha, _ in elementos if id is None]
+    if len(set(claves)) != len(claves):
+        raise ValueError(str("Hay mas de un horario para la misma carrera y fecha"))
+    ids = [id for id, _, _, _ in elementos if id is not None]
+    if len(set(ids)) != len(ids):
+        raise ValueError(str("Hay mas de un horario con el mismo id"))
+    with transaction.atomic():
+        existentes = horario_models.HorarioGeneral.objects.select_for_update().filter(
+            Q(id__in=ids) | Q(carrera__in={carrera for carrera, _ in claves}, fecha__date__in={fecha for _, fecha in claves})
+        ).order_by('id')
+        por_id = {}
+        por_clave = {}
+        for horario_general in existentes:
+            por_id[horario_general.id] = horario_general
+            if horario_general.fecha is not None:
+                por_clave[(horario_general.carrera, horario_general.fecha.date().isoformat())] = horario_general
+        faltantes = [id for id in ids if id not in por_id]
+        if faltantes:
+            raise ValueError(str("Los horarios solicitados no existen: %s" % ', '.join(map(str, faltantes))))
+        carreras = set()
+        nuevos = []
+        reemplazados = []
+        resultado = []
+        for id, carrera, fecha, horarios in elementos:
+            horario_general = por_id[id] if id is not None else por_clave.get((carrera, fecha))
+            if horario_general is None:
+                horario_general = horario_models.HorarioGeneral(carrera=carrera, fecha=fecha, horario=horarios)
+                nuevos.append(horario_general)
+            elif horario_general in reemplazados:
+                raise ValueError(str("El horario %d se indico mas de una vez" % horario_general.id))
+            else:
+                carreras.add(horario_general.carrera)
+                horario_general.carrera = carrera
+                horario_general.fecha = fecha
+                horario_general.horario = horarios
+                horario_general.version += 1
+                reemplazados.append(horario_general)
+            carreras.add(carrera)
+            resultado.append((horario_general, horarios))
+        horario_models.HorarioGeneral.objects.bulk_update(reemplazados, ['carrera', 'fecha', 'horario', 'version'])
+        horario_models.HorarioGeneral.objects.bulk_create(nuevos)
+        if nuevos and nuevos[0].id is None:
+            # Solo PostgreSQL devuelve los ids de bulk_create; en el resto se consultan por
+            # carrera y fecha, que en los nuevos no se repiten
+            creados = {
+                (carrera, fecha.date().isoformat()): id
+                for id, carrera, fecha in horario_models.HorarioGeneral.objects.filter(
+                    carrera__in={horario_general.carrera for horario_general in nuevos},
+                    fecha__date__in={horario_general.fecha for horario_general in nuevos}
+                ).exclude(id__in=[horario_general.id for horario_general in existentes]).values_list('id', 'carrera', 'fecha')
+            }
+            for horario_general in nuevos:
+                horario_general.id = creados[(horario_general.carrera, horario_general.fecha)]
+        guardar_secciones_horarios(resultado)
+    for horario_general in reemplazados:
+        descartar_horario_indexado(horario_general.id)
+    for carrera in carreras:
+        invalidar_generaciones(carrera)
+    return [horario_general for horario_general, _ in resultado]
+
+def obtener_horarios_del_semestre(ids:list=None, carreras:list=None, fecha:str=None)->list:
+    """
+        Servicio para obtener en una sola consulta varios horarios generales, por id o por
+        carrera
+
+        :parametro ids: ids de los horarios
+        :tipo de parametro ids: list
+        :parametro carreras: carreras de las que se quieren todos los horarios
+        :tipo de parametro carreras: list
+        :parametro fecha: si se indica, solo los horarios de las carreras para esa fecha
+        :tipo de parametro fecha: str
+        :raises: ValueError
+        :return: lista de HorarioGeneral ordenada por carrera y del mas reciente al mas antiguo
+    """
+    ids = list(ids or [])
+    carreras = [carrera.lower() for carrera in carreras or []]
+    if not ids and not carreras:
+        raise ValueError(str("Debe de indicar los ids o las carreras de los horarios"))
+    try:
+        ids = [int(id) for id in ids]
+    except (TypeError, ValueError):
+        raise ValueError(str("Los ids de los horarios deben ser numeros enteros"))
+    for carrera in carreras:
+        horario_validations.validate_carrera(carrera)
+    por_carrera = Q(carrera__in=carreras)
+    if fecha is not None:
+        horario_validations.validate_fecha(fecha)
+        por_carrera &= Q(fecha__date=fecha)
+    horarios = list(horario_models.HorarioGeneral.objects.filter(Q(id__in=ids) | por_carrera).order_by('carrera', '-fecha', '-id'))
+    faltantes = set(ids) - {horario.id for horario in horarios}
+    if faltantes:
+        raise ValueError(str("Los horarios solicitados no existen: %s" % ', '.join(map(str, sorted(faltantes)))))
+    return horarios
+
 def guardar_horario_particular(data:dict) -> horario_models.HorarioParticular:
     """
         Servicio para guardar horarios generados por el sistema
@@ -165,21 +483,615 @@ def eliminar_horarios():
     except Exception as e:
         raise ValueError("Hubo un error eliminando los horarios")
 
-def iniciate(materiasPorCursarDiccionario:dict):
-    HorarioCombinacion = Pensum(materiasPorCursarDiccionario) 
-    HorarioCombinacion.generarTodasPosibilidades()
-    resultado = HorarioCombinacion.asigna_puntuacion()
-    #HorarioPersonal = Horario()
-    #HorarioPersonal.cargar_horario(5) #Cambiar esto por un verdaero id que se le pase el nombre mejor de la carrera
-    #resultado = HorarioPersonal.comprobar_combinacion_horario(resultado[0]['combinacion'])
+def crear_trabajo_generacion(data:dict, top_k:int=None) -> horario_models.TrabajoGeneracion:
+    """
+        Servicio para registrar un trabajo de generacion de horarios que se ejecutara
+        en un worker de Celery
+
+        :parametro data: la misma peticion que recibe la generacion sincrona
+        :tipo de parametro data: dict
+        :parametro top_k: cantidad de mejores combinaciones a devolver
+        :tipo de parametro top_k: int
+        :raises: ValueError
+        :return: TrabajoGeneracion
+
+        Validaciones implicitas:
+        1.La peticion traiga los datos de la carrera y los creditos.
+        2.La carrera este dentro de las opciones disponibles.
+        3.top_k sea un entero positivo.
+    """
+    datos = horario_validations.validate_datos(data)
+    if len(datos) == 0:
+        raise ValueError(str("Debe de indicar los datos de la carrera y los creditos en la clave '0'"))
+    horario_validations.validate_carrera(str(datos[0].get('carrera', '')))
+    if top_k is not None:
+        top_k = horario_validations.validate_top_k(top_k)
+    with transaction.atomic():
+        try:
+            trabajo = horario_models.TrabajoGeneracion.objects.create(
+                peticion = json.dumps(data),
+                top_k    = top_k
+            )
+        except Exception as e:
+            raise ValueError(str('Hubo un error registrando el trabajo'))
+    return trabajo
+
+def obtener_trabajo_generacion(id:int) -> horario_models.TrabajoGeneracion:
+    """
+        Servicio para obtener un trabajo de generacion por medio de su id
+
+        :parametro id: id del trabajo
+        :tipo de parametro id: int
+        :raises: ValueError
+        :return: TrabajoGeneracion
+    """
+    try:
+        trabajo = horario_models.TrabajoGeneracion.objects.get(id=id)
+    except horario_models.TrabajoGeneracion.DoesNotExist:
+        raise ValueError(str("El trabajo solicitado no existe"))
+    except Exception as e:
+        raise ValueError(str("Hubo un error al obtener el trabajo"))
+    return trabajo
+
+def obtener_resultado_trabajo(id:int) -> list:
+    """
+        Servicio para obtener las combinaciones generadas por un trabajo terminado
+
+        :parametro id: id del trabajo
+        :tipo de parametro id: int
+        :raises: ValueError
+        :return: lista de diccionarios {'combinacion','puntaje'}
+    """
+    trabajo = obtener_trabajo_generacion(id)
+    if trabajo.estado == horario_models.TrabajoGeneracion.ERROR:
+        raise ValueError(str(trabajo.detalle))
+    if trabajo.estado != horario_models.TrabajoGeneracion.TERMINADO:
+        raise ValueError(str("El trabajo todavia no ha terminado, su estado es '%s'" % trabajo.estado))
+    return json.loads(trabajo.resultado)
+
+def marcar_error_trabajo_generacion(id:int, detalle:str):
+    """
+        Deja un trabajo en estado de error, por ejemplo cuando no se pudo encolar, para que
+        la consulta de su estado no se quede esperando un worker que nunca lo va a tomar.
+
+        :parametro id: id del trabajo
+        :tipo de parametro id: int
+        :parametro detalle: motivo que se devuelve al pedir el resultado
+        :tipo de parametro detalle: str
+    """
+    trabajo = obtener_trabajo_generacion(id)
+    trabajo.estado = horario_models.TrabajoGeneracion.ERROR
+    trabajo.detalle = detalle
+    with transaction.atomic():
+        trabajo.save(update_fields=['estado', 'detalle', 'actualizado'])
+
+def ejecutar_trabajo_generacion(id:int):
+    """
+        Ejecuta un trabajo de generacion y guarda su resultado o el error que lo detuvo.
+        Lo llama la tarea de Celery, nunca el ciclo de una peticion HTTP.
+
+        :parametro id: id del trabajo
+        :tipo de parametro id: int
+    """
+    trabajo = obtener_trabajo_generacion(id)
+    trabajo.estado = horario_models.TrabajoGeneracion.PROCESANDO
+    trabajo.save(update_fields=['estado', 'actualizado'])
+    try:
+        resultado = generar_horario_particular(json.loads(trabajo.peticion), trabajo.top_k)
+        trabajo.resultado = json.dumps(resultado)
+        trabajo.estado = horario_models.TrabajoGeneracion.TERMINADO
+    except Exception as e:
+        trabajo.detalle = str(e)
+        trabajo.estado = horario_models.TrabajoGeneracion.ERROR
+    with transaction.atomic():
+        trabajo.save()
+
+def normalizar_peticion(data:dict)->dict:
+    """
+        Lleva una peticion de generacion a su forma canonica: la carrera en minusculas y
+        las materias ordenadas por codigo y numeradas desde "1". Dos peticiones con las
+        mismas materias en distinto orden quedan iguales y generan el mismo resultado.
+
+        :parametro data: peticion de generacion
+        :tipo de parametro data: dict
+        :raises: ValueError
+        :return: dict
+    """
+    datos = horario_validations.validate_datos(data)
+    if len(datos) == 0 or not isinstance(datos[0], dict):
+        raise ValueError(str("Debe de indicar los datos de la carrera y los creditos en la clave '0'"))
+    datos = dict(datos[0])
+    datos['carrera'] = str(datos.get('carrera', '')).lower()
+    materias = horario_validations.validate_lista(data)
+    if not all(isinstance(materia, dict) for materia in materias):
+        raise ValueError(str("Cada materia de la peticion debe ser un objeto"))
+    horario_validations.validate_peticion_generacion(datos, materias)
+    materias.sort(key=lambda materia: (str(materia.get('codigo')), json.dumps(materia, sort_keys=True, default=str)))
+    peticion = {"0": datos}
+    for indice, materia in enumerate(materias, 1):
+        peticion[str(indice)] = materia
+    return peticion
+
+def version_horarios(carrera:str)->str:
+    """
+        Version de los horarios generales de una carrera dentro de la cache de generacion.
+        Cambia cada vez que se registra, edita o elimina un HorarioGeneral de la carrera; si la
+        cache la descarta se crea una nueva, con lo que las entradas viejas dejan de alcanzarse.
+    """
+    cache = caches['generacion']
+    clave = 'version:%s' % carrera
+    version = cache.get(clave)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(clave, version, timeout=None):
+            version = cache.get(clave, version)
+    return version
+
+def invalidar_generaciones(carrera:str):
+    """
+        Invalida los resultados de generacion guardados en cache para una carrera
+
+        :parametro carrera: carrera cuyos horarios generales cambiaron
+        :tipo de parametro carrera: str
+    """
+    caches['generacion'].set('version:%s' % str(carrera).lower(), uuid.uuid4().hex, timeout=None)
+
+def huella_peticion(peticion:dict, top_k:int=None, horario:tuple=None)->str:
+    """
+        Huella de una peticion normalizada: sha256 de su JSON canonico junto con top_k,
+        la huella de los datos del pensum de la carrera y el (id, version) del horario general
+        con el que se generan las secciones. Como la version sale de la base de datos, una
+        edicion del horario invalida la entrada en todos los workers; solo las peticiones sin
+        horario usan la version de la carrera que guarda la cache.
+
+        :parametro horario: (id, version) ya resuelto con obtener_horario_de_peticion; si no
+            se indica se resuelve aqui
+        :tipo de parametro horario: tuple
+        :raises: ValueError
+    """
+    carrera = peticion["0"]['carrera']
+    if horario is None:
+        horario = obtener_horario_de_peticion(peticion["0"])
+    id, version = horario
+    if id is None:
+        version = version_horarios(carrera)
+    contenido = json.dumps(
+        [peticion, top_k, horario_pensums.obtener_pensum_compilado(carrera).origen, id, version],
+        sort_keys=True, separators=(',', ':'), default=str
+    )
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+def generar_horario_particular(data:dict, top_k:int=None, medicion:horario_medicion.Medicion=None)->list:
+    """
+        Genera las combinaciones puntuadas de una peticion pasando por la cache de generacion.
+        Las peticiones iguales (por ejemplo, las de los estudiantes de un mismo semestre)
+        se resuelven una vez y las siguientes se leen de la cache.
+
+        :parametro data: datos de la peticion y materias por cursar
+        :tipo de parametro data: dict
+        :parametro top_k: cantidad de mejores combinaciones a devolver
+        :tipo de parametro top_k: int
+        :parametro medicion: si se indica, registra los tiempos de la cache y de cada fase
+            de la generacion
+        :tipo de parametro medicion: Medicion
+        :raises: ValueError
+        :return: lista de diccionarios {'combinacion','puntaje'}
+    """
+    return list(generar_horario_particular_en_flujo(data, top_k, medicion))
+
+def generar_horario_particular_en_flujo(data:dict, top_k:int=None, medicion:horario_medicion.Medicion=None):
+    """
+        Como generar_horario_particular, pero entrega cada combinacion en cuanto el generador
+        la produce. La peticion se valida y la cache se consulta al llamar, asi que los
+        ValueError salen antes de empezar a recorrer. El resultado solo se guarda en la
+        cache si el iterador se recorre completo.
+
+        :raises: ValueError
+        :return: iterador de diccionarios {'combinacion','puntaje'}
+    """
+    if top_k is not None:
+        top_k = horario_validations.validate_top_k(top_k)
+    peticion = normalizar_peticion(data)
+    horario_validations.validate_carrera(peticion["0"]['carrera'])
+    horario = obtener_horario_de_peticion(peticion["0"])
+    clave = 'generacion:%s' % huella_peticion(peticion, top_k, horario)
+    if medicion is None:
+        resultado = caches['generacion'].get(clave)
+    else:
+        with medicion.fase('cache'):
+            resultado = caches['generacion'].get(clave)
+        medicion.sumar('cache_aciertos', int(resultado is not None))
+    if resultado is not None:
+        return iter(resultado)
+    resultados = iniciate(peticion, top_k, horario=horario[0], medicion=medicion)
+    if medicion is not None:
+        resultados = medicion.medir_iterador('generacion', resultados)
+    return guardar_al_terminar(clave, resultados)
+
+def guardar_al_terminar(clave:str, resultados):
+    """
+        Reentrega los resultados y los guarda en la cache de generacion al agotarse; si quien
+        los consume se detiene antes (por ejemplo, un cliente que corta la conexion) no se
+        guarda un resultado parcial. En cuanto pasan de HORARIO_CACHE_GENERACION_MAXIMO deja
+        de acumularlos, asi un flujo grande no se guarda y su memoria no crece con el total.
+    """
+    guardados = []
+    for resultado in resultados:
+        if guardados is not None:
+            guardados.append(resultado)
+            if not cabe_en_cache(len(guardados)):
+                guardados = None
+        yield resultado
+    if guardados is not None:
+        caches['generacion'].set(clave, guardados)
+
+def cabe_en_cache(cantidad:int)->bool:
+    """
+        Indica si un resultado de `cantidad` combinaciones se puede guardar en la cache de
+        generacion sin pasar de HORARIO_CACHE_GENERACION_MAXIMO
+    """
+    maximo = getattr(settings, 'HORARIO_CACHE_GENERACION_MAXIMO', 0)
+    return not maximo or cantidad <= maximo
+
+def compactar_combinacion(resultado:dict, tabla:dict, materias:list)->dict:
+    """
+        Reemplaza las materias de un resultado por su indice en la tabla de materias de la
+        respuesta, agregando a la tabla las que aun no esten
+
+        :parametro resultado: diccionario {'combinacion','puntaje'} y opcionalmente 'secciones'
+        :tipo de parametro resultado: dict
+        :parametro tabla: codigo -> indice en materias, se actualiza
+        :tipo de parametro tabla: dict
+        :parametro materias: tabla de materias de la respuesta, se actualiza
+        :tipo de parametro materias: list
+        :return: diccionario {'combinacion','puntaje'} con los indices de las materias y, si
+            el resultado trae secciones, 'secciones' con la seccion de cada materia en el mismo orden
+    """
+    indices = []
+    for materia in resultado['combinacion']:
+        indice = tabla.get(materia['codigo'])
+        if indice is None:
+            indice = tabla[materia['codigo']] = len(materias)
+            materias.append(materia)
+        indices.append(indice)
+    compacto = {'combinacion': indices, 'puntaje': resultado['puntaje']}
+    if 'secciones' in resultado:
+        compacto['secciones'] = [seccion['seccion'] for seccion in resultado['secciones']]
+    return compacto
+
+def compactar_resultados(resultados)->dict:
+    """
+        Formato compacto de los resultados de una generacion: cada materia aparece una sola
+        vez en 'materias' y cada combinacion solo lleva los indices de las suyas
+
+        :return: diccionario {'materias','combinaciones'}
+    """
+    tabla = {}
+    materias = []
+    combinaciones = [compactar_combinacion(resultado, tabla, materias) for resultado in resultados]
+    return {'materias': materias, 'combinaciones': combinaciones}
+
+def compactar_en_flujo(resultados):
+    """
+        Formato compacto para respuestas en flujo. Antes de la primera combinacion que usa
+        materias nuevas entrega {'materias': [...]} con ellas; los indices de las
+        combinaciones cuentan desde la primera materia entregada.
+    """
+    tabla = {}
+    materias = []
+    for resultado in resultados:
+        conocidas = len(materias)
+        compacto = compactar_combinacion(resultado, tabla, materias)
+        if len(materias) > conocidas:
+            yield {'materias': materias[conocidas:]}
+        yield compacto
+
+def obtener_horario_de_peticion(datos:dict)->tuple:
+    """
+        Horario general contra el que se comprueban las secciones de una peticion: el id
+        indicado en datos['horario'] o el de la carrera para datos['fecha'] (el mas reciente
+        si no hay fecha), junto con su version. Si la peticion no indica fecha ni horario y la
+        carrera no tiene horario registrado devuelve (None, None) y la generacion no asigna
+        secciones; si los indica y no hay ninguno que coincida es un error.
+
+        :parametro datos: bloque "0" de la peticion
+        :tipo de parametro datos: dict
+        :raises: ValueError
+        :return: (id, version) del horario general o (None, None)
+    """
+    if datos.get('horario') is not None:
+        try:
+            id = int(datos['horario'])
+        except (TypeError, ValueError):
+            raise ValueError(str("El campo 'horario' debe ser el id de un horario general"))
+        fila = horario_models.HorarioGeneral.objects.filter(id=id).values_list('id', 'version').first()
+        if fila is None:
+            raise ValueError(str("El horario solicitado no existe"))
+        return fila
+    if datos.get('fecha') is not None:
+        horario_validations.validate_fecha(datos['fecha'])
+    fila = consulta_horario_de_carrera(datos['carrera'], datos.get('fecha')).values_list('id', 'version').first()
+    if fila is None and datos.get('fecha') is not None:
+        raise ValueError(str("No hay un horario registrado para la carrera '%s' en la fecha %s" % (datos['carrera'], datos['fecha'])))
+    return fila if fila is not None else (None, None)
+
+def matriz_de_peticion(matriz:horario_secciones.MatrizChoques, peticion:dict)->horario_secciones.MatrizChoques:
+    """
+        Decide si la matriz de choques del horario sirve para la peticion. Un horario sin
+        ninguna seccion (vacio, o uno viejo que no se pudo interpretar) no dice nada de las
+        materias, asi que se genera sin comprobar secciones. Si el horario tiene secciones pero
+        ninguna de las materias pedidas, todas se descartarian y la respuesta seria vacia: se
+        informa cuales faltan.
+
+        :return: la matriz, o None si se genera sin secciones
+        :raises: ValueError
+    """
+    if matriz is None or not matriz.mascara_materia:
+        return None
+    codigos = [materia.get('codigo') for clave, materia in peticion.items() if clave != "0"]
+    if codigos and not any(codigo in matriz.mascara_materia for codigo in codigos):
+        raise ValueError(str("Ninguna de las materias pedidas tiene secciones en el horario: %s" % ', '.join(map(str, codigos))))
+    return matriz
+
+def iniciate(materiasPorCursarDiccionario:dict, top_k:int=None, por_lotes:bool=True, procesos:int=None, horario:int=None, medicion:horario_medicion.Medicion=None, matriz:horario_secciones.MatrizChoques=None):
+    """
+        Genera las combinaciones de materias puntuadas para la petición.
+
+        Las etapas (enumeración, cálculo de desbloqueos y puntuación) se encadenan como
+        generadores, por lo que el resultado es un iterador que se consume de forma
+        incremental y la memoria no crece con el número de combinaciones.
+
+        :parametro materiasPorCursarDiccionario: datos de la petición y materias por cursar
+        :tipo de parametro materiasPorCursarDiccionario: dict
+        :parametro top_k: si se indica, solo se devuelven las top_k mejores combinaciones
+            ordenadas de mayor a menor puntaje; hasta HORARIO_TOP_K_MAXIMO_LOTES combinaciones
+            estimadas se puntua la enumeracion completa por lotes y por encima se usa una
+            busqueda primero-el-mejor
+        :tipo de parametro top_k: int
+        :parametro por_lotes: puntua las combinaciones en lotes vectorizados con NumPy en vez
+            de una por una
+        :tipo de parametro por_lotes: bool
+        :parametro procesos: si es mayor que uno, reparte la enumeracion y la puntuacion en
+            un pool de ese numero de procesos; por defecto usa HORARIO_PROCESOS_GENERACION
+        :tipo de parametro procesos: int
+        :parametro horario: id del horario general; si se indica y tiene secciones, la busqueda
+            descarta las combinaciones que no tienen una asignacion de secciones sin choques y
+            cada resultado trae en 'secciones' una asignacion valida
+        :tipo de parametro horario: int
+        :parametro medicion: si se indica, acumula en ella el tiempo de cada fase y los
+            contadores de la busqueda
+        :tipo de parametro medicion: Medicion
+        :parametro matriz: matriz de choques ya calculada, en lugar de cargarla con `horario`
+        :tipo de parametro matriz: MatrizChoques
+        :return: iterador de diccionarios {'combinacion','puntaje'} o {'combinacion','puntaje','secciones'}
+        :raises: ValueError
+    """
+    if matriz is None and horario is not None:
+        matriz = matriz_de_peticion(obtener_matriz_choques(horario), materiasPorCursarDiccionario)
+    HorarioCombinacion = Pensum(materiasPorCursarDiccionario, matriz, medicion)
+    if top_k is not None:
+        top_k = horario_validations.validate_top_k(top_k)
+    if procesos is None:
+        procesos = getattr(settings, 'HORARIO_PROCESOS_GENERACION', 0)
+    if procesos and procesos > 1:
+        resultado = HorarioCombinacion.generar_en_paralelo(procesos, top_k)
+        return medicion.medir_iterador('paralelo', resultado) if medicion is not None else resultado
+    if top_k is not None:
+        if HorarioCombinacion.estimar_combinaciones() <= getattr(settings, 'HORARIO_TOP_K_MAXIMO_LOTES', MAXIMO_TOP_K_LOTES):
+            resultado = HorarioCombinacion.mejores_por_lotes(top_k)
+        else:
+            resultado = HorarioCombinacion.mejores_combinaciones(top_k)
+        return medicion.medir_iterador('busqueda', resultado) if medicion is not None else resultado
+    combinaciones = HorarioCombinacion.generarTodasPosibilidades()
+    if medicion is not None:
+        combinaciones = medicion.medir_iterador('enumeracion', combinaciones)
+    if por_lotes:
+        return HorarioCombinacion.asigna_puntuacion_por_lotes(combinaciones)
+    combinaciones = HorarioCombinacion.calcula_desbloqueos(combinaciones)
+    resultado = HorarioCombinacion.asigna_puntuacion(combinaciones)
     return resultado
 
+pools_procesos = {}
+candado_pool = threading.Lock()
+
+def obtener_pool_procesos(procesos:int)->ProcessPoolExecutor:
+    """
+        Pool de procesos del worker para la generacion en paralelo. Se crea una vez por
+        cantidad de procesos y se reutiliza entre peticiones; cada proceso del pool carga el
+        pensum compilado de una carrera la primera vez que la usa y lo conserva para los
+        siguientes fragmentos. Un pool nunca se cierra mientras el worker vive, porque otras
+        peticiones pueden estar enviandole fragmentos.
+    """
+    with candado_pool:
+        pool = pools_procesos.get(procesos)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=procesos)
+            pools_procesos[procesos] = pool
+        return pool
+
+def evaluar_fragmento(materiasPorCursarDiccionario:dict, tamanio:int, primera:int, top_k:int=None, matriz:horario_secciones.MatrizChoques=None)->list:
+    """
+        Trabajo de un proceso del pool: enumera y puntua las combinaciones de `tamanio`
+        materias cuya primera posicion es `primera`. Con una matriz de choques se podan los
+        pares de materias que nunca caben juntos, y con top_k ademas se descartan las
+        combinaciones sin asignacion de secciones antes de elegir las mejores.
+
+        :return: lista de (mascara, puntaje); con top_k solo las top_k mejores del fragmento
+    """
+    HorarioCombinacion = Pensum(materiasPorCursarDiccionario, matriz)
+    HorarioCombinacion.indexar_materias()
+    combinaciones = HorarioCombinacion.enumerar_combinaciones_grupo(tamanio, primera)
+    resultado = [(mascara, puntaje) for mascara, puntaje in HorarioCombinacion.puntuar_por_lotes(combinaciones)]
+    if top_k is not None:
+        if matriz is not None:
+            resultado = [item for item in resultado if HorarioCombinacion.asignar_secciones(item[0]) is not None]
+        return heapq.nlargest(top_k, resultado, key=lambda item: item[1])
+    return resultado
+
+def evaluar_perfil(materiasPorCursarDiccionario:dict, top_k:int=None, matriz:horario_secciones.MatrizChoques=None)->list:
+    """
+        Trabajo de un proceso del pool para la generacion por cohorte: todas las
+        combinaciones (o las top_k mejores) de un perfil de estudiante
+    """
+    return list(iniciate(materiasPorCursarDiccionario, top_k, procesos=0, matriz=matriz))
+
+def generar_cohorte(estudiantes:list, top_k:int=None, procesos:int=None, medicion:horario_medicion.Medicion=None):
+    """
+        Genera las combinaciones de muchos estudiantes a la vez, por ejemplo todos los de
+        una carrera antes de la inscripcion.
+
+        Los estudiantes con la misma peticion (mismas materias, creditos y horario) forman un
+        solo perfil que se genera una vez. Los perfiles que ya estan en la cache de generacion
+        no se vuelven a generar. El pensum compilado y la matriz de choques de cada horario se
+        preparan una sola vez. Los perfiles restantes se reparten en el pool de procesos,
+        con a lo sumo unos pocos por proceso en vuelo para no acumular resultados.
+
+        :parametro estudiantes: lista de {'estudiante': identificador, 'peticion': {...}}; un
+            elemento sin 'peticion' se toma como la peticion misma y se identifica por su posicion
+        :tipo de parametro estudiantes: list
+        :parametro top_k: cantidad de mejores combinaciones por estudiante
+        :tipo de parametro top_k: int
+        :parametro procesos: procesos del pool; por defecto HORARIO_PROCESOS_GENERACION, y con
+            0 o 1 se genera en este proceso
+        :tipo de parametro procesos: int
+        :parametro medicion: si se indica, cuenta estudiantes, perfiles y aciertos de la cache
+        :tipo de parametro medicion: Medicion
+        :raises: ValueError
+        :return: iterador de {'estudiante','carrera','resultados'} o {'estudiante','detail'} si la
+            peticion del estudiante no es valida, en el orden en que se terminan los perfiles
+    """
+    if not isinstance(estudiantes, list):
+        raise ValueError(str("Debe de indicar una lista con las peticiones de los estudiantes"))
+    if top_k is not None:
+        top_k = horario_validations.validate_top_k(top_k)
+    if procesos is None:
+        procesos = getattr(settings, 'HORARIO_PROCESOS_GENERACION', 0)
+    return recorrer_cohorte(estudiantes, top_k, procesos, medicion)
+
+def recorrer_cohorte(estudiantes:list, top_k:int, procesos:int, medicion:horario_medicion.Medicion=None):
+    perfiles = {}
+    horarios = {}
+    matrices = {}
+    for posicion, elemento in enumerate(estudiantes, 1):
+        elemento = elemento if isinstance(elemento, dict) else {}
+        estudiante = elemento.get('estudiante', posicion)
+        try:
+            peticion = normalizar_peticion(elemento.get('peticion', elemento))
+            carrera = peticion["0"]['carrera']
+            horario_validations.validate_carrera(carrera)
+            datos = peticion["0"]
+            origen = (carrera, datos.get('fecha'), datos.get('horario'))
+            if origen not in horarios:
+                horarios[origen] = obtener_horario_de_peticion(datos)
+            clave = 'generacion:%s' % huella_peticion(peticion, top_k, horarios[origen])
+            if clave not in perfiles:
+                if origen not in matrices:
+                    id = horarios[origen][0]
+                    matrices[origen] = obtener_matriz_choques(id) if id is not None else None
+                matriz = matriz_de_peticion(matrices[origen], peticion)
+                perfiles[clave] = {'peticion': peticion, 'carrera': carrera, 'matriz': matriz, 'estudiantes': []}
+        except (ValueError, TypeError, KeyError) as e:
+            yield {'estudiante': estudiante, 'detail': str(e)}
+            continue
+        perfiles[clave]['estudiantes'].append(estudiante)
+    if medicion is not None:
+        medicion.sumar('estudiantes', sum(len(perfil['estudiantes']) for perfil in perfiles.values()))
+        medicion.sumar('perfiles', len(perfiles))
+
+    def entregar(perfil:dict, resultados:list=None, error:Exception=None):
+        for estudiante in perfil['estudiantes']:
+            if error is not None:
+                yield {'estudiante': estudiante, 'detail': str(error)}
+            else:
+                yield {'estudiante': estudiante, 'carrera': perfil['carrera'], 'resultados': resultados}
+
+    cache = caches['generacion']
+    pendientes = []
+    for clave, perfil in perfiles.items():
+        resultados = cache.get(clave)
+        if resultados is None:
+            pendientes.append(clave)
+            continue
+        if medicion is not None:
+            medicion.sumar('cache_aciertos')
+        yield from entregar(perfil, resultados)
+    for carrera in {perfiles[clave]['carrera'] for clave in pendientes}:
+        horario_pensums.obtener_pensum_compilado(carrera)
+    if not procesos or procesos <= 1:
+        for clave in pendientes:
+            perfil = perfiles.pop(clave)
+            try:
+                resultados = evaluar_perfil(perfil['peticion'], top_k, perfil['matriz'])
+            except (ValueError, TypeError, KeyError) as e:
+                yield from entregar(perfil, error=e)
+                continue
+            if cabe_en_cache(len(resultados)):
+                cache.set(clave, resultados)
+            yield from entregar(perfil, resultados)
+        return
+    pool = obtener_pool_procesos(procesos)
+    en_vuelo = {}
+    pendientes = iter(pendientes)
+    while True:
+        for clave in itertools.islice(pendientes, procesos * 4 - len(en_vuelo)):
+            perfil = perfiles[clave]
+            codigos = [perfil['peticion'][indice].get('codigo') for indice in perfil['peticion'] if indice != "0"]
+            matriz = perfil['matriz'].restringir(codigos) if perfil['matriz'] is not None else None
+            en_vuelo[pool.submit(evaluar_perfil, perfil['peticion'], top_k, matriz)] = clave
+        if not en_vuelo:
+            return
+        terminados, _ = futures.wait(en_vuelo, return_when=futures.FIRST_COMPLETED)
+        for futuro in terminados:
+            clave = en_vuelo.pop(futuro)
+            perfil = perfiles.pop(clave)
+            try:
+                resultados = futuro.result()
+            except (ValueError, TypeError, KeyError) as e:
+                yield from entregar(perfil, error=e)
+                continue
+            if cabe_en_cache(len(resultados)):
+                cache.set(clave, resultados)
+            yield from entregar(perfil, resultados)
+
+def guardar_resultados_cohorte(lineas:list)->int:
+    """
+        Guarda con una sola insercion un bloque de resultados de generar_cohorte como
+        horarios particulares; las lineas con error se omiten
+
+        :parametro lineas: diccionarios {'estudiante','carrera','resultados'}
+        :tipo de parametro lineas: list
+        :return: cantidad de horarios guardados
+    """
+    horarios = []
+    for linea in lineas:
+        if 'resultados' not in linea:
+            continue
+        mejor = max(linea['resultados'], key=lambda resultado: resultado['puntaje'], default=None)
+        horarios.append(horario_models.HorarioParticular(
+            horario    = {'estudiante': linea['estudiante'], 'resultados': linea['resultados']},
+            carrera    = linea['carrera'],
+            puntuacion = round(mejor['puntaje']) if mejor is not None else None,
+            creditos   = sum(materia['creditos'] for materia in mejor['combinacion']) if mejor is not None else None
+        ))
+    with transaction.atomic():
+        horario_models.HorarioParticular.objects.bulk_create(horarios)
+    return len(horarios)
+
 class Pensum():
     """
         Clase de Pensum para delimitar en que nivel de la carrera se encuentra la petición
         en que carrera y encontrar la mejor combinación de materias la cual cumpla con
         la mayor cantidad de créditos posibles, pasando esta combinacion por un sistema
         de puntuación y filtros.
+
+        Cada instancia es el contexto de busqueda de una sola peticion: todo su estado se
+        crea en __init__ o en `indexar_materias` y lo unico que comparte con otras
+        peticiones es el pensum compilado y la matriz de choques del horario, que son de
+        solo lectura.
+
+        Con una matriz de choques la busqueda deja fuera las materias sin secciones y las
+        ramas que juntan dos materias cuyas secciones chocan todas entre si, y cada
+        combinacion que se entrega lleva una asignacion de secciones sin choques.
     """
     datos:list
     materias_por_cursar:list 
@@ -187,21 +1099,17 @@ class Pensum():
     minimo_creditos:int    
     limite_creditos:int 
     creditos_aprobados:int
-    posibles_combinaciones:list=[]
     tamanio_materias_Por_cursar:int 
-    tamanio_grupo:int=0
-    tamanio_minimo_grupo:int=0
-    contador_creditos:int=0  
-    contador:int=1
-    valor_para_ordenar:int=0
-    cuentame:int=0
-    suma_creditos:int= 0
-    posibles_combinaciones_puntuadas:list
+    tamanio_grupo:int
+    tamanio_minimo_grupo:int
     carrera:str
-    ciclo:int = 0
-    tamanio_new_combinacion=0
+    matriz:horario_secciones.MatrizChoques
+    medicion:horario_medicion.Medicion
 
-    def __init__(self,materias_por_cursar_diccionario:dict):
+    def __init__(self,materias_por_cursar_diccionario:dict,matriz:horario_secciones.MatrizChoques=None,medicion:horario_medicion.Medicion=None):
+        self.peticion = materias_por_cursar_diccionario
+        self.matriz = matriz
+        self.medicion = medicion
         self.datos = horario_validations.validate_datos(materias_por_cursar_diccionario)
         self.materias_por_cursar = horario_validations.validate_lista(materias_por_cursar_diccionario)
         self.electivas_elejidas  = horario_validations.validate_lista_electivas_elejidas(self.materias_por_cursar)
@@ -211,588 +1119,667 @@ class Pensum():
         self.creditos_aprobados  = self.datos[0]['creditosaprobados']
         self.tamanio_materias_por_cursar = len(self.materias_por_cursar)
         self.carrera = self.datos[0]['carrera']
+        self.tamanio_grupo = 0
+        self.tamanio_minimo_grupo = 0
 
     def generarTodasPosibilidades(self):
         """
-            Comienza el proceso para generar las posibles combinaciones, es la encargada de
-            rellenar la lista de combinaciones finalistas.
+            Comienza el proceso para generar las posibles combinaciones, es un generador
+            que entrega una a una las combinaciones finalistas como mascaras de bits.
         """
-        try:
-            for materia in self.materias_por_cursar:
-                self.contador_creditos = self.contador_creditos + materia['creditos']
-                if self.contador_creditos <= self.minimo_creditos:
-                    self.tamanio_minimo_grupo+=1
-                elif self.contador_creditos >= self.limite_creditos:
-                    break
-                self.contador+=1
-            if self.contador_creditos >= self.limite_creditos:
-                if self.contador_creditos == self.limite_creditos:
-                    self.tamanio_grupo = self.contador
-                else:
-                    self.tamanio_grupo = self.contador - 1
-            else:
-                self.tamanio_grupo = self.tamanio_materias_por_cursar
-            self.contador_creditos = 0
-            self.contador = 1
-            self.materias_por_cursar = horario_validations.validate_lista_menor(self.materias_por_cursar)
-            for materia in self.materias_por_cursar:
-                self.contador_creditos = self.contador_creditos + materia['creditos']
-                if(self.contador_creditos>=self.minimo_creditos):
-                     break
-                self.contador+=1
-            if (self.contador_creditos >= self.minimo_creditos):
-                self.tamanio_minimo_grupo = self.contador
-            else:
-                self.tamanio_minimo_grupo = 1
-            while(self.tamanio_grupo >= self.tamanio_minimo_grupo-1):
-                resultado = self.iniciar_calculo_combinaciones_grupo(self.tamanio_grupo, self.materias_por_cursar)
-                if len(resultado)!=0:
-                    self.posibles_combinaciones.extend(resultado)
-                self.tamanio_grupo-=1
-                self.cuentame+=1
-            return 0
-            if(len(self.posibles_combinaciones) == 0):
-                self.suma_creditos= 0
-            for materia in  self.materias_por_cursar:
-                self.suma_creditos += materia['creditos']
-            veces=1
-            while(self.suma_creditos > 18):
-                self.suma_creditos -= self.materias_por_cursar[self.tamanio_materias_por_cursar - veces]['creditos']
-                veces+=1
-        except ValueError as e:
-            raise ValueError(e)
-    
-    def iniciar_calculo_combinaciones_grupo(self, tamanio:int, materias_por_cursar:list):
+        self.indexar_materias()
+        self.calcular_limites_grupo()
+        for tamanio in range(self.tamanio_grupo, self.tamanio_minimo_grupo - 1, -1):
+            yield from self.enumerar_combinaciones_grupo(tamanio)
+
+    def indexar_materias(self):
         """
-            Función para calcular el total de combinaciones.
+            Ordena las materias por creditos de menor a mayor y asigna a cada una el bit de
+            su posicion, de forma que una combinacion es un entero con los bits de sus materias
+            encendidos. Deja precalculadas las tablas por bit de creditos, electivas, puntos
+            por nivel y codigo que usan la enumeracion y la puntuacion, junto con el bit que
+            tiene cada codigo en el pensum compilado de la carrera.
         """
-        combinacion_base = list(range(tamanio))
-        for i in combinacion_base:
-            combinacion_base[i] = self.materias_por_cursar[i]
-        resultado = self.calcular_combinaciones_grupo(combinacion_base, tamanio, self.materias_por_cursar)
-        return resultado
+        self.pensum_compilado = horario_pensums.obtener_pensum_compilado(self.carrera)
+        self.materias_por_cursar = horario_validations.validate_lista_menor(self.materias_por_cursar)
+        nivel = self.nivel_estudiante()
+        self.creditos_bit = [materia['creditos'] for materia in self.materias_por_cursar]
+        self.electiva_bit = [self.es_electiva(materia) for materia in self.materias_por_cursar]
+        self.puntos_nivel_bit = [self.puntos_por_nivel_materia(materia, nivel) for materia in self.materias_por_cursar]
+        self.codigo_bit = [materia['codigo'] for materia in self.materias_por_cursar]
+        self.mascara_codigo_bit = [self.pensum_compilado.mascara_codigos([codigo]) for codigo in self.codigo_bit]
+        self.indexar_secciones()
 
-    def calcular_combinaciones_grupo(self, combinacion_base:list , tamanio:int, materias_por_cursar:list):
-        combinaciones_del_grupo = []
-        combinacion = combinacion_base
-        if self.comprueba_creditos_y_electivas(combinacion):
-            combinaciones_del_grupo.append(combinacion.copy())
-        total_combinaciones = self.numero_combinaciones_grupo(len(materias_por_cursar), tamanio)
-        self.tamanio_new_combinacion = tamanio
-        for i in range(total_combinaciones):
-            if tamanio == self.tamanio_new_combinacion:
-                self.tamanio_new_combinacion -=1
+    def indexar_secciones(self):
+        """
+            Con la matriz de choques del horario marca en `sin_secciones` las materias que no
+            tienen secciones y en `incompatibles_bit[i]` las materias que no se pueden cursar
+            junto con la materia i porque todas sus secciones chocan.
+        """
+        n = len(self.codigo_bit)
+        self.sin_secciones = 0
+        self.incompatibles_bit = [0] * n
+        if self.matriz is None:
+            return
+        for i, codigo in enumerate(self.codigo_bit):
+            if codigo not in self.matriz.mascara_materia:
+                self.sin_secciones |= 1 << i
                 continue
-            combinacion = self.new_combinacion(combinacion, materias_por_cursar, tamanio)
-            self.tamanio_new_combinacion -=1
-            if self.tamanio_new_combinacion <= 0:
-                self.tamanio_new_combinacion == tamanio
-            if self.comprueba_creditos_y_electivas(combinacion):
-                combinaciones_del_grupo.append(combinacion.copy())
-        return combinaciones_del_grupo
-
-    def comprueba_creditos_y_electivas(self, combinacion:list)->bool:
+            for j, otro in enumerate(self.codigo_bit):
+                if j != i and otro in self.matriz.mascara_materia and not self.matriz.materias_compatibles(codigo, otro):
+                    self.incompatibles_bit[i] |= 1 << j
+
+    def asignar_secciones(self, mascara:int)->list:
+        """
+            Primera asignacion de secciones sin choques de la combinacion
+
+            :return: lista de {'codigo','seccion'} en el orden de la combinacion, o None si
+                no existe ninguna
+        """
+        codigos = [self.codigo_bit[i] for i in self.bits(mascara)]
+        asignacion = next(self.matriz.asignaciones(codigos), None)
+        if asignacion is None:
+            return None
+        return [{'codigo': seccion.codigo, 'seccion': seccion.seccion} for seccion in asignacion]
+
+    def armar_resultado(self, mascara:int, puntaje:float)->dict:
+        """
+            Resultado que se entrega por cada combinacion. Con matriz de choques incluye
+            'secciones' y devuelve None si la combinacion no tiene asignacion valida.
+        """
+        resultado = {'combinacion': self.materializar(mascara), 'puntaje': puntaje}
+        if self.matriz is not None:
+            if self.medicion is None:
+                secciones = self.asignar_secciones(mascara)
+            else:
+                with self.medicion.fase('secciones'):
+                    secciones = self.asignar_secciones(mascara)
+                self.medicion.sumar('sin_secciones', int(secciones is None))
+            if secciones is None:
+                return None
+            resultado['secciones'] = secciones
+        return resultado
+
+    def bits(self, mascara:int):
+        """
+            Posiciones de los bits encendidos de la mascara, de menor a mayor.
+        """
+        return horario_pensums.bits(mascara)
+
+    def mascara_codigos(self, mascara:int)->int:
+        """
+            Traduce una combinacion a la mascara de sus codigos en el pensum compilado.
+        """
+        mascara_codigos = 0
+        for i in self.bits(mascara):
+            mascara_codigos |= self.mascara_codigo_bit[i]
+        return mascara_codigos
+
+    def materializar(self, mascara:int)->list:
+        """
+            Convierte una mascara de bits en la lista de materias que representa.
+        """
+        return [self.materias_por_cursar[i] for i in self.bits(mascara)]
+
+    def calcular_limites_grupo(self):
+        """
+            Calcula el tamaño maximo y minimo que puede tener un grupo de materias. Con la
+            lista ordenada de menor a mayor, el maximo son cuantas materias de menos creditos
+            caben en `limite_creditos` y el minimo cuantas de mas creditos hacen falta para
+            llegar a `minimo_creditos`.
+        """
+        self.tamanio_grupo = 0
         suma = 0
-        electivas_incluidas = 0
-        for i,materia in enumerate(combinacion):
-            suma = suma + materia['creditos']
-            if(materia['semestre'] == 99 or materia['semestre'] ==88 or materia['semestre'] == 77):
-                electivas_incluidas +=1
+        for credito in self.creditos_bit:
+            suma += credito
             if suma > self.limite_creditos:
-                return False
-        if (suma < self.minimo_creditos or electivas_incluidas != len(self.electivas_elejidas)):
-            return False
-        return True
+                break
+            self.tamanio_grupo += 1
+        self.tamanio_minimo_grupo = 1
+        suma = 0
+        for credito in reversed(self.creditos_bit):
+            suma += credito
+            if suma >= self.minimo_creditos:
+                break
+            self.tamanio_minimo_grupo += 1
 
-    def numero_combinaciones_grupo(self, m:int, n:int)->int:
-        return int(self.cal_factorial(m) / (self.cal_factorial(n)*self.cal_factorial(m-n)))
+    def generar_en_paralelo(self, procesos:int, top_k:int=None):
+        """
+            Reparte la busqueda en fragmentos independientes, uno por cada tamaño de grupo y
+            materia inicial, y los evalua en el pool de procesos. Sin top_k los resultados se
+            entregan en el mismo orden que la version secuencial; con top_k cada fragmento
+            devuelve sus mejores y aqui se mezclan para quedarse con los top_k globales.
 
-    def cal_factorial(self, n:int)->int:
-        if n==0:
+            :parametro procesos: cantidad de procesos del pool
+            :tipo de parametro procesos: int
+            :parametro top_k: cantidad de mejores combinaciones a devolver
+            :tipo de parametro top_k: int
+            :return: generador de diccionarios {'combinacion','puntaje'}
+        """
+        self.indexar_materias()
+        self.calcular_limites_grupo()
+        n = len(self.materias_por_cursar)
+        pool = obtener_pool_procesos(procesos)
+        matriz = self.matriz.restringir(self.codigo_bit) if self.matriz is not None else None
+        futuros = []
+        for tamanio in range(self.tamanio_grupo, self.tamanio_minimo_grupo - 1, -1):
+            for primera in range(0, n - tamanio + 1):
+                futuros.append(pool.submit(evaluar_fragmento, self.peticion, tamanio, primera, top_k, matriz))
+        if top_k is None:
+            for futuro in futuros:
+                for mascara, puntaje in futuro.result():
+                    resultado = self.armar_resultado(mascara, puntaje)
+                    if resultado is not None:
+                        yield resultado
+            return
+        parciales = itertools.chain.from_iterable(futuro.result() for futuro in futuros)
+        for mascara, puntaje in heapq.nlargest(top_k, parciales, key=lambda item: item[1]):
+            resultado = self.armar_resultado(mascara, puntaje)
+            if resultado is not None:
+                yield resultado
+
+    def enumerar_combinaciones_grupo(self, tamanio:int, primera:int=None):
+        """
+            Enumera por ramificación y poda las combinaciones de `tamanio` materias,
+            devolviendo sus mascaras de bits en orden lexicografico de posiciones.
+
+            Se apoya en que la lista esta ordenada por creditos de menor a mayor, asi los
+            creditos minimos y maximos que aun puede sumar una rama salen de sumas de prefijos.
+            Una rama se descarta en cuanto supera `limite_creditos`, cuando ya no puede llegar
+            a `minimo_creditos`, cuando sus electivas ya no pueden coincidir con
+            `electivas_elejidas` o cuando junta materias que el horario no permite cursar juntas.
+
+            :parametro tamanio: cantidad de materias de cada combinacion
+            :tipo de parametro tamanio: int
+            :parametro primera: si se indica, solo se enumeran las combinaciones cuya primera
+                posicion es esta
+            :tipo de parametro primera: int
+            :return: generador de mascaras de bits
+        """
+        n = len(self.materias_por_cursar)
+        if tamanio <= 0 or tamanio > n:
+            return
+        creditos = self.creditos_bit
+        electivas = self.electiva_bit
+        electivas_requeridas = len(self.electivas_elejidas)
+        sin_secciones = self.sin_secciones
+        incompatibles = self.incompatibles_bit
+        suma_prefijo = [0]
+        for credito in creditos:
+            suma_prefijo.append(suma_prefijo[-1] + credito)
+        electivas_desde = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            electivas_desde[i] = electivas_desde[i + 1] + electivas[i]
+        visitadas = 0
+        podadas = 0
+
+        def ramificar(mascara:int, inicio:int, fin:int, restantes:int, suma:int, electivas_incluidas:int):
+            nonlocal visitadas, podadas
+            visitadas += 1
+            if restantes == 0:
+                yield mascara
+                return
+            for j in range(inicio, min(fin, n - restantes + 1)):
+                # Creditos minimos y maximos de completar la rama tomando j como siguiente materia
+                minimo = suma + suma_prefijo[j + restantes] - suma_prefijo[j]
+                if minimo > self.limite_creditos:
+                    podadas += 1
+                    break
+                maximo = suma + creditos[j] + suma_prefijo[n] - suma_prefijo[n - restantes + 1]
+                if maximo < self.minimo_creditos:
+                    podadas += 1
+                    continue
+                incluidas = electivas_incluidas + electivas[j]
+                faltan = electivas_requeridas - incluidas
+                if faltan < 0 or faltan > min(restantes - 1, electivas_desde[j + 1]):
+                    podadas += 1
+                    continue
+                if (restantes - 1 - faltan) > (n - j - 1) - electivas_desde[j + 1]:
+                    podadas += 1
+                    continue
+                if (sin_secciones >> j) & 1 or mascara & incompatibles[j]:
+                    podadas += 1
+                    continue
+                yield from ramificar(mascara | (1 << j), j + 1, n, restantes - 1, suma + creditos[j], incluidas)
+
+        if primera is None:
+            yield from ramificar(0, 0, n, tamanio, 0, 0)
+        else:
+            yield from ramificar(0, primera, primera + 1, tamanio, 0, 0)
+        if self.medicion is not None:
+            self.medicion.sumar('visitadas', visitadas)
+            self.medicion.sumar('podadas', podadas)
+
+    def es_electiva(self, materia:dict)->int:
+        if(materia['semestre'] == 99 or materia['semestre'] ==88 or materia['semestre'] == 77):
             return 1
-        return n*self.cal_factorial(n-1)
-    
-    def new_combinacion(self, combinacion:list, materias_por_cursar:list, tamanio:int):
-        new_combinacion = combinacion 
-        posicion = tamanio
-        posicion_superior_materia = 0
-        opcion_final = False
-        while(opcion_final == False):
-            posicion -=1
-            try:
-                posicion_superior_materia = materias_por_cursar.index(combinacion[posicion])+1
-            except IndexError:
-                pass
-            try:
-                opcion_final = type(materias_por_cursar[posicion_superior_materia + ((tamanio - 1) - posicion)])
-            except IndexError:
-                pass
-        if (posicion<=0):
-            posicion = posicion * -1
-        if (posicion_superior_materia<0):
-            posicion_superior_materia = posicion_superior_materia*-1
-        for i in range(posicion,tamanio):
-            try:
-                new_combinacion[i] = materias_por_cursar[posicion_superior_materia]
-            except IndexError:
-                pass
-            try:
-                posicion_superior_materia = materias_por_cursar.index(new_combinacion[i])+1
-            except IndexError:
-                pass        
-        return new_combinacion 
-
-    def asigna_puntuacion(self)->list:
-        nivel = round(((self.creditos_aprobados/132)*10))
-        combinaciones_puntuadas = []
-        for combinacion in self.posibles_combinaciones:
-            puntos_combinacion =0
-            materias_a_desbloquear = self.cantidad_materias_a_desbloquear(combinacion)
-            numero_creditos = self.creditos_combinacion(combinacion)
-            puntos_nivel = self.puntos_por_nivel(combinacion, nivel)
-            puntos_combinacion = ((materias_a_desbloquear*10)*0.5) + ((numero_creditos*10)*0.4) + ((puntos_nivel*10)*0.1)
-            combinaciones_puntuadas.append({
-            'combinacion': combinacion,
-            'puntaje': puntos_combinacion})
-        return combinaciones_puntuadas
-
-    def cantidad_materias_a_desbloquear(self, combinacion:list)->float:
-        desbloqueadas:list = self.secuencia_desbloqueo(combinacion)
-        del_pensum = 0
-        electivas = 0
-        for materia in desbloqueadas:
-            if(materia['semestre'] != 99 and materia['semestre']!=88):
-                del_pensum+=1
+        return 0
+
+    def calcula_desbloqueos(self, combinaciones):
+        """
+            Etapa que acompaña cada combinacion con la cantidad de materias que desbloquea.
+        """
+        if self.medicion is None:
+            for mascara in combinaciones:
+                yield mascara, self.cantidad_materias_a_desbloquear(mascara)
+            return
+        for mascara in combinaciones:
+            with self.medicion.fase('desbloqueo'):
+                materias_a_desbloquear = self.cantidad_materias_a_desbloquear(mascara)
+            yield mascara, materias_a_desbloquear
+
+    def asigna_puntuacion(self, combinaciones_con_desbloqueo):
+        """
+            Etapa final que puntua cada combinacion a medida que llega. Es el unico punto
+            donde la mascara vuelve a convertirse en la lista de materias.
+        """
+        for mascara, materias_a_desbloquear in combinaciones_con_desbloqueo:
+            inicio = time.perf_counter() if self.medicion is not None else 0
+            numero_creditos = self.creditos_combinacion(mascara)
+            puntos_nivel = self.puntos_por_nivel(mascara)
+            puntos_combinacion = self.puntaje(materias_a_desbloquear, numero_creditos, puntos_nivel)
+            if self.medicion is not None:
+                self.medicion.agregar('puntuacion', time.perf_counter() - inicio)
+                self.medicion.sumar('puntuadas')
+            resultado = self.armar_resultado(mascara, puntos_combinacion)
+            if resultado is not None:
+                yield resultado
+
+    def asigna_puntuacion_por_lotes(self, combinaciones, tamanio_lote:int=TAMANIO_LOTE):
+        """
+            Etapa final por lotes: puntua con `puntuar_por_lotes` y convierte cada mascara
+            en su lista de materias.
+        """
+        for mascara, puntos_combinacion in self.puntuar_por_lotes(combinaciones, tamanio_lote):
+            resultado = self.armar_resultado(mascara, puntos_combinacion)
+            if resultado is not None:
+                yield resultado
+
+    def puntuar_por_lotes(self, combinaciones, tamanio_lote:int=TAMANIO_LOTE):
+        """
+            Puntua las combinaciones en lotes de `tamanio_lote`. Cada lote se convierte en una
+            matriz 0/1 (combinaciones x materias) y los creditos, los puntos por nivel, los
+            desbloqueos y el puntaje se calculan con operaciones de arreglos contra los
+            vectores por materia. La memoria queda acotada por el tamaño del lote.
+
+            :return: generador de tuplas (mascara, puntaje)
+        """
+        combinaciones = iter(combinaciones)
+        # El primer lote se pide antes de armar los vectores: al consumirlo la enumeracion indexa las materias
+        lote = list(itertools.islice(combinaciones, tamanio_lote))
+        if not lote:
+            return
+        n = len(self.materias_por_cursar)
+        creditos = numpy.array(self.creditos_bit, dtype=numpy.int64)
+        puntos_nivel = numpy.array(self.puntos_nivel_bit, dtype=numpy.int64)
+        codigos = numpy.zeros((n, len(self.pensum_compilado.bit_codigo)), dtype=numpy.float32)
+        for i, mascara_codigo in enumerate(self.mascara_codigo_bit):
+            if mascara_codigo:
+                codigos[i, mascara_codigo.bit_length() - 1] = 1
+        pesos = self.pensum_compilado.obtener_matrices()['pesos']
+        desplazamientos = numpy.arange(n, dtype=numpy.int64)
+        medicion = self.medicion
+        while lote:
+            inicio = time.perf_counter() if medicion is not None else 0
+            if n < 63:
+                pertenencia = ((numpy.array(lote, dtype=numpy.int64)[:, None] >> desplazamientos) & 1).astype(numpy.uint8)
             else:
-                electivas+=1
-        return del_pensum + (electivas/2)
-
-    def secuencia_desbloqueo(self,combinacion:list):
-        pensum = horario_validations.validate_pensum(self.carrera)
-        agregada = True
-        desbloqueadas = []
-        materias_desbloqueadas=[]
-        TAMANIOPENSUM:int = len(pensum)
-        while(agregada==True):
-            agregada=False
-            k=0
-            for j in range(len(combinacion)):
-                l=0
-                for i in range(TAMANIOPENSUM):
-                    if pensum[l]['presedentes']['p2'] == '' and pensum[l]['presedentes']['p1'] != '':
-                        if combinacion[k]['codigo'] == pensum[l]['presedentes']['p1'] and not pensum[l]['aprobada']:
-                            desbloqueadas.append(pensum[l])
-                            pensum[l]['aprobada'] = True
-                            agregada = True
-                    l+=1
-                k+=1
-            for i in range(TAMANIOPENSUM):
-                if pensum[i]['presedentes']['p2'] != '' and pensum[i]['presedentes']['p1'] != '':
-                    coincide=0
-                    mats:list=[]
-                    for materia in combinacion:
-                        if pensum[i]['presedentes']['p1'] == materia['codigo'] or pensum[i]['presedentes']['p2'] == materia['codigo']:
-                            if not pensum[i]['aprobada']:
-                                coincide+=1
-                                mats.append(materia)
-                                if coincide==2:
-                                    desbloqueadas.append(pensum[i])
-                                    pensum[i]['aprobada']=True
-                                    agregada =True
-                                    coincide=0
-                                    mats=[]
-            if len(desbloqueadas)==0:
-                agregada = False
+                pertenencia = numpy.zeros((len(lote), n), dtype=numpy.uint8)
+                for fila, mascara in enumerate(lote):
+                    pertenencia[fila, list(self.bits(mascara))] = 1
+            numero_creditos = pertenencia @ creditos
+            puntos = pertenencia @ puntos_nivel
+            if medicion is not None:
+                desbloqueo = time.perf_counter()
+                medicion.agregar('puntuacion', desbloqueo - inicio)
+            desbloqueadas = self.pensum_compilado.desbloqueadas_lote((pertenencia.astype(numpy.float32) @ codigos) > 0, medicion)
+            materias_a_desbloquear = desbloqueadas @ pesos
+            if medicion is not None:
+                inicio = time.perf_counter()
+                medicion.agregar('desbloqueo', inicio - desbloqueo)
+            puntajes = ((materias_a_desbloquear*10)*0.5) + ((numero_creditos*10)*0.4) + ((puntos*10)*0.1)
+            puntajes = puntajes.tolist()
+            if medicion is not None:
+                medicion.agregar('puntuacion', time.perf_counter() - inicio)
+                medicion.sumar('puntuadas', len(lote))
+            yield from zip(lote, puntajes)
+            lote = list(itertools.islice(combinaciones, tamanio_lote))
+
+    def nivel_estudiante(self)->int:
+        return round(((self.creditos_aprobados/132)*10))
+
+    def puntaje(self, materias_a_desbloquear:float, numero_creditos:int, puntos_nivel:int)->float:
+        return ((materias_a_desbloquear*10)*0.5) + ((numero_creditos*10)*0.4) + ((puntos_nivel*10)*0.1)
+
+    def estimar_combinaciones(self)->int:
+        """
+            Cota superior del numero de combinaciones que enumera `generarTodasPosibilidades`:
+            cuenta los subconjuntos de materias cuyos creditos quedan entre el minimo y el
+            limite, sin tener en cuenta las electivas ni los choques de secciones.
+        """
+        conteo = [0] * (self.limite_creditos + 1)
+        conteo[0] = 1
+        for materia in self.materias_por_cursar:
+            creditos = materia['creditos']
+            for suma in range(self.limite_creditos, creditos - 1, -1):
+                conteo[suma] += conteo[suma - creditos]
+        return sum(conteo[max(self.minimo_creditos, 1):])
+
+    def mejores_por_lotes(self, top_k:int):
+        """
+            Las `top_k` combinaciones con mayor puntaje a partir de la enumeracion completa
+            puntuada por lotes. Solo se guardan las `top_k` mejores hasta el momento en un
+            monticulo; una combinacion que no supera a la peor de ellas se descarta sin armar
+            su resultado, asi las secciones se buscan solo para las candidatas. A igual
+            puntaje queda la que aparece antes en la enumeracion, igual que en
+            `mejores_combinaciones`.
+
+            :parametro top_k: cantidad de combinaciones a devolver
+            :tipo de parametro top_k: int
+            :return: generador de diccionarios {'combinacion','puntaje'} de mayor a menor puntaje
+        """
+        # Entradas: (puntaje, -lugar en la enumeracion, resultado); la raiz es la peor de las top_k
+        mejores = []
+        combinaciones = self.puntuar_por_lotes(self.generarTodasPosibilidades())
+        for lugar, (mascara, puntaje) in enumerate(combinaciones):
+            if len(mejores) == top_k and puntaje <= mejores[0][0]:
+                continue
+            resultado = self.armar_resultado(mascara, puntaje)
+            if resultado is None:
+                continue
+            if len(mejores) < top_k:
+                heapq.heappush(mejores, (puntaje, -lugar, resultado))
             else:
-                combinacion = desbloqueadas
-                materias_desbloqueadas = materias_desbloqueadas+desbloqueadas
-                desbloqueadas=[]
-        return materias_desbloqueadas
+                heapq.heapreplace(mejores, (puntaje, -lugar, resultado))
+        for _, _, resultado in sorted(mejores, key=lambda entrada: entrada[:2], reverse=True):
+            yield resultado
+
+    def mejores_combinaciones(self, top_k:int):
+        """
+            Busqueda primero-el-mejor de las `top_k` combinaciones con mayor puntaje.
+
+            Cada nodo del arbol es un subconjunto de posiciones de `materias_por_cursar` y sus
+            hijos agregan una materia de posicion mayor. La prioridad de un nodo es una cota
+            optimista de lo que puede puntuar cualquier combinacion de su rama:
+            - desbloqueo: el cierre de prerrequisitos usando todas las materias que aun caben
+              en la rama, que contiene a lo desbloqueado por cualquier subconjunto suyo.
+            - creditos: los de la rama mas todos los que quedan, sin pasar `limite_creditos`.
+            - nivel: los puntos actuales, porque agregar materias solo puede restar.
+            Las combinaciones completas entran al monticulo con su puntaje exacto; cuando una
+            sale del monticulo ninguna rama sin explorar puede superarla, y la busqueda termina
+            al entregar `top_k`. Con matriz de choques la asignacion de secciones se busca solo
+            al sacar una combinacion completa, y si no tiene ninguna se descarta sin contarla.
+            A igual prioridad los nodos se expanden antes de entregar combinaciones, asi los
+            empates salen en el orden de `generarTodasPosibilidades` (mas materias primero y
+            luego por posiciones) y el resultado coincide con ordenar la enumeracion completa
+            por puntaje. `iniciate` solo la usa por encima de HORARIO_TOP_K_MAXIMO_LOTES
+            combinaciones estimadas; por debajo `mejores_por_lotes` es mas rapida.
+
+            :parametro top_k: cantidad de combinaciones a devolver
+            :tipo de parametro top_k: int
+            :return: generador de diccionarios {'combinacion','puntaje'} de mayor a menor puntaje
+        """
+        self.indexar_materias()
+        n = len(self.materias_por_cursar)
+        creditos = self.creditos_bit
+        electivas = self.electiva_bit
+        electivas_requeridas = len(self.electivas_elejidas)
+        creditos_desde = [0] * (n + 1)
+        electivas_desde = [0] * (n + 1)
+        mascara_desde = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            creditos_desde[i] = creditos_desde[i + 1] + creditos[i]
+            electivas_desde[i] = electivas_desde[i + 1] + electivas[i]
+            mascara_desde[i] = mascara_desde[i + 1] | (1 << i)
+
+        def cota(mascara:int, siguiente:int, suma:int, puntos_nivel:int)->float:
+            mascara_codigos = self.mascara_codigos(mascara | mascara_desde[siguiente])
+            creditos_maximos = min(self.limite_creditos, suma + creditos_desde[siguiente])
+            return self.puntaje(self.cota_desbloqueo(mascara_codigos), creditos_maximos, puntos_nivel)
+
+        # Entradas: (-prioridad, 1 si es combinacion completa, desempate, datos); el desempate
+        # de un nodo es un contador y el de una combinacion su lugar en la enumeracion completa
+        monticulo = [(-cota(0, 0, 0, 0), 0, 0, (0, 0, 0, 0, 0))]
+        contador = 1
+        entregadas = 0
+        while monticulo and entregadas < top_k:
+            prioridad, es_combinacion, _, datos = heapq.heappop(monticulo)
+            if self.medicion is not None:
+                self.medicion.sumar('visitadas')
+            if es_combinacion:
+                resultado = self.armar_resultado(datos, -prioridad)
+                if resultado is not None:
+                    yield resultado
+                    entregadas += 1
+                continue
+            mascara, siguiente, suma, incluidas, puntos_nivel = datos
+            if mascara and suma >= self.minimo_creditos and incluidas == electivas_requeridas:
+                if self.medicion is not None:
+                    self.medicion.sumar('puntuadas')
+                puntos = self.puntaje(self.cantidad_materias_a_desbloquear(mascara), suma, puntos_nivel)
+                posiciones = tuple(self.bits(mascara))
+                heapq.heappush(monticulo, (-puntos, 1, (-len(posiciones), posiciones), mascara))
+            for j in range(siguiente, n):
+                nueva_suma = suma + creditos[j]
+                if nueva_suma > self.limite_creditos:
+                    break
+                if nueva_suma + creditos_desde[j + 1] < self.minimo_creditos:
+                    continue
+                nuevas_incluidas = incluidas + electivas[j]
+                if nuevas_incluidas > electivas_requeridas or nuevas_incluidas + electivas_desde[j + 1] < electivas_requeridas:
+                    continue
+                if (self.sin_secciones >> j) & 1 or mascara & self.incompatibles_bit[j]:
+                    continue
+                nueva_mascara = mascara | (1 << j)
+                nuevos_puntos = puntos_nivel + self.puntos_nivel_bit[j]
+                prioridad = cota(nueva_mascara, j + 1, nueva_suma, nuevos_puntos)
+                heapq.heappush(monticulo, (-prioridad, 0, contador, (nueva_mascara, j + 1, nueva_suma, nuevas_incluidas, nuevos_puntos)))
+                contador += 1
+
+    def cota_desbloqueo(self, mascara_codigos:int)->float:
+        """
+            Cota superior de `cantidad_materias_a_desbloquear` para cualquier combinacion
+            formada con los codigos de la mascara: cierra el conjunto de prerrequisitos sin
+            exigir que los dos precedentes se aprueben en la misma oleada.
+        """
+        return self.pensum_compilado.peso(self.pensum_compilado.cierre(mascara_codigos))
+
+    def cantidad_materias_a_desbloquear(self, mascara:int)->float:
+        desbloqueadas = self.pensum_compilado.desbloqueadas(self.mascara_codigos(mascara), self.medicion)
+        return self.pensum_compilado.peso(desbloqueadas)
+
+    def secuencia_desbloqueo(self, mascara:int)->list:
+        """
+            Materias del pensum que desbloquea la combinacion, resuelto con el grafo de
+            prerrequisitos compilado de la carrera.
+        """
+        desbloqueadas = self.pensum_compilado.desbloqueadas(self.mascara_codigos(mascara))
+        return self.pensum_compilado.materializar(desbloqueadas)
   
-    def creditos_combinacion(self, combinacion:list):
+    def creditos_combinacion(self, mascara:int)->int:
         creditos:int=0
-        for materia in combinacion:
-            creditos += materia['creditos']
+        for i in self.bits(mascara):
+            creditos += self.creditos_bit[i]
         return creditos
   
-    def puntos_por_nivel(self, combinacion:list, nivel:int):
+    def puntos_por_nivel(self, mascara:int)->int:
         puntos:int = 0
-        for materia in combinacion:
-            if(materia['semestre'] != 99 and materia['semestre'] != 88):
-                if(materia['semestre'] <= nivel):
-                    pass
-                else:
-                    diferencia = materia['semestre'] - nivel
-                    if(diferencia>2):
-                        puntos -= diferencia
+        for i in self.bits(mascara):
+            puntos += self.puntos_nivel_bit[i]
         return puntos
 
+    def puntos_por_nivel_materia(self, materia:dict, nivel:int)->int:
+        if(materia['semestre'] != 99 and materia['semestre'] != 88):
+            if(materia['semestre'] <= nivel):
+                pass
+            else:
+                diferencia = materia['semestre'] - nivel
+                if(diferencia>2):
+                    return -diferencia
+        return 0
+
 
 
 class Horario():
-    horarios:list = []
-    estadohorario:list=[]
-    posiblesCombinaciones:list=[]
-    horariosfinales:list=[]
-    materiasquechocan:list=[]
-    intentos:int
-    stop:bool
-    tamanio_new_combinacion=0
-
-
-    def cargar_horario(self,id):
-        horarios_generales = horario_models.HorarioGeneral.objects.get(id=5)
-        horarios_generales_serializados = horario_serializers.HorarioGeneral(horarios_generales,many=False).data
-        horarios_generales_json = horarios_generales_serializados['horario'].replace("\'", "\"")
-        self.horarios = json.loads(horarios_generales_json)
-
-    def comprobar_combinacion_horario(self,combinacion:list)->bool:
-        all_materias_secciones = []
-        for indice, materia in enumerate(combinacion):
-            codifo_materia = materia['codigo']
-            HMATERIA = []
-            for index,materia_general in enumerate(self.horarios):
-                if self.horarios[materia_general]['codigo'] == codifo_materia:
-                    HMATERIA.append(self.horarios[materia_general])
-                secciones_materia = []
-                for indice,item in enumerate(HMATERIA):
-                    if not item['seccion'] in secciones_materia:
-                        secciones_materia.append({
-                            'codigo': materia['codigo'],
-                            'materia': materia['materia'],
-                            'creditos': materia['creditos'],
-                            'seccion': item['seccion']
-                            })
-            all_materias_secciones.append(secciones_materia)
-        horario_base = []
-        print('El error')
-        for indice, materia in enumerate(all_materias_secciones):
-            print(materia,'\n',type(materia),'\n',materia[0])
-            horario_base.append(materia[0]) #Creo que dara error, en dado caso cambiar por 'codigo'
-        print('Estos son los horario_base','\n',horario_base)
-        self.posiblesCombinaciones = self.find_all_horarios(horario_base, len(combinacion), all_materias_secciones)
-        print('no era')
-        return self.posiblesCombinaciones
-        for indice, horario in enumerate(self.posiblesCombinaciones):
-            resultado = self.comprobar_posible_horario(horario)
-            if resultado == True:
-                estadohorario = self.estadohorario
-                self.horariosfinales.append(estadohorario)
+    """
+        Busqueda de secciones para una combinacion de materias. Cada instancia es el
+        contexto de una sola peticion: todo su estado se crea en __init__ y no se comparte
+        con otras instancias.
+    """
+    horarios:dict
+    secciones:dict
+    matriz:horario_secciones.MatrizChoques
+    horariosfinales:list
+    materiasquechocan:list
+
+    def __init__(self):
+        self.horarios = {}
+        self.secciones = {}
+        self.matriz = None
+        self.horariosfinales = []
+        self.materiasquechocan = []
+
+    def cargar_horario(self,id:int):
+        """
+            Carga el horario general ya indexado desde la cache del proceso
+        """
+        self.cargar_matriz(id)
+
+    def cargar_secciones(self,id:int,codigos:list):
+        """
+            Carga de la base de datos solo las secciones de las materias en juego
+        """
+        self.secciones = obtener_secciones_horario(id, codigos)
+        self.matriz = None
+
+    def cargar_matriz(self,id:int):
+        """
+            Usa la matriz de choques ya calculada para la version actual del horario general
+        """
+        self.matriz = obtener_matriz_choques(id)
+        self.secciones = self.matriz.secciones
+
+    def obtener_matriz(self)->horario_secciones.MatrizChoques:
+        if self.matriz is None:
+            self.matriz = horario_secciones.MatrizChoques(self.secciones)
+        return self.matriz
+
+    def comprobar_combinacion_horario(self,combinacion:list,limite:int=None):
+        """
+            Busca los horarios sin choques de una combinacion de materias y arma la cuadricula
+            de cada uno.
+
+            :parametro combinacion: materias de la combinacion
+            :tipo de parametro combinacion: list
+            :parametro limite: cantidad maxima de horarios a devolver
+            :tipo de parametro limite: int
+            :return: lista de cuadriculas, o False si ninguna asignacion de secciones funciona
+        """
+        for horario in itertools.islice(self.find_all_horarios(combinacion), limite):
+            self.horariosfinales.append(self.estado_horario(horario))
         if len(self.horariosfinales)==0:
             return False
         return self.horariosfinales
 
+    def find_all_horarios(self,combinacion:list):
+        """
+            Genera de forma perezosa las asignaciones de secciones sin choques de la
+            combinacion. Es una busqueda en profundidad que coloca una materia a la vez,
+            empezando por las que tienen menos secciones, y retrocede en cuanto una materia
+            pendiente se queda sin secciones compatibles segun la matriz de choques.
 
-    def find_all_horarios(self,horario_base, tamanio ,all_materias_secciones):
-        print('Entro en find_all_horarios')
-        new_horario = horario_base
-        all_horarios = []
-        all_horarios.append(new_horario.copy())
-        total_combinaciones = 1
-        print(all_materias_secciones)
-        print('antes del for en find_all_horarios')
-        for i in range(len(all_materias_secciones)):
-            print('estamos en el range de all_materias_secciones:',i)
-            total_combinaciones = total_combinaciones * len(all_materias_secciones[i])
-        self.tamanio_new_combinacion = tamanio
-        print('total_combinaciones: ',total_combinaciones)
-        for i in range(total_combinaciones-1):
-            print('estamos en el range de total_combinaciones:',i)
-            new_horario = self.new_horario(new_horario, tamanio, all_materias_secciones,i)
-            all_horarios.append(new_horario.copy())
-            self.tamanio_new_combinacion -=1
-        print('Salimos de find_all_horarios este es el tamano de all_horarios: ',len(all_horarios))
-        #print('\n','\n',all_horarios,'\n','\n')
-        for indice,cuerpo1 in enumerate(all_horarios):
-            print('Combinacion----------------')
-            for indice2,cuerpo2 in enumerate(cuerpo1):
-                print(cuerpo2['seccion'])
-                print('-----------------------------------')
-        return all_horarios
-
-    def new_horario(self,old_horario, tamanio , all_materias_secciones,i):
-        #print('Ya en new_horario')
-        new_horario = old_horario
-        posicion = tamanio #posicion de la seccion a remplazar
-        posicion_seccion_superior = 0 #para remplazar la seccion actual 
-        estado=False #para comprobar si el horario en la posicion ya no puede subir posicion
-        #print('all_materias_secciones:\n',all_materias_secciones)
-        posicion_seccion=0
-        while(estado == False):
-            #print('Esta es posicion: ',posicion,'Esta es estado: ',estado)
-            posicion -=1
-            if posicion == -1:
-                print(posicion)
-                print(len(all_materias_secciones)-1,len(all_materias_secciones)-1-1)
-                posicion_seccion = (len(all_materias_secciones[posicion])- 1)
-                posicion_seccion -=1
-            else:
-                posicion_seccion = (len(all_materias_secciones[posicion])- 1)
-            ##print(posicion)
-            print(all_materias_secciones[posicion][posicion_seccion])
-            print(old_horario[posicion])
-            if len(all_materias_secciones[posicion])>2:
-                print(all_materias_secciones[posicion].index(new_horario[posicion]))
-                posicion_seccion = all_materias_secciones[posicion].index(new_horario[posicion])
-                estado = True if (all_materias_secciones[posicion][posicion_seccion]['seccion'] != old_horario[posicion]['seccion']) else False
-                posicion_seccion-=1
-            else:
-                estado = True if (all_materias_secciones[posicion][posicion_seccion]['seccion'] != old_horario[posicion]['seccion']) else False
-            #print('Esta es estado: ',estado)
-        #print('Esta es posicion: ',posicion,'Esta es estado: ',estado)
-        #print(all_materias_secciones[posicion])
-        #print(all_materias_secciones[posicion][posicion_seccion],'\n',old_horario[posicion]['seccion'])
-        #print(all_materias_secciones[posicion].index(all_materias_secciones[posicion][posicion_seccion]) +1)
-        #print('hola')
-        print(posicion)
-        posicion_seccion_superior = all_materias_secciones[posicion].index(all_materias_secciones[posicion][posicion_seccion]) + 1
-        #print(posicion_seccion_superior)
-        new_horario[posicion] = all_materias_secciones[posicion][posicion_seccion_superior-1]
-        #print(new_horario[posicion])
-        #print('tamanio de all_materias_secciones----------',len(all_materias_secciones),'el tamanio de old_horario: ',len(old_horario),old_horario)
-
-        #las posiciones posteriores se llenan con la primera opcion
-        for i in range(posicion+1,tamanio):
-            if len(all_materias_secciones[i])>2:    
-                print('--------------- Ah cambiar esa materia   --------:')
-                print(new_horario[i])
-                print(all_materias_secciones[i])
-                seccion_arriba = all_materias_secciones[i].index(new_horario[i])-1
-                new_horario[i] = all_materias_secciones[i][seccion_arriba]
-            else:
-                new_horario[i] = all_materias_secciones[i][0]
-        print(new_horario)
-        return new_horario
+            :return: generador de listas {'codigo','materia','creditos','seccion'} en el orden
+                de la combinacion
+        """
+        for asignacion in self.obtener_matriz().asignaciones([materia['codigo'] for materia in combinacion]):
+            yield [
+                {
+                    'codigo': materia['codigo'],
+                    'materia': materia['materia'],
+                    'creditos': materia['creditos'],
+                    'seccion': seccion.seccion
+                }
+                for materia, seccion in zip(combinacion, asignacion)
+            ]
+
+    def filtrar_horarios(self,horarios:list)->list:
+        """
+            Conserva de un lote de horarios candidatos de una misma combinacion los que no
+            tienen choques, en una sola pasada vectorizada sobre la matriz de choques
+
+            :parametro horarios: listas de {'codigo','seccion'} con el mismo numero de materias
+            :tipo de parametro horarios: list
+            :return: los horarios sin choques, en el mismo orden
+        """
+        matriz = self.obtener_matriz()
+        conocidos = [
+            horario for horario in horarios
+            if all((materia['codigo'], materia['seccion']) in matriz.indice for materia in horario)
+        ]
+        if len(conocidos) == 0:
+            return []
+        asignaciones = numpy.array([
+            [matriz.indice[(materia['codigo'], materia['seccion'])] for materia in horario]
+            for horario in conocidos
+        ], dtype=numpy.int64)
+        validas = matriz.filtrar_lote(asignaciones)
+        return [horario for horario, valida in zip(conocidos, validas) if valida]
 
     def comprobar_posible_horario(self,combinacion:list)->bool:
+        """
+            Comprueba que las secciones elegidas no choquen entre si acumulando las mascaras
+            de bloques de cada seccion; un choque se guarda en materiasquechocan.
+        """
         if(self.comprueba_existencia_de_choque(combinacion))==True: 
             return False
-        self.estadohorario = []
-        for i in range(5):
-            self.estadohorario.append([])
-            for j in range(34):
-                self.estadohorario[i].append({
-                                                'estado': False,
-                                                'materia': '',
-                                                'codigo': '',
-                                                'creditos': '',
-                                                'seccion': '',
-                                                'dia': '',
-                                                'desde': '',
-                                                'hasta': '',
-                                                'aula': '',
-                                                'profesor': ''})
-        for indice,materia in enumerate(combinacion):
-            HorarioMateria = []
-            diasClase = []
-            for i,horario in enumerate(self.horarios):
-                if self.horarios[horario]['codigo'] == materia['codigo']:
-                    HorarioMateria.append(self.horarios[horario])
-            for i,h in enumerate(HorarioMateria):
-                if h['seccion'] == materia['seccion']:
-                    diasClase.append(h)
-            for i, dia in enumerate(diasClase):
-                DIA = self.dia(dia['dia'])
-                DESDE = self.desde(dia['desde'])
-                HASTA = self.hasta(dia['hasta'])
-                a=DESDE
-                while (a<=HASTA):
-                    if self.estadohorario[DIA][a]['estado']==True:
-                        choque = {
-                                  'materia1':{
-                                                'codigo': dia['codigo'],
-                                                'seccion': dia['seccion']
-                                  },
-                                  'materia2':{
-                                                'codigo': self.estadohorario[DIA][i]['codigo'],
-                                                'seccion': self.estadohorario[DIA][i]['seccion']
-                                  }
-                                }
-                        self.materiasquechocan.append(choque)
-                        return False
-                    else:
-                        self.estadohorario[DIA][a]={
-                                                      'estado': True,
-                                                      'materia': dia['materia'],
-                                                      'codigo': dia['codigo'],
-                                                      'creditos': materia['creditos'],
-                                                      'seccion': dia['seccion'],
-                                                      'dia': dia['dia'],
-                                                      'desde': dia['desde'],
-                                                      'hasta': dia['hasta'],
-                                                      'aula': dia['aula'],
-                                                      'profesor': dia['profesor']
-                                                    }
-                    a+=1
+        ocupado = 0
+        elegidas = []
+        for materia in combinacion:
+            seccion = self.secciones.get(materia['codigo'], {}).get(materia['seccion'])
+            if seccion is None:
+                continue
+            if ocupado & seccion.mascara:
+                anterior = next(elegida for elegida in elegidas if elegida.choca_con(seccion))
+                self.materiasquechocan.append({
+                    'materia1':{
+                                'codigo': seccion.codigo,
+                                'seccion': seccion.seccion
+                    },
+                    'materia2':{
+                                'codigo': anterior.codigo,
+                                'seccion': anterior.seccion
+                    }
+                })
+                return False
+            ocupado |= seccion.mascara
+            elegidas.append(seccion)
         return True
 
+    def estado_horario(self,combinacion:list)->list:
+        """
+            Cuadricula detallada de 5 dias por 34 bloques de una combinacion de secciones que
+            ya paso comprobar_posible_horario
+        """
+        asignacion = []
+        for materia in combinacion:
+            seccion = self.secciones.get(materia['codigo'], {}).get(materia['seccion'])
+            if seccion is not None:
+                asignacion.append((materia['creditos'], seccion))
+        return horario_secciones.construir_cuadricula(asignacion)
+
     def comprueba_existencia_de_choque(self,combinacion:list)->bool:
-        for  indice,choqueGuardado in enumerate(self.materiasquechocan):
-            for indice2,materia in enumerate(combinacion):
-                if materia['codigo'] == choqueGuardado['materia1']['codigo'] and materia['seccion'] == choqueGuardado['materia1']['seccion']:
-                    if materia['codigo'] == choqueGuardado['materia2']['codigo'] and materia['seccion'] == choqueGuardado['materia2']['seccion']:
-                        return True
-        #print('Salimos de compruebaExistenciaDeChoque')
+        elegidas = {(materia['codigo'], materia['seccion']) for materia in combinacion}
+        for choqueGuardado in self.materiasquechocan:
+            if (choqueGuardado['materia1']['codigo'], choqueGuardado['materia1']['seccion']) in elegidas:
+                if (choqueGuardado['materia2']['codigo'], choqueGuardado['materia2']['seccion']) in elegidas:
+                    return True
         return False
 
-    def dia(self,dia:str):
-        #print('Entro en dia')
-        DIA:int
-        if dia == 'Lun':
-            DIA = 0
-        elif dia == 'Mar':
-            DIA = 1
-        elif dia == 'Mie':
-            DIA = 2
-        elif dia == 'Jue':
-            DIA = 3
-        else:
-            DIA = 4
-        return DIA
-
-    def desde(self,desde:str):
-        #print('entro en desde')
-        DESDE:int
-        if desde == '07:00':
-            DESDE = 0
-        elif desde == '07:50':
-            DESDE = 1
-        elif desde == '08:35':
-            DESDE = 2 
-        elif desde == '08:40':
-            DESDE = 3
-        elif desde == '09:25':
-            DESDE = 4 
-        elif desde == '09:30':
-            DESDE = 5
-        elif desde == '10:15':
-            DESDE = 6 
-        elif desde == '10:20':
-            DESDE = 7
-        elif desde == '11:05':
-            DESDE = 8 
-        elif desde == '11:10':
-            DESDE = 9
-        elif desde == '11:55':
-            DESDE = 10 
-        elif desde == '12:00':
-            DESDE = 11
-        elif desde == '12:45':
-            DESDE = 12 
-        elif desde == '12:50':
-            DESDE = 13
-        elif desde == '13:35':
-            DESDE = 14 
-        elif desde == '13:40':
-            DESDE = 15
-        elif desde == '14:00':
-            DESDE = 16 
-        elif desde == '14:25':
-            DESDE = 17
-        elif desde == '14:35':
-            DESDE = 18
-        elif desde == '14:45':
-            DESDE = 19 
-        elif desde == '14:50':
-            DESDE = 20
-        elif desde == '15:15':
-            DESDE = 21 
-        elif desde == '15:20':
-            DESDE = 22
-        elif desde == '15:35':
-            DESDE = 23  
-        elif desde == '15:40':
-            DESDE = 24
-        elif desde == '16:05':
-            DESDE = 25 
-        elif desde == '16:25':
-            DESDE = 26
-        elif desde == '16:30':
-            DESDE = 27 
-        elif desde == '16:55':
-            DESDE = 28
-        elif desde == '17:15':
-            DESDE = 29 
-        elif desde == '17:20':
-            DESDE = 30
-        elif desde == '18:05':
-            DESDE = 31 
-        elif desde == '18:55':
-            DESDE = 32
-        else:
-            DESDE = 33
-            #print('Hora no determinada en Desde',desde)
-        return DESDE
-
-    def hasta(self,hasta:str):
-        HASTA:int
-        if hasta == '07:00':
-            HASTA = 0
-        elif hasta == '07:50':
-            HASTA = 1
-        elif hasta == '08:35':
-            HASTA = 2 
-        elif hasta == '08:40':
-            HASTA = 3
-        elif hasta == '09:25':
-            HASTA = 4 
-        elif hasta == '09:30':
-            HASTA = 5
-        elif hasta == '10:15':
-            HASTA = 6 
-        elif hasta == '10:20':
-            HASTA = 7
-        elif hasta == '11:05':
-            HASTA = 8 
-        elif hasta == '11:10':
-            HASTA = 9
-        elif hasta == '11:55':
-            HASTA = 10 
-        elif hasta == '12:00':
-            HASTA = 11
-        elif hasta == '12:45':
-            HASTA = 12 
-        elif hasta == '12:50':
-            HASTA = 13
-        elif hasta == '13:35':
-            HASTA = 14 
-        elif hasta == '13:40':
-            HASTA = 15
-        elif hasta == '14:00':
-            HASTA = 16 
-        elif hasta == '14:25':
-            HASTA = 17
-        elif hasta == '14:35':
-            HASTA = 18
-        elif hasta == '14:45':
-            HASTA = 19 
-        elif hasta == '14:50':
-            HASTA = 20
-        elif hasta == '15:15':
-            HASTA = 21 
-        elif hasta == '15:20':
-            HASTA = 22
-        elif hasta == '15:35':
-            HASTA = 23  
-        elif hasta == '15:40':
-            HASTA = 24
-        elif hasta == '16:05':
-            HASTA = 25 
-        elif hasta == '16:25':
-            HASTA = 26
-        elif hasta == '16:30':
-            HASTA = 27 
-        elif hasta == '16:55':
-            HASTA = 28
-        elif hasta == '17:15':
-            HASTA = 29 
-        elif hasta == '17:20':
-            HASTA = 30
-        elif hasta == '18:05':
-            HASTA = 31 
-        elif hasta == '18:55':
-            HASTA = 32
-        else:
-            HASTA = 33
-            #print('Hora no determinada en hasta',hasta)
-        return HASTA
\ No newline at end of file
+    def dia(self,dia:str)->int:
+        return horario_secciones.indice_dia(dia)
+
+    def desde(self,desde:str)->int:
+        return horario_secciones.indice_hora(desde)
+
+    def hasta(self,hasta:str)->int:
+        return horario_secciones.indice_hora(hasta)
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from apps.horario import models as horario_models
+from apps.horario import services as horario_services
+
+"""
+	Mantiene al dia las caches que dependen de los horarios generales de cada carrera.
+"""
+
+@receiver(pre_save, sender=horario_models.HorarioGeneral)
+def horario_general_por_cambiar(sender, instance, **kwargs):
+    """
+        Si el horario cambia de carrera, la carrera anterior tambien pierde sus resultados
+    """
+    if instance.pk is None:
+        return
+    anterior = sender.objects.filter(pk=instance.pk).values_list('carrera', flat=True).first()
+    if anterior is not None and anterior != instance.carrera:
+        horario_services.invalidar_generaciones(anterior)
+
+@receiver(post_save, sender=horario_models.HorarioGeneral)
+@receiver(post_delete, sender=horario_models.HorarioGeneral)
+def horario_general_cambiado(sender, instance, **kwargs):
+    horario_services.descartar_horario_indexado(instance.id)
+    if instance.carrera is not None:
+        horario_services.invalidar_generaciones(instance.carrera)
@@ -0,0 +1,10 @@
+from celery import shared_task
+
+from apps.horario import services as horario_services
+
+@shared_task
+def generar_horario_particular(id:int):
+    """
+        Tarea de Celery que ejecuta un trabajo de generacion de horarios
+    """
+    horario_services.ejecutar_trabajo_generacion(id)
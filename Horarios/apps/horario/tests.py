@@ -1,3 +1,702 @@
-from django.test import TestCase
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import itertools
+import json
+import tracemalloc
 
-# Create your tests here.
+from Horarios.celery import app as celery_app
+from apps.horario import medicion as horario_medicion
+from apps.horario import models as horario_models
+from apps.horario.benchmarks import escenarios as horario_escenarios
+from apps.horario.benchmarks import generadores as horario_generadores
+from apps.horario import pensums as horario_pensums
+from apps.horario import secciones as horario_secciones
+from apps.horario import services as horario_services
+from apps.horario import tasks as horario_tasks
+from apps.horario import validations as horario_validations
+
+def crear_peticion(carrera:str, semestres:tuple, minimo:int=10, limite:int=18, aprobados:int=80)->dict:
+    """
+        Arma una peticion de generacion con las materias de los semestres indicados
+        y la primera electiva del pensum como electiva elegida.
+    """
+    peticion = {"0": {"minimoCreditos": minimo, "limiteCreditos": limite, "creditosaprobados": aprobados, "carrera": carrera}}
+    pensum = horario_pensums.obtener_pensum(carrera)
+    materias = [materia for materia in pensum if materia['semestre'] in semestres]
+    materias.append(next(materia for materia in pensum if materia['semestre'] == 99))
+    for indice, materia in enumerate(materias, 1):
+        peticion[str(indice)] = {
+            'materia': materia['materia'],
+            'codigo': materia['codigo'],
+            'aprobada': 'false',
+            'creditos': materia['creditos'],
+            'presedentes': dict(materia['presedentes']),
+            'semestre': materia['semestre'],
+            'elejible': 'true' if materia['semestre'] == 99 else 'false',
+        }
+    return peticion
+
+def resumir(resultado)->list:
+    return [([materia['codigo'] for materia in item['combinacion']], item['puntaje']) for item in resultado]
+
+class GeneracionConcurrenteTest(SimpleTestCase):
+
+    peticiones = [
+        ('sistemas', (5,)),
+        ('petroleo', (4, 5)),
+        ('administracion', (6, 7)),
+        ('agronomia', (4,)),
+    ]
+
+    def generar(self, indice:int)->list:
+        carrera, semestres = self.peticiones[indice]
+        return resumir(horario_services.iniciate(crear_peticion(carrera, semestres)))
+
+    def test_hilos_obtienen_resultados_aislados(self):
+        esperados = [self.generar(i) for i in range(len(self.peticiones))]
+        indices = [i % len(self.peticiones) for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as hilos:
+            obtenidos = list(hilos.map(self.generar, indices))
+        for indice, obtenido in zip(indices, obtenidos):
+            self.assertEqual(obtenido, esperados[indice])
+        self.assertTrue(all(len(esperado) > 0 for esperado in esperados))
+
+    def test_memoria_estable_entre_peticiones(self):
+        def lote():
+            with ThreadPoolExecutor(max_workers=4) as hilos:
+                list(hilos.map(self.generar, range(len(self.peticiones))))
+        lote()
+        tracemalloc.start()
+        try:
+            lote()
+            despues_del_primero = tracemalloc.get_traced_memory()[0]
+            for _ in range(4):
+                lote()
+            despues_de_cinco = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(despues_de_cinco - despues_del_primero, 256 * 1024)
+
+class TrabajoGeneracionTest(TestCase):
+
+    def setUp(self):
+        self.cliente = APIClient()
+        self.eager = celery_app.conf.task_always_eager
+        celery_app.conf.update(CELERY_TASK_ALWAYS_EAGER=True)
+
+    def tearDown(self):
+        celery_app.conf.update(CELERY_TASK_ALWAYS_EAGER=self.eager)
+
+    def test_trabajo_termina_con_el_mismo_resultado_que_la_generacion_sincrona(self):
+        peticion = crear_peticion('sistemas', (5,))
+        respuesta = self.cliente.post('/api/horario/particular/generar/trabajo/?top_k=5', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 202)
+        id = respuesta.data['id']
+        estado = self.cliente.get('/api/horario/particular/generar/trabajo/%d' % id)
+        self.assertEqual(estado.data['estado'], 'terminado')
+        resultado = self.cliente.get('/api/horario/particular/generar/trabajo/%d/resultado' % id)
+        self.assertEqual(resultado.status_code, 200)
+        sincrono = self.cliente.post('/api/horario/particular/generar/?top_k=5', peticion, format='json')
+        self.assertEqual(resultado.data, sincrono.data)
+
+    def test_trabajo_con_error_queda_registrado(self):
+        peticion = crear_peticion('sistemas', (5,))
+        peticion['1']['creditos'] = 'tres'
+        respuesta = self.cliente.post('/api/horario/particular/generar/trabajo/', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 202)
+        estado = self.cliente.get('/api/horario/particular/generar/trabajo/%d' % respuesta.data['id'])
+        self.assertEqual(estado.data['estado'], 'error')
+        resultado = self.cliente.get('/api/horario/particular/generar/trabajo/%d/resultado' % respuesta.data['id'])
+        self.assertEqual(resultado.status_code, 400)
+
+    def test_trabajo_que_no_se_pudo_encolar_queda_en_error(self):
+        peticion = crear_peticion('sistemas', (5,))
+        with mock.patch.object(horario_tasks.generar_horario_particular, 'delay', side_effect=ConnectionError('broker caido')):
+            respuesta = self.cliente.post('/api/horario/particular/generar/trabajo/', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 500)
+        estado = self.cliente.get('/api/horario/particular/generar/trabajo/%d' % respuesta.data['id'])
+        self.assertEqual(estado.data['estado'], 'error')
+        resultado = self.cliente.get('/api/horario/particular/generar/trabajo/%d/resultado' % respuesta.data['id'])
+        self.assertIn('broker caido', resultado.data['detail'])
+
+    def test_carrera_invalida_no_registra_trabajo(self):
+        peticion = crear_peticion('sistemas', (5,))
+        peticion['0']['carrera'] = 'medicina'
+        respuesta = self.cliente.post('/api/horario/particular/generar/trabajo/', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 400)
+
+class CacheGeneracionTest(TestCase):
+
+    def setUp(self):
+        caches['generacion'].clear()
+
+    def test_peticiones_equivalentes_comparten_entrada(self):
+        peticion = crear_peticion('sistemas', (5,))
+        materias = [peticion[clave] for clave in sorted(peticion, key=int) if clave != "0"]
+        reordenada = {"0": dict(peticion["0"], carrera='SISTEMAS')}
+        for indice, materia in enumerate(reversed(materias), 1):
+            reordenada[str(indice)] = materia
+        clave = horario_services.huella_peticion(horario_services.normalizar_peticion(peticion), 5)
+        self.assertEqual(clave, horario_services.huella_peticion(horario_services.normalizar_peticion(reordenada), 5))
+        primero = horario_services.generar_horario_particular(peticion, 5)
+        self.assertEqual(caches['generacion'].get('generacion:%s' % clave), primero)
+        self.assertEqual(horario_services.generar_horario_particular(reordenada, '5'), primero)
+
+    @override_settings(HORARIO_CACHE_GENERACION_MAXIMO=50)
+    def test_resultados_grandes_no_se_guardan(self):
+        peticion = crear_peticion('sistemas', (5,))
+        completo = horario_services.generar_horario_particular(peticion)
+        self.assertTrue(len(completo) > 50)
+        self.assertIsNone(caches['generacion'].get('generacion:%s' % horario_services.huella_peticion(horario_services.normalizar_peticion(peticion))))
+        mejores = horario_services.generar_horario_particular(peticion, 5)
+        self.assertEqual(caches['generacion'].get('generacion:%s' % horario_services.huella_peticion(horario_services.normalizar_peticion(peticion), 5)), mejores)
+
+    def test_cambio_de_horario_general_invalida(self):
+        peticion = horario_services.normalizar_peticion(crear_peticion('sistemas', (5,)))
+        antes = horario_services.huella_peticion(peticion)
+        otra = horario_services.huella_peticion(horario_services.normalizar_peticion(crear_peticion('petroleo', (5,))))
+        horario = horario_models.HorarioGeneral.objects.create(carrera='sistemas', horario={})
+        despues = horario_services.huella_peticion(peticion)
+        self.assertNotEqual(antes, despues)
+        horario.delete()
+        self.assertNotEqual(despues, horario_services.huella_peticion(peticion))
+        self.assertEqual(otra, horario_services.huella_peticion(horario_services.normalizar_peticion(crear_peticion('petroleo', (5,)))))
+
+    def test_edicion_del_horario_usado_invalida_sin_senales(self):
+        # Otro worker no recibe las señales del proceso que edito: la huella debe cambiar
+        # solo por la version guardada en la base de datos
+        horario = horario_models.HorarioGeneral.objects.create(carrera='petroleo', horario={})
+        peticion = crear_peticion('sistemas', (5,))
+        peticion["0"]['horario'] = horario.id
+        peticion = horario_services.normalizar_peticion(peticion)
+        antes = horario_services.huella_peticion(peticion)
+        caches['generacion'].clear()
+        self.assertEqual(horario_services.huella_peticion(peticion), antes)
+        horario_models.HorarioGeneral.objects.filter(id=horario.id).update(version=2)
+        self.assertNotEqual(horario_services.huella_peticion(peticion), antes)
+        peticion["0"]['horario'] = horario.id + 1
+        with self.assertRaisesMessage(ValueError, 'no existe'):
+            horario_services.huella_peticion(peticion)
+
+    def test_medicion_en_server_timing_y_meta(self):
+        cliente = APIClient()
+        peticion = crear_peticion('sistemas', (5,))
+        sin_meta = cliente.post('/api/horario/particular/generar/', peticion, format='json')
+        self.assertNotIn('Server-Timing', sin_meta)
+        respuesta = cliente.post('/api/horario/particular/generar/?meta=1', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 200)
+        cuerpo = respuesta.json()
+        self.assertEqual(cuerpo['resultados'], sin_meta.json())
+        self.assertEqual(cuerpo['meta']['contadores']['cache_aciertos'], 1)
+        self.assertIn('serializacion;dur=', respuesta['Server-Timing'])
+        caches['generacion'].clear()
+        contadores = cliente.post('/api/horario/particular/generar/?meta=1', peticion, format='json').json()['meta']['contadores']
+        self.assertEqual(contadores['cache_aciertos'], 0)
+        self.assertEqual(contadores['puntuadas'], len(cuerpo['resultados']))
+        self.assertGreater(contadores['visitadas'], contadores['puntuadas'])
+
+    def test_generacion_en_flujo_ndjson(self):
+        cliente = APIClient()
+        peticion = crear_peticion('sistemas', (5,))
+        clave = 'generacion:%s' % horario_services.huella_peticion(horario_services.normalizar_peticion(peticion))
+        parcial = horario_services.generar_horario_particular_en_flujo(peticion)
+        next(parcial)
+        parcial.close()
+        self.assertIsNone(caches['generacion'].get(clave))
+        respuesta = cliente.post('/api/horario/particular/generar/?meta=1', peticion, format='json', HTTP_ACCEPT='application/x-ndjson')
+        self.assertTrue(respuesta.streaming)
+        self.assertEqual(respuesta['Content-Type'], 'application/x-ndjson')
+        lineas = [json.loads(linea) for linea in b''.join(respuesta.streaming_content).splitlines()]
+        self.assertIn('meta', lineas[-1])
+        self.assertEqual(lineas[:-1], caches['generacion'].get(clave))
+        self.assertEqual(lineas[:-1], cliente.post('/api/horario/particular/generar/', peticion, format='json').json())
+        error = cliente.post('/api/horario/particular/generar/?top_k=0', peticion, format='json', HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(error.status_code, 400)
+        self.assertIn('detail', json.loads(error.content))
+
+    @override_settings(HORARIO_CACHE_GENERACION_MAXIMO=50)
+    def test_flujo_grande_no_se_acumula_ni_se_guarda(self):
+        peticion = crear_peticion('sistemas', (5, 6))
+        respuesta = APIClient().post('/api/horario/particular/generar/', peticion, format='json', HTTP_ACCEPT='application/x-ndjson')
+        self.assertTrue(len(b''.join(respuesta.streaming_content).splitlines()) > 50)
+        self.assertIsNone(caches['generacion'].get('generacion:%s' % horario_services.huella_peticion(horario_services.normalizar_peticion(peticion))))
+        # Cada resultado ocupa 1 KB: acumular los 20000 pasaria de 20 MB
+        resultados = ({'puntaje': i, 'relleno': bytes(1024)} for i in range(20000))
+        tracemalloc.start()
+        try:
+            for _ in horario_services.guardar_al_terminar('generacion:prueba', resultados):
+                pass
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(pico, 1024 * 1024)
+        self.assertIsNone(caches['generacion'].get('generacion:prueba'))
+
+    def test_formato_compacto(self):
+        cliente = APIClient()
+        peticion = crear_peticion('sistemas', (5,))
+        completo = cliente.post('/api/horario/particular/generar/', peticion, format='json').json()
+        compacto = cliente.post('/api/horario/particular/generar/?formato=compacto', peticion, format='json').json()
+        self.assertEqual(len(compacto['materias']), len({materia['codigo'] for item in completo for materia in item['combinacion']}))
+        self.assertEqual(completo, [
+            {'combinacion': [compacto['materias'][i] for i in item['combinacion']], 'puntaje': item['puntaje']}
+            for item in compacto['combinaciones']
+        ])
+        respuesta = cliente.post('/api/horario/particular/generar/?formato=compacto', peticion, format='json', HTTP_ACCEPT='application/x-ndjson')
+        materias = []
+        combinaciones = []
+        for linea in b''.join(respuesta.streaming_content).splitlines():
+            linea = json.loads(linea)
+            if 'materias' in linea:
+                materias.extend(linea['materias'])
+            else:
+                combinaciones.append({'combinacion': [materias[i] for i in linea['combinacion']], 'puntaje': linea['puntaje']})
+        self.assertEqual(combinaciones, completo)
+        self.assertEqual(cliente.post('/api/horario/particular/generar/?formato=otro', peticion, format='json').status_code, 400)
+
+class EnumeracionTest(SimpleTestCase):
+
+    carrera = 'enumeracion-prueba'
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.materias = horario_generadores.generar_pensum(40, densidad=0.6, electivas=6, semilla=11)
+        horario_pensums.registrar_pensum(cls.carrera, cls.materias)
+
+    def peticiones(self):
+        """
+            Peticiones al azar sobre el pensum sintetico, con distintos limites de creditos
+            y cantidad de electivas elegidas
+        """
+        for semilla in range(8):
+            yield horario_generadores.generar_peticion(self.carrera, self.materias, 12, semilla,
+                minimo=6 + semilla, limite=12 + semilla, electivas=semilla % 3)
+
+    def fuerza_bruta(self, peticion:dict)->set:
+        """
+            Todas las combinaciones de la peticion que respetan los limites de creditos y
+            llevan tantas electivas como electivas elegidas, probando cada subconjunto
+        """
+        datos = peticion["0"]
+        materias = [materia for clave, materia in peticion.items() if clave != "0"]
+        requeridas = sum(1 for materia in materias if materia['semestre'] in (99, 88) and materia['elejible'] == 'true')
+        combinaciones = set()
+        for tamanio in range(1, len(materias) + 1):
+            for grupo in itertools.combinations(materias, tamanio):
+                creditos = sum(materia['creditos'] for materia in grupo)
+                electivas = sum(1 for materia in grupo if materia['semestre'] in (99, 88, 77))
+                if datos['minimoCreditos'] <= creditos <= datos['limiteCreditos'] and electivas == requeridas:
+                    combinaciones.add(frozenset(materia['codigo'] for materia in grupo))
+        return combinaciones
+
+    def test_ramificacion_y_poda_equivale_a_fuerza_bruta(self):
+        for peticion in self.peticiones():
+            pensum = horario_services.Pensum(peticion)
+            combinaciones = [pensum.materializar(mascara) for mascara in pensum.generarTodasPosibilidades()]
+            encontradas = [frozenset(materia['codigo'] for materia in combinacion) for combinacion in combinaciones]
+            self.assertEqual(len(encontradas), len(set(encontradas)))
+            self.assertEqual(set(encontradas), self.fuerza_bruta(peticion))
+            tamanios = [len(combinacion) for combinacion in combinaciones]
+            self.assertEqual(tamanios, sorted(tamanios, reverse=True))
+
+    def test_top_k_equivale_a_ordenar_la_enumeracion_completa(self):
+        for peticion in itertools.chain(self.peticiones(), [crear_peticion('sistemas', (5,)), crear_peticion('petroleo', (4, 5))]):
+            completa = resumir(horario_services.iniciate(peticion, por_lotes=False))
+            ordenada = sorted(completa, key=lambda item: -item[1])
+            self.assertGreaterEqual(horario_services.Pensum(peticion).estimar_combinaciones(), len(completa))
+            for top_k in (1, 5, 20):
+                self.assertEqual(resumir(horario_services.iniciate(peticion, top_k=top_k)), ordenada[:top_k])
+                with override_settings(HORARIO_TOP_K_MAXIMO_LOTES=0):
+                    self.assertEqual(resumir(horario_services.iniciate(peticion, top_k=top_k)), ordenada[:top_k])
+
+    def test_puntuacion_por_lotes_equivale_a_una_por_una(self):
+        peticiones = list(self.peticiones()) + [crear_peticion('sistemas', (5, 6)), crear_peticion('administracion', (6, 7))]
+        for peticion in peticiones:
+            una_por_una = resumir(horario_services.iniciate(peticion, por_lotes=False, procesos=0))
+            self.assertEqual(resumir(horario_services.iniciate(peticion, por_lotes=True, procesos=0)), una_por_una)
+            pensum = horario_services.Pensum(peticion)
+            # Lotes chicos para que la peticion ocupe varios y el ultimo quede incompleto
+            lotes = [(mascara, puntaje) for mascara, puntaje in pensum.puntuar_por_lotes(pensum.generarTodasPosibilidades(), 7)]
+            self.assertEqual([puntaje for _, puntaje in lotes], [puntaje for _, puntaje in una_por_una])
+
+class PensumCompiladoTest(SimpleTestCase):
+
+    carrera = 'pensum-a-mano'
+
+    def materia(self, codigo:str, semestre:int, p1:str='', p2:str='')->dict:
+        return {'codigo': codigo, 'materia': codigo, 'creditos': 3, 'semestre': semestre, 'presedentes': {'p1': p1, 'p2': p2}}
+
+    def setUp(self):
+        # C y F tienen un solo precedente, D y E piden dos, G es una electiva
+        self.materias = [
+            self.materia('A', 1), self.materia('B', 1),
+            self.materia('C', 2, 'A'), self.materia('D', 2, 'A', 'B'),
+            self.materia('E', 3, 'C', 'D'), self.materia('F', 3, 'C'),
+            self.materia('G', 99, 'B'),
+        ]
+        self.pensum = horario_pensums.registrar_pensum(self.carrera, self.materias)
+
+    def codigos(self, mascara_materias:int)->list:
+        return [materia['codigo'] for materia in self.pensum.materializar(mascara_materias)]
+
+    def test_indice_de_prerrequisitos(self):
+        self.assertEqual(self.pensum.hijos_simples, [0b0000100, 0b1000000, 0b0100000, 0, 0, 0, 0])
+        self.assertEqual(self.pensum.pares, [[(0b0011, 0b0001000)], [(0b0011, 0b0001000)], [(0b1100, 0b0010000)], [(0b1100, 0b0010000)], [], [], []])
+        self.assertEqual(self.pensum.mascara_electivas, 0b1000000)
+
+    def test_oleadas_de_desbloqueo(self):
+        desbloqueadas = self.pensum.desbloqueadas(self.pensum.mascara_codigos(['A', 'B']))
+        self.assertEqual(self.codigos(desbloqueadas), ['C', 'D', 'E', 'F', 'G'])
+        self.assertEqual(self.pensum.peso(desbloqueadas), 4.5)
+        self.assertEqual(self.codigos(self.pensum.desbloqueadas(self.pensum.mascara_codigos(['A']))), ['C', 'F'])
+        # E pide C y D en la misma oleada: con A y D, C llega una oleada despues que D
+        medicion = horario_medicion.Medicion()
+        mascara = self.pensum.mascara_codigos(['A', 'D', 'X'])
+        self.assertEqual(self.codigos(self.pensum.desbloqueadas(mascara, medicion)), ['C', 'F'])
+        self.assertEqual(medicion.contadores['oleadas_desbloqueo'], 3)
+        self.assertEqual(self.codigos(self.pensum.cierre(mascara)), ['C', 'E', 'F'])
+
+    def test_secuencia_desbloqueo_de_una_combinacion(self):
+        peticion = {"0": {"minimoCreditos": 3, "limiteCreditos": 6, "creditosaprobados": 0, "carrera": self.carrera}}
+        for indice, materia in enumerate(self.materias[:2], 1):
+            peticion[str(indice)] = dict(materia, creditos=2 + indice, aprobada='false', elejible='false')
+        pensum = horario_services.Pensum(peticion)
+        pensum.indexar_materias()
+        self.assertEqual([materia['codigo'] for materia in pensum.secuencia_desbloqueo(0b11)], ['C', 'D', 'E', 'F', 'G'])
+        self.assertEqual([materia['codigo'] for materia in pensum.secuencia_desbloqueo(0b10)], ['G'])
+        self.assertEqual(pensum.cantidad_materias_a_desbloquear(0b11), 4.5)
+
+class ChoqueSeccionesTest(SimpleTestCase):
+
+    def reunion(self, codigo:str, seccion:str, dia:str, desde:str, hasta:str)->dict:
+        return {'codigo': codigo, 'materia': codigo, 'seccion': seccion, 'dia': dia,
+                'desde': desde, 'hasta': hasta, 'aula': 'A-1', 'profesor': 'P'}
+
+    def test_choques_por_mascara_y_cuadricula_solo_al_final(self):
+        horario = horario_services.Horario()
+        horario.horarios = {str(i): reunion for i, reunion in enumerate([
+            self.reunion('A', '01', 'Lun', '07:00', '08:35'),
+            self.reunion('A', '01', 'Mie', '07:00', '08:35'),
+            self.reunion('B', '01', 'Lun', '08:35', '10:15'),
+            self.reunion('B', '02', 'Mar', '08:40', '10:15'),
+        ])}
+        horario.secciones = horario_secciones.compilar_secciones(horario.horarios)
+        chocan = [{'codigo': 'A', 'seccion': '01', 'creditos': 3}, {'codigo': 'B', 'seccion': '01', 'creditos': 4}]
+        self.assertFalse(horario.comprobar_posible_horario(chocan))
+        self.assertTrue(horario.comprueba_existencia_de_choque(chocan))
+        libres = [chocan[0], {'codigo': 'B', 'seccion': '02', 'creditos': 4}]
+        self.assertTrue(horario.comprobar_posible_horario(libres))
+        cuadricula = horario.estado_horario(libres)
+        self.assertEqual([bloque['codigo'] for bloque in cuadricula[0][:4]], ['A', 'A', 'A', ''])
+        self.assertEqual(cuadricula[1][3]['creditos'], 4)
+        self.assertEqual(sum(bloque['estado'] for dia in cuadricula for bloque in dia), 10)
+        # Las reuniones validas solo exigen codigo, seccion, dia, desde y hasta
+        minimo = {'0': {'codigo': 'D', 'seccion': '01', 'dia': 'Vie', 'desde': '07:00', 'hasta': '07:45'}}
+        self.assertTrue(horario_validations.validate_horario_general(minimo))
+        seccion = horario_secciones.compilar_secciones(minimo)['D']['01']
+        bloque = horario_secciones.construir_cuadricula([(2, seccion)])[4][0]
+        self.assertEqual((bloque['codigo'], bloque['materia'], bloque['aula'], bloque['profesor']), ('D', '', '', ''))
+
+    def test_busqueda_en_profundidad_equivale_al_producto_filtrado(self):
+        horario = horario_services.Horario()
+        horario.horarios = {str(i): reunion for i, reunion in enumerate([
+            self.reunion('A', '01', 'Lun', '07:00', '08:35'),
+            self.reunion('A', '02', 'Mar', '07:00', '08:35'),
+            self.reunion('B', '01', 'Lun', '08:35', '10:15'),
+            self.reunion('B', '02', 'Mar', '08:40', '10:15'),
+            self.reunion('B', '03', 'Mie', '07:00', '08:35'),
+            self.reunion('C', '01', 'Mar', '07:50', '09:25'),
+            self.reunion('C', '02', 'Lun', '10:20', '11:55'),
+        ])}
+        horario.secciones = horario_secciones.compilar_secciones(horario.horarios)
+        combinacion = [{'codigo': codigo, 'materia': codigo, 'creditos': 3} for codigo in 'ABC']
+        encontrados = sorted(tuple(materia['seccion'] for materia in asignacion) for asignacion in horario.find_all_horarios(combinacion))
+        esperados = sorted(
+            secciones for secciones in itertools.product(*[list(horario.secciones[codigo]) for codigo in 'ABC'])
+            if horario.comprobar_posible_horario([dict(materia, seccion=seccion) for materia, seccion in zip(combinacion, secciones)])
+        )
+        self.assertEqual(encontrados, esperados)
+        self.assertEqual(len(horario.comprobar_combinacion_horario(combinacion, limite=1)), 1)
+
+class SeccionesHorarioTest(TestCase):
+
+    def horario(self, *reuniones)->dict:
+        campos = ('codigo', 'seccion', 'dia', 'desde', 'hasta')
+        return {str(i): dict(zip(campos, reunion), materia=reunion[0], aula='A-1', profesor='P') for i, reunion in enumerate(reuniones)}
+
+    def test_registrar_y_editar_guardan_secciones_consultables_por_codigo(self):
+        horarios = self.horario(
+            ('A', '01', 'Lun', '07:00', '08:35'), ('A', '01', 'Mie', '07:00', '08:35'),
+            ('A', '02', 'Mar', '07:00', '08:35'), ('B', '01', 'Jue', '10:20', '11:55'),
+        )
+        horario = horario_services.registrar_horario_del_semestre({'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': horarios})
+        self.assertEqual(horario.secciones.count(), 3)
+        with self.assertNumQueries(2):
+            secciones = horario_services.obtener_secciones_horario(horario.id, ['A'])
+        self.assertEqual(sorted(secciones['A']), ['01', '02'])
+        self.assertNotIn('B', secciones)
+        esperadas = horario_secciones.compilar_secciones(horarios)
+        self.assertEqual(secciones['A']['01'].mascara, esperadas['A']['01'].mascara)
+        self.assertEqual(secciones['A']['01'].reuniones, esperadas['A']['01'].reuniones)
+        horario_services.editar_horario_del_semestre({'horario': str(self.horario(('C', '01', 'Vie', '07:00', '07:50')))}, horario.id)
+        self.assertEqual(list(horario.secciones.values_list('codigo', flat=True)), ['C'])
+        with self.assertRaises(ValueError):
+            horario_services.registrar_horario_del_semestre({'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': {'0': {'codigo': 'A'}}})
+
+    def test_matriz_de_choques_se_calcula_una_vez_por_version(self):
+        horarios = self.horario(
+            ('A', '01', 'Lun', '07:00', '08:35'), ('A', '02', 'Mar', '07:00', '08:35'),
+            ('B', '01', 'Lun', '08:35', '10:15'), ('B', '02', 'Mie', '07:00', '08:35'),
+        )
+        horario = horario_services.registrar_horario_del_semestre({'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': horarios})
+        matriz = horario_services.obtener_matriz_choques(horario.id)
+        self.assertIs(horario_services.obtener_matriz_choques(horario.id), matriz)
+        a01, a02 = matriz.secciones['A']['01'], matriz.secciones['A']['02']
+        b01 = matriz.secciones['B']['01']
+        self.assertTrue(matriz.chocan(a01, b01))
+        self.assertFalse(matriz.chocan(a02, b01))
+        self.assertFalse(matriz.chocan(a01, a02))
+        candidatos = [[{'codigo': 'A', 'seccion': a}, {'codigo': 'B', 'seccion': b}] for a in ('01', '02') for b in ('01', '02')]
+        personal = horario_services.Horario()
+        personal.cargar_matriz(horario.id)
+        self.assertEqual(len(personal.filtrar_horarios(candidatos)), 3)
+        horario_services.editar_horario_del_semestre({'horario': self.horario(('A', '01', 'Lun', '07:00', '08:35'))}, horario.id)
+        self.assertIsNot(horario_services.obtener_matriz_choques(horario.id), matriz)
+
+    def test_horario_indexado_se_lee_de_la_cache_del_proceso(self):
+        registrar = lambda fecha, reunion: horario_services.registrar_horario_del_semestre(
+            {'carrera': 'sistemas', 'fecha': fecha, 'horario': self.horario(reunion)})
+        registrar('2019-10-01', ('A', '01', 'Lun', '07:00', '08:35'))
+        reciente = registrar('2020-04-05', ('B', '01', 'Mar', '07:00', '08:35'))
+        self.assertEqual(horario_services.obtener_horario_de_carrera('Sistemas'), reciente.id)
+        personal = horario_services.Horario()
+        personal.cargar_horario(reciente.id)
+        with self.assertNumQueries(1):
+            otro = horario_services.Horario()
+            otro.cargar_horario(reciente.id)
+        self.assertIs(otro.secciones, personal.secciones)
+        self.assertEqual(list(otro.secciones), ['B'])
+        horario_services.eliminar_horario_del_semestre(reciente.id)
+        self.assertNotIn(reciente.id, [clave[3] for clave in horario_services.horarios_indexados])
+        with self.assertRaises(ValueError):
+            horario_services.obtener_horario_de_carrera('petroleo')
+
+    def test_registro_y_consulta_en_lote(self):
+        cliente = APIClient()
+        previo = horario_services.registrar_horario_del_semestre(
+            {'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': self.horario(('A', '01', 'Lun', '07:00', '08:35'))})
+        matriz = horario_services.obtener_matriz_choques(previo.id)
+        lote = [
+            {'carrera': carrera, 'fecha': '2020-04-05', 'horario': self.horario((codigo, '01', 'Mar', '07:00', '08:35'), (codigo, '02', 'Jue', '07:00', '08:35'))}
+            for carrera, codigo in (('sistemas', 'B'), ('petroleo', 'C'), ('gerencia', 'D'))
+        ]
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = cliente.post('/api/horario/general/registrar/lote/', {'horarios': lote}, format='json')
+        self.assertEqual(respuesta.status_code, 201)
+        self.assertLess(len(consultas), 15)
+        registrados = respuesta.data['horarios']
+        self.assertEqual(registrados[0]['id'], previo.id)
+        self.assertEqual(horario_models.HorarioGeneral.objects.get(id=previo.id).version, 2)
+        self.assertEqual(list(horario_services.obtener_matriz_choques(previo.id).secciones), ['B'])
+        self.assertIsNot(horario_services.obtener_matriz_choques(previo.id), matriz)
+        self.assertEqual(horario_models.SeccionHorario.objects.filter(horario_id=registrados[2]['id']).count(), 2)
+        invalido = cliente.post('/api/horario/general/registrar/lote/', lote + [{'carrera': 'medicina', 'fecha': '2020-04-05', 'horario': {}}], format='json')
+        self.assertEqual(invalido.status_code, 400)
+        self.assertIn('Horario 4', invalido.data['detail'])
+        self.assertEqual(horario_models.HorarioGeneral.objects.count(), 3)
+        with self.assertNumQueries(1):
+            horario_services.obtener_horarios_del_semestre([previo.id], ['petroleo', 'gerencia'])
+        obtenidos = cliente.get('/api/horario/general/obtener/?carreras=petroleo,gerencia&fecha=2020-04-05')
+        self.assertEqual([horario['carrera'] for horario in obtenidos.data['horarios']], ['gerencia', 'petroleo'])
+        self.assertEqual(cliente.get('/api/horario/general/obtener/?ids=%d,999' % previo.id).status_code, 400)
+
+    def test_registro_en_lote_con_fecha_sin_ceros_reemplaza(self):
+        previo = horario_services.registrar_horario_del_semestre(
+            {'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': self.horario(('A', '01', 'Lun', '07:00', '08:35'))})
+        lote = [
+            {'carrera': carrera, 'fecha': '2020-4-5', 'horario': self.horario((codigo, '01', 'Mar', '07:00', '08:35'))}
+            for carrera, codigo in (('sistemas', 'B'), ('petroleo', 'C'))
+        ]
+        registrados = horario_services.registrar_horarios_del_semestre(lote)
+        self.assertEqual(registrados[0].id, previo.id)
+        self.assertEqual(horario_models.HorarioGeneral.objects.count(), 2)
+        self.assertEqual(list(horario_services.obtener_matriz_choques(previo.id).secciones), ['B'])
+        self.assertEqual(horario_models.SeccionHorario.objects.get(horario_id=registrados[1].id).codigo, 'C')
+        with self.assertRaisesMessage(ValueError, 'misma carrera y fecha'):
+            horario_services.registrar_horarios_del_semestre([lote[1], dict(lote[1], fecha='2020-04-05')])
+
+    def columna_horario(self, tabla:str, id:int)->bytes:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT horario FROM %s WHERE id = %%s' % tabla, [id])
+            return bytes(cursor.fetchone()[0])
+
+    def test_horarios_se_guardan_como_json_comprimido(self):
+        horarios = self.horario(*[('A%d' % i, '01', 'Lun', '07:00', '08:35') for i in range(40)])
+        horario = horario_services.registrar_horario_del_semestre({'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': str(horarios)})
+        self.assertEqual(self.columna_horario('horario_horariogeneral', horario.id)[:1], b'x')
+        self.assertEqual(horario_models.HorarioGeneral.objects.get(id=horario.id).horario, horarios)
+        respuesta = APIClient().get('/api/horario/general/obtener/%d' % horario.id)
+        self.assertEqual(json.loads(respuesta.data['horario']), horarios)
+        particular = horario_services.guardar_horario_particular({'0': {'carrera': 'sistemas', 'aprobada': True}})
+        self.assertEqual(self.columna_horario('horario_horarioparticular', particular.id), b'{"0":{"carrera":"sistemas","aprobada":true}}')
+        self.assertEqual(horario_services.obtener_horario_particular(particular.id).horario, {'0': {'carrera': 'sistemas', 'aprobada': True}})
+        respuesta = APIClient().get('/api/horario/particular/obtener/%d' % particular.id)
+        self.assertEqual(respuesta.data['horario'], '{"0": {"carrera": "sistemas", "aprobada": true}}')
+
+class GeneracionConSeccionesTest(TestCase):
+
+    def setUp(self):
+        caches['generacion'].clear()
+
+    def test_combinaciones_traen_secciones_y_se_podan_las_imposibles(self):
+        peticion = crear_peticion('sistemas', (5,))
+        codigos = [peticion[clave]['codigo'] for clave in peticion if clave != "0"]
+        sin_horario = horario_services.generar_horario_particular(peticion)
+        sin_secciones, chocan, otra = codigos[0], codigos[1], codigos[2]
+        dias = ('Lun', 'Mar', 'Mie', 'Jue', 'Vie')
+        horarios, indice = {}, 0
+        for posicion, codigo in enumerate(codigos):
+            if codigo == sin_secciones:
+                continue
+            for seccion in ('01', '02'):
+                dia = 'Lun' if codigo in (chocan, otra) else dias[(posicion + int(seccion)) % 5]
+                desde = '07:00' if codigo in (chocan, otra) else horario_secciones.HORAS[(posicion * 4) % 28]
+                horarios[str(indice)] = {'codigo': codigo, 'materia': codigo, 'seccion': seccion, 'dia': dia,
+                                         'desde': desde, 'hasta': desde, 'aula': 'A-1', 'profesor': 'P'}
+                indice += 1
+        horario_services.registrar_horario_del_semestre({'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': horarios})
+        respuesta = APIClient().post('/api/horario/particular/generar/', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertTrue(len(respuesta.data) > 0)
+        combinaciones = set()
+        for resultado in respuesta.data:
+            codigos_resultado = [materia['codigo'] for materia in resultado['combinacion']]
+            self.assertEqual([seccion['codigo'] for seccion in resultado['secciones']], codigos_resultado)
+            self.assertNotIn(sin_secciones, codigos_resultado)
+            self.assertFalse(chocan in codigos_resultado and otra in codigos_resultado)
+            combinaciones.add(tuple(sorted(codigos_resultado)))
+        self.assertTrue(combinaciones <= {tuple(sorted(materia['codigo'] for materia in item['combinacion'])) for item in sin_horario})
+
+    def test_horario_sin_secciones_o_inexistente(self):
+        peticion = crear_peticion('sistemas', (5,))
+        sin_horario = horario_services.generar_horario_particular(peticion)
+        cliente = APIClient()
+        vacio = horario_services.registrar_horario_del_semestre({'carrera': 'sistemas', 'fecha': '2020-04-05', 'horario': {}})
+        horario_models.HorarioGeneral.objects.create(carrera='sistemas', fecha=None, horario={})
+        self.assertEqual(horario_services.obtener_horario_de_carrera('sistemas'), vacio.id)
+        respuesta = cliente.post('/api/horario/particular/generar/', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.json(), sin_horario)
+        otra_fecha = dict(peticion, **{"0": dict(peticion["0"], fecha='2019-01-01')})
+        self.assertEqual(cliente.post('/api/horario/particular/generar/', otra_fecha, format='json').status_code, 400)
+        ajeno = horario_services.registrar_horario_del_semestre({'carrera': 'sistemas', 'fecha': '2020-09-01', 'horario': {
+            '0': {'codigo': 'X', 'materia': 'X', 'seccion': '01', 'dia': 'Lun', 'desde': '07:00', 'hasta': '08:35', 'aula': 'A-1', 'profesor': 'P'}}})
+        respuesta = cliente.post('/api/horario/particular/generar/', peticion, format='json')
+        self.assertEqual(respuesta.status_code, 400)
+        self.assertIn(peticion['1']['codigo'], respuesta.data['detail'])
+        otro_horario = dict(peticion, **{"0": dict(peticion["0"], horario=ajeno.id + 10)})
+        self.assertEqual(cliente.post('/api/horario/particular/generar/', otro_horario, format='json').status_code, 400)
+
+class GeneracionParalelaTest(SimpleTestCase):
+
+    def matriz(self, peticion:dict)->horario_secciones.MatrizChoques:
+        codigos = [peticion[clave]['codigo'] for clave in peticion if clave != "0"]
+        return horario_secciones.MatrizChoques(horario_secciones.compilar_secciones(horario_generadores.generar_horario(codigos, 3, 0.1, semilla=5)))
+
+    def comparar(self, peticion:dict, **opciones):
+        secuencial = list(horario_services.iniciate(peticion, procesos=0, **opciones))
+        self.assertTrue(len(secuencial) > 0)
+        self.assertEqual(list(horario_services.iniciate(peticion, procesos=2, **opciones)), secuencial)
+
+    def test_pool_de_procesos_equivale_a_la_generacion_secuencial(self):
+        for peticion in (crear_peticion('sistemas', (5,)), crear_peticion('petroleo', (4, 5))):
+            matriz = self.matriz(peticion)
+            self.comparar(peticion)
+            self.comparar(peticion, matriz=matriz)
+            self.comparar(peticion, top_k=5)
+            self.comparar(peticion, top_k=5, matriz=matriz)
+
+    def test_pedir_otro_tamanio_no_cierra_el_pool_en_uso(self):
+        pool = horario_services.obtener_pool_procesos(2)
+        self.assertIsNot(horario_services.obtener_pool_procesos(3), pool)
+        self.assertIs(horario_services.obtener_pool_procesos(2), pool)
+        self.assertEqual(pool.submit(sum, [1, 2]).result(), 3)
+
+class GeneracionCohorteTest(TestCase):
+
+    def setUp(self):
+        caches['generacion'].clear()
+
+    def test_perfiles_iguales_se_generan_una_vez(self):
+        sistemas = crear_peticion('sistemas', (5,))
+        petroleo = crear_peticion('petroleo', (4, 5))
+        horario_services.generar_horario_particular(petroleo, 3)
+        estudiantes = [
+            {'estudiante': 'a', 'peticion': sistemas},
+            {'estudiante': 'b', 'peticion': dict(sistemas, **{"0": dict(sistemas["0"], carrera='SISTEMAS')})},
+            {'estudiante': 'c', 'peticion': petroleo},
+            {'estudiante': 'd', 'peticion': dict(sistemas, **{"0": dict(sistemas["0"], carrera='medicina')})},
+        ]
+        medicion = horario_medicion.Medicion()
+        lineas = {linea['estudiante']: linea for linea in horario_services.generar_cohorte(estudiantes, 3, 0, medicion)}
+        self.assertEqual(medicion.contadores, {'estudiantes': 3, 'perfiles': 2, 'cache_aciertos': 1})
+        self.assertIs(lineas['a']['resultados'], lineas['b']['resultados'])
+        self.assertEqual(lineas['a']['resultados'], horario_services.generar_horario_particular(sistemas, 3))
+        self.assertIn('detail', lineas['d'])
+        self.assertEqual(horario_services.guardar_resultados_cohorte(list(lineas.values())), 3)
+        respuesta = APIClient().post('/api/horario/particular/generar/cohorte/?top_k=3', {'estudiantes': estudiantes[:3]}, format='json')
+        self.assertEqual(respuesta['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(
+            sorted(json.loads(linea)['estudiante'] for linea in b''.join(respuesta.streaming_content).splitlines()), ['a', 'b', 'c'])
+
+    def test_estudiante_mal_formado_no_detiene_la_cohorte(self):
+        sistemas = crear_peticion('sistemas', (5,))
+        petroleo = crear_peticion('petroleo', (4, 5))
+        sin_creditos = dict(sistemas, **{"0": {'carrera': 'sistemas'}})
+        creditos_texto = dict(petroleo, **{"1": dict(petroleo["1"], creditos='tres')})
+        estudiantes = [
+            {'estudiante': 'a', 'peticion': sin_creditos},
+            {'estudiante': 'b', 'peticion': sistemas},
+            {'estudiante': 'c', 'peticion': creditos_texto},
+            {'estudiante': 'd', 'peticion': petroleo},
+        ]
+        for procesos in (0, 2):
+            caches['generacion'].clear()
+            lineas = {linea['estudiante']: linea for linea in horario_services.generar_cohorte(estudiantes, 3, procesos)}
+            self.assertIn('minimoCreditos', lineas['a']['detail'])
+            self.assertIn('creditos', lineas['c']['detail'])
+            self.assertEqual(lineas['b']['resultados'], horario_services.generar_horario_particular(sistemas, 3))
+            self.assertEqual(lineas['d']['resultados'], horario_services.generar_horario_particular(petroleo, 3))
+
+class CompilarPensumsTest(SimpleTestCase):
+
+    def test_compilados_al_dia_con_los_pensums(self):
+        # Si falla, hay que correr `python manage.py compilar_pensums` y subir datos/compilados
+        call_command('compilar_pensums', '--comprobar')
+        with self.assertRaises(CommandError):
+            call_command('compilar_pensums', 'medicina', '--comprobar')
+
+class BenchmarkTest(SimpleTestCase):
+
+    def test_generadores_con_semilla_son_reproducibles_y_validos(self):
+        pensum = horario_generadores.generar_pensum(40, densidad=0.7, electivas=4, semilla=3)
+        self.assertEqual(pensum, horario_generadores.generar_pensum(40, densidad=0.7, electivas=4, semilla=3))
+        self.assertTrue(horario_validations.validate_esquema_pensum(pensum))
+        horario = horario_generadores.generar_horario([materia['codigo'] for materia in pensum], 3, 0.05, semilla=3)
+        self.assertTrue(horario_validations.validate_horario_general(horario))
+        self.assertEqual(len(horario_secciones.compilar_secciones(horario)), 40)
+
+    def test_ejecucion_y_comparacion_con_linea_base(self):
+        filas = horario_escenarios.ejecutar(['pensum_sintetico'], tamanios=[30], repeticiones=1)
+        self.assertEqual([(fila['escenario'], fila['tamanio']) for fila in filas], [('pensum_sintetico', 30)])
+        self.assertTrue(filas[0]['resultados'] > 0 and filas[0]['pico_kb'] > 0)
+        linea_base = [dict(filas[0], segundos=filas[0]['segundos'] / 10)]
+        self.assertTrue(horario_escenarios.comparar(filas, linea_base)[0]['regresion'])
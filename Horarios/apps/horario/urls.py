@@ -5,10 +5,16 @@ from apps.horario import views
 urlpatterns = [
     path('particular/guardar/', views.HorarioParticular.as_view(), name='guardar_horario_particular'),
     path('particular/generar/', views.GenerarHorarioParticular, name='generar_horario_particular'),
+    path('particular/generar/cohorte/', views.GenerarCohorte, name='generar_cohorte'),
+    path('particular/generar/trabajo/', views.TrabajoGeneracion.as_view(), name='crear_trabajo_generacion'),
+    path('particular/generar/trabajo/<int:id>', views.TrabajoGeneracion.as_view(), name='obtener_trabajo_generacion'),
+    path('particular/generar/trabajo/<int:id>/resultado', views.ResultadoTrabajoGeneracion, name='obtener_resultado_trabajo_generacion'),
     path('particular/eliminar/', views.HorarioParticular.as_view(), name='eliminar_horarios_particulares'),
     path('particular/obtener/<int:id>', views.HorarioParticular.as_view(), name='obtener_horario_particular'),
     path('general/eliminar/<int:id>', views.HorarioGeneral.as_view(), name='eliminar_horario_general'),
     path('general/editar/<int:id>', views.HorarioGeneral.as_view(), name='editar_horario_general'),
     path('general/registrar/',views.HorarioGeneral.as_view(), name='registrar_horario_general'),
     path('general/obtener/<int:id>', views.HorarioGeneral.as_view(), name='obtener_horario_general'),
+    path('general/registrar/lote/', views.HorariosGenerales.as_view(), name='registrar_horarios_generales'),
+    path('general/obtener/', views.HorariosGenerales.as_view(), name='obtener_horarios_generales'),
 ]
\ No newline at end of file
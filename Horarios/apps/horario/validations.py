@@ -1,4 +1,12 @@
 from datetime import datetime
+import json
+import os
+
+CARRERAS = ('sistemas', 'petroleo', 'tecnologia', 'produccion', 'gerencia', 'contaduria', 'agronomia', 'administracion')
+DIRECTORIO_PENSUMS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datos', 'pensums')
+ESQUEMA_MATERIA = {'codigo': str, 'materia': str, 'creditos': int, 'semestre': int, 'presedentes': dict}
+CAMPOS_REUNION = ('codigo', 'seccion', 'dia', 'desde', 'hasta')
+
 """ -------------------------- General Validations -----------------------"""
 
 def validate_datos(materias:dict):
@@ -76,34 +84,79 @@ def validate_lista_electivas_elejidas(materiasPorCursar:list):
 
 def validate_pensum(carrera:str):
 	"""
-		Valida qu el pensum sea una lista
-	"""
-	if carrera.lower() == 'sistemas':
-		pensum = {"0":{"codigo":"0113053","materia":"Dirección de Reuniones","creditos":3,"semestre":99,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"1":{"codigo":"0061222","materia":"Historia de la Cultura","creditos":2,"semestre":99,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"2":{"codigo":"0071122","materia":"Inglés Instrumental II","creditos":2,"semestre":99,"presedentes":{"p1":"0071112","p2":""},"aprobada":False,"elejida":False},"3":{"codigo":"0112943","materia":"Introducción a la Filosofía de las Ciencias","creditos":3,"semestre":99,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"4":{"codigo":"0113183","materia":"Sociología Urbana","creditos":3,"semestre":99,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"5":{"materia":"Expresión Escrita","codigo":"0062032","creditos":2,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":99,"elejida":False},"6":{"materia":"Comunicación y Sociedad","codigo":"0062122","creditos":2,"aprobada":False,"presedentes":{"p1":"0061013","p2":""},"semestre":99,"elejida":False},"7":{"materia":"Etica","codigo":"0061183","creditos":3,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":99,"elejida":False},"8":{"materia":"Sexología Básica","codigo":"0061822","creditos":2,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":99,"elejida":False},"9":{"materia":"Expresión Oral y Escrita","codigo":"0061922","creditos":2,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":99,"elejida":False},"10":{"materia":"Dinámica de Grupos","codigo":"0062052","creditos":2,"aprobada":False,"presedentes":{"p1":"0061013","p2":""},"semestre":99,"elejida":False},"11":{"materia":"Inglés Instrumental I","codigo":"0071112","creditos":2,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":99,"elejida":False},"12":{"materia":"Grupo y Liderazgo","codigo":"0112832","creditos":2,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":99,"elejida":False},"13":{"materia":"Educación Ambiental","codigo":"9032242","creditos":2,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":99,"elejida":False},"14":{"materia":"Matematicas I","codigo":"0081814","creditos":4,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":1,"elejida":False},"15":{"materia":"Quimica General","codigo":"0101214","creditos":4,"aprobada":False,"presedentes":{"p1":"","p2":""},"semestre":1,"elejida":False},"16":{"materia":"Comp. y Expr. Linguistica I","codigo":"0061013","aprobada":False,"creditos":3,"presedentes":{"p1":"","p2":""},"semestre":1,"elejida":False},"17":{"materia":"Des. De DEstr. Para el Aprendizaje","codigo":"0091012","aprobada":False,"creditos":2,"presedentes":{"p1":"","p2":""},"semestre":1,"elejida":False},"18":{"materia":"Ingles Instrumental I","codigo":"0071823","aprobada":False,"creditos":3,"presedentes":{"p1":"","p2":""},"semestre":1,"elejida":False},"19":{"materia":"Extra-Academica","codigo":"0021111","aprobada":False,"creditos":1,"presedentes":{"p1":"","p2":""},"semestre":1,"elejida":False},"20":{"materia":"Matematicas II","codigo":"0081824","aprobada":False,"creditos":4,"presedentes":{"p1":"0081814","p2":""},"semestre":2,"elejida":False},"21":{"materia":"FIsica I","codigo":"0051324","aprobada":False,"creditos":4,"presedentes":{"p1":"0081814","p2":""},"semestre":2,"elejida":False},"22":{"materia":"Comp. y Expr. Linguistica II","codigo":"0061023","aprobada":False,"creditos":3,"presedentes":{"p1":"0061013","p2":""},"semestre":2,"elejida":False},"23":{"materia":"Intr. A la Logica Formal y Algoritmos","codigo":"0721162","aprobada":False,"creditos":2,"presedentes":{"p1":"","p2":""},"semestre":2,"elejida":False},"24":{"materia":"Ingles Tecnico I","codigo":"0071121","aprobada":False,"creditos":1,"presedentes":{"p1":"0071823","p2":""},"semestre":2,"elejida":False},"25":{"materia":"Matematicas III","codigo":"0082814","aprobada":False,"creditos":4,"presedentes":{"p1":"0081824","p2":""},"semestre":3,"elejida":False},"26":{"materia":"Fisica II","codigo":"0052134","aprobada":False,"creditos":4,"presedentes":{"p1":"0051324","p2":""},"semestre":3,"elejida":False},"27":{"materia":"Laboratorio de Fisica I","codigo":"0052131","aprobada":False,"creditos":1,"presedentes":{"p1":"0051324","p2":""},"semestre":3,"elejida":False},"28":{"materia":"Programacion Orientada a Objetos","codigo":"0722103","aprobada":False,"creditos":3,"presedentes":{"p1":"0081824","p2":"0721162"},"semestre":3,"elejida":False},"29":{"materia":"Taller de POO","codigo":"0722111","aprobada":False,"creditos":1,"presedentes":{"p1":"0721162","p2":""},"semestre":3,"elejida":False},"30":{"materia":"Intr. A la Ing. De Sistemas","codigo":"0712642","aprobada":False,"creditos":2,"presedentes":{"p1":"","p2":""},"semestre":3,"elejida":False},"31":{"materia":"Matematicas IV","codigo":"0082824","aprobada":False,"creditos":4,"presedentes":{"p1":"0082814","p2":""},"semestre":4,"elejida":False},"32":{"materia":"Objetos y Abstraccion de Datos","codigo":"0722123","aprobada":False,"creditos":3,"presedentes":{"p1":"0722103","p2":"0722111"},"semestre":4,"elejida":False},"33":{"materia":"Taller de Objetos y Abstraccion de Datos","codigo":"0722131","aprobada":False,"creditos":1,"presedentes":{"p1":"0722111","p2":""},"semestre":4,"elejida":False},"34":{"materia":"Introduccion a la Economia","codigo":"0712142","aprobada":False,"creditos":2,"presedentes":{"p1":"","p2":""},"semestre":4,"elejida":False},"35":{"materia":"Estadistica I","codigo":"0623313","aprobada":False,"creditos":3,"presedentes":{"p1":"0082814","p2":""},"semestre":4,"elejida":False},"36":{"materia":"Metodologia de la Investigacion","codigo":"0073023","aprobada":False,"creditos":3,"presedentes":{"p1":"","p2":""},"semestre":4,"elejida":False},"37":{"materia":"Metodos Numericos","codigo":"0723913","aprobada":False,"creditos":3,"presedentes":{"p1":"0082824","p2":"0722103"},"semestre":5,"elejida":False},"38":{"materia":"Circuitos y Sistemas","codigo":"0713463","aprobada":False,"creditos":3,"presedentes":{"p1":"0082824","p2":"0052134"},"semestre":5,"elejida":False},"39":{"materia":"Sistemas de Operaciones","codigo":"0713643","aprobada":False,"creditos":3,"presedentes":{"p1":"0722123","p2":""},"semestre":5,"elejida":False},"40":{"materia":"Sistemas de Costo","codigo":"0713172","aprobada":False,"creditos":2,"presedentes":{"p1":"0712142","p2":""},"semestre":5,"elejida":False},"41":{"materia":"Estadistica II","codigo":"0624622","aprobada":False,"creditos":2,"presedentes":{"p1":"0623313","p2":""},"semestre":5,"elejida":False},"42":{"materia":"Inferencia y Diseño de Experimentos","codigo":"0713122","aprobada":False,"creditos":2,"presedentes":{"p1":"0623313","p2":""},"semestre":5,"elejida":False},"43":{"materia":"Teoria de Sistemas","codigo":"0713632","aprobada":False,"creditos":2,"presedentes":{"p1":"0712642","p2":""},"semestre":5,"elejida":False},"44":{"materia":"Optimizacion de Operaciones","codigo":"0713663","aprobada":False,"creditos":3,"presedentes":{"p1":"0723913","p2":""},"semestre":6,"elejida":False},"45":{"materia":"Electronica","codigo":"0723533","aprobada":False,"creditos":3,"presedentes":{"p1":"0713463","p2":""},"semestre":6,"elejida":False},"46":{"materia":"Admón. de Stmas. De base de Datos","codigo":"0713622","aprobada":False,"creditos":2,"presedentes":{"p1":"0713643","p2":""},"semestre":6,"elejida":False},"47":{"materia":"Economia de Empresas","codigo":"0713113","aprobada":False,"creditos":3,"presedentes":{"p1":"0713172","p2":""},"semestre":6,"elejida":False},"48":{"materia":"Analisis de Decisiones","codigo":"0713653","aprobada":False,"creditos":3,"presedentes":{"p1":"0713122","p2":""},"semestre":6,"elejida":False},"49":{"materia":"Enfoque Sistemico","codigo":"0713633","aprobada":False,"creditos":3,"presedentes":{"p1":"0713632","p2":""},"semestre":6,"elejida":False},"50":{"materia":"Modelos de Operaciones I","codigo":"0714633","aprobada":False,"creditos":3,"presedentes":{"p1":"0713663","p2":""},"semestre":7,"elejida":False},"51":{"materia":"Sistemas Dinamicos","codigo":"0714643","aprobada":False,"creditos":3,"presedentes":{"p1":"0723533","p2":""},"semestre":7,"elejida":False},"52":{"materia":"Laboratorio de Circuitos y Electronica","codigo":"0724641","aprobada":False,"creditos":1,"presedentes":{"p1":"0723533","p2":""},"semestre":7,"elejida":False},"53":{"materia":"Analisis y Diseño de Stms. de Informacion","codigo":"0714323","aprobada":False,"creditos":3,"presedentes":{"p1":"0713622","p2":""},"semestre":7,"elejida":False},"54":{"materia":"Prepar. Eval. y Control de Proyectos","codigo":"0714153","aprobada":False,"creditos":3,"presedentes":{"p1":"0713113","p2":""},"semestre":7,"elejida":False},"55":{"materia":"Modelos de Operaciones II","codigo":"0714133","aprobada":False,"creditos":3,"presedentes":{"p1":"0714633","p2":""},"semestre":8,"elejida":False},"56":{"materia":"Aplicacion y Audit. de Stms. de Inform.","codigo":"0714612","aprobada":False,"creditos":2,"presedentes":{"p1":"0714323","p2":""},"semestre":8,"elejida":False},"57":{"materia":"Gestion Empresarial I","codigo":"0714123","aprobada":False,"creditos":3,"presedentes":{"p1":"0714153","p2":""},"semestre":8,"elejida":False},"58":{"materia":"Sistemas de Comunicacion Industrial","codigo":"0714642","aprobada":False,"creditos":2,"presedentes":{"p1":"0713622","p2":""},"semestre":8,"elejida":False},"59":{"materia":"Administracion Financiera de Empresa","codigo":"0625613","aprobada":False,"creditos":3,"presedentes":{"p1":"0713113","p2":""},"semestre":8,"elejida":False},"60":{"materia":"Leyes y Deontologia","codigo":"0625822","aprobada":False,"creditos":2,"presedentes":{"p1":"","p2":""},"semestre":9,"elejida":False},"61":{"materia":"Planificacion Estrategica","codigo":"0715112","aprobada":False,"creditos":2,"presedentes":{"p1":"0714123","p2":""},"semestre":9,"elejida":False},"62":{"materia":"Trabajode Grado","codigo":"0715116","aprobada":False,"creditos":6,"presedentes":{"p1":"0715112","p2":"0714133"},"semestre":10,"elejida":False},"63":{"codigo":"0714373","materia":"Instrumentación y Control  de Procesos","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714363","p2":""}},"64":{"codigo":"0715903","materia":"Sistemas de Control de Espacios de Estado","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714363","p2":""}},"65":{"codigo":"0714363","materia":"Sistemas de Control Discreto","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714643","p2":""}},"66":{"codigo":"0714963","materia":"Sistemas Inteligentes","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714642","p2":"0714612"}},"67":{"codigo":"0724713","materia":"Desarrollo de Software","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714612","p2":""}},"68":{"codigo":"0723123","materia":"Estructura de Datos","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0722123","p2":""}},"69":{"codigo":"0723373","materia":"Lenguajes de Programación","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0723123","p2":""}},"70":{"codigo":"0723131","materia":"Taller de Estructura de Datos","creditos":1,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0722131","p2":""}},"71":{"codigo":"0715953","materia":"Administración de Recursos Humanos","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714123","p2":""}},"72":{"codigo":"0715943","materia":"Comportamiento Organizacional","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714973","p2":""}},"73":{"codigo":"0715933","materia":"Control de Proyectos","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714153","p2":""}},"74":{"codigo":"0714983","materia":"Cuadro de Mando Integral","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0715112","p2":""}},"75":{"codigo":"0714973","materia":"Gestión Empresarial II","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714123","p2":""}},"76":{"codigo":"0715963","materia":"Dirección de Operaciones","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714633","p2":""}},"77":{"codigo":"0715123","materia":"Gerencia de Mantenimiento","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"","p2":""}},"78":{"codigo":"0715333","materia":"Gerencia Logística","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714133","p2":""}},"79":{"codigo":"0714383","materia":"Procesos Estocásticos","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0713122","p2":""}},"80":{"codigo":"0714303","materia":"Programación No Lineal","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0713663","p2":""}},"81":{"codigo":"0714993","materia":"Simulación de Sistemas","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"","p2":""}},"82":{"codigo":"0714393","materia":"Teoría de Colas","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714383","p2":""}},"83":{"codigo":"0714903","materia":"Teoría de Sobrevivencia","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714383","p2":""}},"84":{"codigo":"0714953","materia":"Dinámica de Sistemas","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0714643","p2":""}},"85":{"codigo":"0714933","materia":"Seminario de Ingeniería de Sistemas","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0713633","p2":""}},"86":{"codigo":"0714943","materia":"Sistemología Interpretativa","creditos":3,"semestre":88,"aprobada":False,"elejida":False,"presedentes":{"p1":"0713633","p2":""}}}
-	elif carrera.lower() == 'petroleo':
-		pensum = {"0":{"codigo":"0021111","materia":"Extraacadémica","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"1":{"codigo":"0061013","materia":"Comprensión y expresión Lingüística I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"2":{"codigo":"0071112","materia":"Inglés Instrumental I","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"3":{"codigo":"0081814","materia":"Matemáticas I","semestre":1,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"4":{"codigo":"0091012","materia":"Desarrollo de Destrezas para el Aprendizaje","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"5":{"codigo":"0101814","materia":"Química I","semestre":1,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"6":{"codigo":"0051814","materia":"Física I","semestre":2,"creditos":4,"presedentes":{"p1":"0081814","p2":""},"aprobada":False,"elejida":False},"7":{"codigo":"0071222","materia":"Inglés Instrumental II","semestre":2,"creditos":2,"presedentes":{"p1":"0071112","p2":""},"aprobada":False,"elejida":False},"8":{"codigo":"0081824","materia":"Matemáticas II","semestre":2,"creditos":4,"presedentes":{"p1":"0081814","p2":""},"aprobada":False,"elejida":False},"9":{"codigo":"0101821","materia":"Laboratorio I de Química","semestre":2,"creditos":1,"presedentes":{"p1":"0101814","p2":""},"aprobada":False,"elejida":False},"10":{"codigo":"0101824","materia":"Química II","semestre":2,"creditos":4,"presedentes":{"p1":"0101814","p2":""},"aprobada":False,"elejida":False},"11":{"codigo":"0051821","materia":"Laboratorio I de Física","semestre":3,"creditos":1,"presedentes":{"p1":"0051814","p2":""},"aprobada":False,"elejida":False},"12":{"codigo":"0051824","materia":"Física II","semestre":3,"creditos":4,"presedentes":{"p1":"0051814","p2":""},"aprobada":False,"elejida":False},"13":{"codigo":"0082814","materia":"Matemáticas III","semestre":3,"creditos":4,"presedentes":{"p1":"0081824","p2":""},"aprobada":False,"elejida":False},"14":{"codigo":"0082833","materia":"Introducción a la Programación","semestre":3,"creditos":3,"presedentes":{"p1":"0081824","p2":""},"aprobada":False,"elejida":False},"15":{"codigo":"0632032","materia":"Inglés Instrumental III","semestre":3,"creditos":2,"presedentes":{"p1":"0071222","p2":""},"aprobada":False,"elejida":False},"16":{"codigo":"0632612","materia":"Introducción a la Ingeniería de Petróleo","semestre":3,"creditos":2,"presedentes":{"p1":"0101824","p2":""},"aprobada":False,"elejida":False},"17":{"codigo":"0662812","materia":"Dibujo","semestre":3,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"18":{"codigo":"0082824","materia":"Matemáticas IV","semestre":4,"creditos":4,"presedentes":{"p1":"0082814","p2":""},"aprobada":False,"elejida":False},"19":{"codigo":"0632012","materia":"Redacción de Informes Técnicos","semestre":4,"creditos":2,"presedentes":{"p1":"0632612","p2":""},"aprobada":False,"elejida":False},"20":{"codigo":"0632042","materia":"Inglés Instrumental IV","semestre":4,"creditos":2,"presedentes":{"p1":"0632032","p2":""},"aprobada":False,"elejida":False},"21":{"codigo":"0632324","materia":"Mecánica para Ingenieros","semestre":4,"creditos":4,"presedentes":{"p1":"0051824","p2":""},"aprobada":False,"elejida":False},"22":{"codigo":"0632724","materia":"Geología General y Laboratorio","semestre":4,"creditos":4,"presedentes":{"p1":"0632612","p2":"0662812"},"aprobada":False,"elejida":False},"23":{"codigo":"0083813","materia":"Métodos Numéricos para Ingenieros","semestre":5,"creditos":3,"presedentes":{"p1":"0082824","p2":"0082833"},"aprobada":False,"elejida":False},"24":{"codigo":"0613553","materia":"Mecánica de los Materiales","semestre":5,"creditos":3,"presedentes":{"p1":"0632324","p2":""},"aprobada":False,"elejida":False},"25":{"codigo":"0613753","materia":"Termodinámica","semestre":5,"creditos":3,"presedentes":{"p1":"0082814","p2":"0101824"},"aprobada":False,"elejida":False},"26":{"codigo":"0623314","materia":"Estadística para Ingenieros","semestre":5,"creditos":4,"presedentes":{"p1":"0082833","p2":""},"aprobada":False,"elejida":False},"27":{"codigo":"0633113","materia":"Propiedades de la Roca y de los Fluidos","semestre":5,"creditos":3,"presedentes":{"p1":"0082824","p2":"0632724"},"aprobada":False,"elejida":False},"28":{"codigo":"0633121","materia":"Laboratorio de Yacimientos","semestre":6,"creditos":1,"presedentes":{"p1":"0633113","p2":""},"aprobada":False,"elejida":False},"29":{"codigo":"0633123","materia":"Yacimientos I","semestre":6,"creditos":3,"presedentes":{"p1":"0083813","p2":"0633113"},"aprobada":False,"elejida":False},"30":{"codigo":"0633423","materia":"Gasotecnia","semestre":6,"creditos":3,"presedentes":{"p1":"0613753","p2":""},"aprobada":False,"elejida":False},"31":{"codigo":"0633624","materia":"Geología Estructural","semestre":6,"creditos":4,"presedentes":{"p1":"0633113","p2":""},"aprobada":False,"elejida":False},"32":{"codigo":"0633663","materia":"Computación y Modelos Matemáticos","semestre":6,"creditos":3,"presedentes":{"p1":"0083813","p2":""},"aprobada":False,"elejida":False},"33":{"codigo":"0633824","materia":"Fenómenos de Transporte Aplicado","semestre":6,"creditos":4,"presedentes":{"p1":"0613753","p2":""},"aprobada":False,"elejida":False},"34":{"codigo":"0634123","materia":"Yacimientos II","semestre":7,"creditos":3,"presedentes":{"p1":"0633123","p2":""},"aprobada":False,"elejida":False},"35":{"codigo":"0634314","materia":"Perforación","semestre":7,"creditos":4,"presedentes":{"p1":"0633624","p2":"0633824"},"aprobada":False,"elejida":False},"36":{"codigo":"0634623","materia":"Evaluación Económica de Proyectos","semestre":7,"creditos":3,"presedentes":{"p1":"0623314","p2":""},"aprobada":False,"elejida":False},"37":{"codigo":"0634734","materia":"Registro de Pozos","semestre":7,"creditos":4,"presedentes":{"p1":"0633624","p2":""},"aprobada":False,"elejida":False},"38":{"codigo":"0634143","materia":"Prueba de Pozos","semestre":8,"creditos":3,"presedentes":{"p1":"0634123","p2":""},"aprobada":False,"elejida":False},"39":{"codigo":"0634223","materia":"Producción de Hidrocarburos","semestre":8,"creditos":3,"presedentes":{"p1":"0633123","p2":""},"aprobada":False,"elejida":False},"40":{"codigo":"0634322","materia":"Laboratorio de Perforación","semestre":8,"creditos":2,"presedentes":{"p1":"0634314","p2":""},"aprobada":False,"elejida":False},"41":{"codigo":"0634323","materia":"Completación y Reacondicionamiento de Pozos","semestre":8,"creditos":3,"presedentes":{"p1":"0634314","p2":""},"aprobada":False,"elejida":False},"42":{"codigo":"0634553","materia":"Simulación de Yacimientos","semestre":8,"creditos":3,"presedentes":{"p1":"0634123","p2":""},"aprobada":False,"elejida":False},"43":{"codigo":"0634612","materia":"Seminario y Proyecto de Investigación","semestre":8,"creditos":2,"presedentes":{"p1":"0633121","p2":"0634734"},"aprobada":False,"elejida":False},"44":{"codigo":"0635113","materia":"Explotación de Yacimientos de Crudos Pesados","semestre":9,"creditos":3,"presedentes":{"p1":"0634143","p2":""},"aprobada":False,"elejida":False},"45":{"codigo":"0635212","materia":"Petróleo y Ambiente","semestre":9,"creditos":2,"presedentes":{"p1":"0634323","p2":""},"aprobada":False,"elejida":False},"46":{"codigo":"0635213","materia":"Procesos de Campo","semestre":9,"creditos":3,"presedentes":{"p1":"0634223","p2":""},"aprobada":False,"elejida":False},"47":{"codigo":"0635513","materia":"Procesamiento de Hidrocarburos y Laboratorio","semestre":9,"creditos":3,"presedentes":{"p1":"0634223","p2":""},"aprobada":False,"elejida":False},"48":{"codigo":"0635714","materia":"Geología de Producción","semestre":9,"creditos":4,"presedentes":{"p1":"0634734","p2":""},"aprobada":False,"elejida":False},"49":{"codigo":"0635625","materia":"Trabajo de Grado","semestre":10,"creditos":5,"presedentes":{"p1":"0634612","p2":""},"aprobada":False,"elejida":False},"50":{"codigo":"0604413","materia":"Electrotecnia","semestre":88,"creditos":3,"presedentes":{"p1":"0051824","p2":""},"aprobada":False,"elejida":False},"51":{"codigo":"0625723","materia":"Fundamentos de Mantenimiento","semestre":88,"creditos":3,"presedentes":{"p1":"0623314","p2":""},"aprobada":False,"elejida":False},"52":{"codigo":"0634343","materia":"Perforación Avanzada","semestre":88,"creditos":3,"presedentes":{"p1":"0634314","p2":""},"aprobada":False,"elejida":False},"53":{"codigo":"0634363","materia":"Detección de Presiones Anormales","semestre":88,"creditos":3,"presedentes":{"p1":"0634314","p2":""},"aprobada":False,"elejida":False},"54":{"codigo":"0634423","materia":"Tratamiento de Gas","semestre":88,"creditos":3,"presedentes":{"p1":"0633423","p2":""},"aprobada":False,"elejida":False},"55":{"codigo":"0634643","materia":"Matemática Aplicada a la Ing. De Petróleo","semestre":88,"creditos":3,"presedentes":{"p1":"0083813","p2":""},"aprobada":False,"elejida":False},"56":{"codigo":"0634713","materia":"Sismica para Ingenieros","semestre":88,"creditos":3,"presedentes":{"p1":"0633624","p2":""},"aprobada":False,"elejida":False},"57":{"codigo":"0634823","materia":"Geoestadística","semestre":88,"creditos":3,"presedentes":{"p1":"0623314","p2":"0633624"},"aprobada":False,"elejida":False},"58":{"codigo":"0635123","materia":"Control y Gerencia de Yacimientos","semestre":88,"creditos":3,"presedentes":{"p1":"0634123","p2":""},"aprobada":False,"elejida":False},"59":{"codigo":"0635143","materia":"Recuperación Adicional de Crudos Pesados","semestre":88,"creditos":3,"presedentes":{"p1":"0634123","p2":""},"aprobada":False,"elejida":False},"60":{"codigo":"0635233","materia":"Técnicas Modernas en Ingeniería de Producción","semestre":88,"creditos":3,"presedentes":{"p1":"0634223","p2":""},"aprobada":False,"elejida":False},"61":{"codigo":"0635313","materia":"Perforación Direccional","semestre":88,"creditos":3,"presedentes":{"p1":"0634323","p2":""},"aprobada":False,"elejida":False},"62":{"codigo":"0635323","materia":"Comport. Comp. y Estim. Pozos Horiz.","semestre":88,"creditos":3,"presedentes":{"p1":"0634323","p2":""},"aprobada":False,"elejida":False},"63":{"codigo":"0635443","materia":"Ingeniería de Control de Riesgos","semestre":88,"creditos":3,"presedentes":{"p1":"0633423","p2":""},"aprobada":False,"elejida":False},"64":{"codigo":"0635523","materia":"Emulsiones y sus Aplicaciones","semestre":88,"creditos":3,"presedentes":{"p1":"0633123","p2":""},"aprobada":False,"elejida":False},"65":{"codigo":"0635623","materia":"Pasantías Técnicas","semestre":88,"creditos":3,"presedentes":{"p1":"0633123","p2":""},"aprobada":False,"elejida":False},"66":{"codigo":"0635893","materia":"Higiene y Seguridad Industrial","semestre":88,"creditos":3,"presedentes":{"p1":"0634223","p2":""},"aprobada":False,"elejida":False},"67":{"codigo":"0642103","materia":"Fisicoquímica I","semestre":88,"creditos":3,"presedentes":{"p1":"0633423","p2":""},"aprobada":False,"elejida":False},"68":{"codigo":"0061183","materia":"Etica ","semestre":99,"creditos":3,"presedentes":{"p1":"0091012","p2":""},"aprobada":False,"elejida":False},"69":{"codigo":"0061222","materia":"Historia de la Cultura ","semestre":99,"creditos":2,"presedentes":{"p1":"0061013","p2":""},"aprobada":False,"elejida":False},"70":{"codigo":"0061822","materia":"Sexología Básica ","semestre":99,"creditos":2,"presedentes":{"p1":"0061013","p2":""},"aprobada":False,"elejida":False},"71":{"codigo":"0062012","materia":"Visión Filosófica de las Ciencias ","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"72":{"codigo":"0062032","materia":"Expresión Escrita ","semestre":99,"creditos":2,"presedentes":{"p1":"0061013","p2":""},"aprobada":False,"elejida":False},"73":{"codigo":"0062052","materia":"Dinámica de Grupos ","semestre":99,"creditos":2,"presedentes":{"p1":"0061013","p2":""},"aprobada":False,"elejida":False},"74":{"codigo":"0112832","materia":"Grupo y Liderazgo ","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False}}
-	elif carrera.lower() == 'tecnologia':
-		pensum = {"0":{"codigo":"0021111","materia":"Extraacadémica","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"1":{"codigo":"0061013","materia":"Comprensión y expresión Lingüística I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"2":{"codigo":"0091012","materia":"Desarrollo de Destrezas para el Aprendizaje","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"3":{"codigo":"2091113","materia":"Matemáticas I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"4":{"codigo":"2091214","materia":"Química General","semestre":1,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"5":{"codigo":"2091314","materia":"Biología General","semestre":1,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"6":{"codigo":"2091122","materia":"Aplicación de Paquetes Informáticos","semestre":2,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"7":{"codigo":"2091123","materia":"Matemáticas II","semestre":2,"creditos":3,"presedentes":{"p1":"2091113","p2":""},"aprobada":False,"elejida":False},"8":{"codigo":"2091223","materia":"Introducción a la Tecnología de Alimentos","semestre":2,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"9":{"codigo":"2091224","materia":"Técnicas de Análisis Químico e Instrumental","semestre":2,"creditos":4,"presedentes":{"p1":"2091214","p2":""},"aprobada":False,"elejida":False},"10":{"codigo":"2091324","materia":"Química Orgánica","semestre":2,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"11":{"codigo":"2092113","materia":"Química de Alimentos","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"12":{"codigo":"2092114","materia":"Física","semestre":3,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"13":{"codigo":"2092214","materia":"Bioquímica","semestre":3,"creditos":4,"presedentes":{"p1":"2091324","p2":""},"aprobada":False,"elejida":False},"14":{"codigo":"2092314","materia":"Microbiología General","semestre":3,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"15":{"codigo":"2092122","materia":"Empacado de Alimentos","semestre":4,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"16":{"codigo":"2092223","materia":"Fisiología y Nutrición Humana","semestre":4,"creditos":3,"presedentes":{"p1":"2092214","p2":""},"aprobada":False,"elejida":False},"17":{"codigo":"2092224","materia":"Análisis de Alimentos","semestre":4,"creditos":4,"presedentes":{"p1":"2091224","p2":""},"aprobada":False,"elejida":False},"18":{"codigo":"2092324","materia":"Principios de Ingeniería de Alimentos","semestre":4,"creditos":4,"presedentes":{"p1":"2092114","p2":""},"aprobada":False,"elejida":False},"19":{"codigo":"2092424","materia":"Microbiología de Alimentos","semestre":4,"creditos":4,"presedentes":{"p1":"2092314","p2":""},"aprobada":False,"elejida":False},"20":{"codigo":"2093111","materia":"Lab. de Procesos de Conservación de Alimentos","semestre":5,"creditos":1,"presedentes":{"p1":"2092324","p2":""},"aprobada":False,"elejida":False},"21":{"codigo":"2093112","materia":"Inglés Técnico I","semestre":5,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"22":{"codigo":"2093113","materia":"Higiene y Saneamiento de la Ind. Alimentaria","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"23":{"codigo":"2093115","materia":"Procesos de Conservación de Alimentos","semestre":5,"creditos":5,"presedentes":{"p1":"2092324","p2":""},"aprobada":False,"elejida":False},"24":{"codigo":"2093213","materia":"Administración de Empresas","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"25":{"codigo":"2093024","materia":"Análisis Estadístico","semestre":6,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"26":{"codigo":"2093122","materia":"Inglés Técnico II","semestre":6,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"27":{"codigo":"2093123","materia":"Planeación y Control de la Producción","semestre":6,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"28":{"codigo":"2093224","materia":"Tecnología de Productos Lácteos","semestre":6,"creditos":4,"presedentes":{"p1":"2092424","p2":""},"aprobada":False,"elejida":False},"29":{"codigo":"2093324","materia":"Tecnología de Productos Cárnicos","semestre":6,"creditos":4,"presedentes":{"p1":"2092224","p2":""},"aprobada":False,"elejida":False},"30":{"codigo":"2094113","materia":"Metodología de la Investigación","semestre":7,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"31":{"codigo":"2094214","materia":"Evaluación Sensorial de Alimentos","semestre":7,"creditos":4,"presedentes":{"p1":"2093024","p2":""},"aprobada":False,"elejida":False},"32":{"codigo":"2094414","materia":"Tecnología de Alimentos Acuícolas","semestre":7,"creditos":4,"presedentes":{"p1":"2093111","p2":"2093115"},"aprobada":False,"elejida":False},"33":{"codigo":"2094514","materia":"Tecnología de Alimentos Vegetales","semestre":7,"creditos":4,"presedentes":{"p1":"2093111","p2":"2093115"},"aprobada":False,"elejida":False},"34":{"codigo":"2094122","materia":"Ética Profesional y Legislación Alimentaria","semestre":8,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"35":{"codigo":"2094123","materia":"Mercadotecnia","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"36":{"codigo":"2094124","materia":"Control de Calidad","semestre":8,"creditos":4,"presedentes":{"p1":"2093024","p2":""},"aprobada":False,"elejida":False},"37":{"codigo":"2094222","materia":"Toxicología de Alimentos","semestre":8,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"38":{"codigo":"2095112","materia":"Seminario","semestre":9,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"39":{"codigo":"2095513","materia":"Seminario Trabajo de Grado","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"40":{"codigo":"2095913","materia":"Fundam. del Desarrollo de Nuevos Productos","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"41":{"codigo":"2095129","materia":"Trabajo de Grado","semestre":10,"creditos":9,"presedentes":{"p1":"2095513","p2":""},"aprobada":False,"elejida":False},"42":{"codigo":"2092512","materia":"Alimentos y Sociedad","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"43":{"codigo":"2093212","materia":"Biodeterioro de Alimentos","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"44":{"codigo":"2093222","materia":"Salud Ocupacional","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"45":{"codigo":"2093313","materia":"Estadística no Paramétrica","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"46":{"codigo":"2093413","materia":"Evaluación de la Calidad Proteínica","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"47":{"codigo":"2093523","materia":"Diseño y Análisis de Experimentos I","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"48":{"codigo":"2093533","materia":"Investigación por Muestreo","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"49":{"codigo":"2093614","materia":"Análisis de Regresión","semestre":88,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"50":{"codigo":"2093724","materia":"Análisis Mulrivariante I","semestre":88,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"51":{"codigo":"2094023","materia":"Biotecnología de Alimentos","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"52":{"codigo":"2094213","materia":"Seguridad Industrial","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"53":{"codigo":"2094223","materia":"Fermentación Industrial","semestre":88,"creditos":3,"presedentes":{"p1":"2092424","p2":""},"aprobada":False,"elejida":False},"54":{"codigo":"2094323","materia":"Manejo Post-cosecha de Frutos y Hortalizas","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"55":{"codigo":"2094324","materia":"Diseño y Análisis de Experimentos II","semestre":88,"creditos":4,"presedentes":{"p1":"2093523","p2":""},"aprobada":False,"elejida":False},"56":{"codigo":"2094423","materia":"Superficie de Respuesta","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"57":{"codigo":"2094523","materia":"Gestión y Comercial. En la Ind. Alimentaria","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"58":{"codigo":"2095012","materia":"Org. y Admón. de Serv. de Aliment. y Bebidas","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"59":{"codigo":"2095613","materia":"Aditivos Alimentarios","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"60":{"codigo":"2095813","materia":"Pasantía Industrial","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"61":{"codigo":"0045622","materia":"Técnicas Pedagógicas","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"62":{"codigo":"0062052","materia":"Dinámica de Grupos","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"63":{"codigo":"0062123","materia":"Literatura Venezolana","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"64":{"codigo":"0062412","materia":"Etimología Grecolatina","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"65":{"codigo":"0063622","materia":"Redacción y Composición","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"66":{"codigo":"0064022","materia":"Ortografía","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"67":{"codigo":"0073312","materia":"Etimología Morfológica de las Palabras Técnic","semestre":99,"creditos":2,"presedentes":{"p1":"2093112","p2":""},"aprobada":False,"elejida":False},"68":{"codigo":"0073322","materia":"Inglés Técnico Avanzado","semestre":99,"creditos":2,"presedentes":{"p1":"2093122","p2":""},"aprobada":False,"elejida":False},"69":{"codigo":"0074212","materia":"Inglés Conversacional I","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"70":{"codigo":"0074222","materia":"Inglés Conversacional II","semestre":99,"creditos":2,"presedentes":{"p1":"0074212","p2":""},"aprobada":False,"elejida":False},"71":{"codigo":"0092112","materia":"Programación Neurolingüistica","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"72":{"codigo":"0092312","materia":"Toma de Decisiones","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"73":{"codigo":"0093112","materia":"Motivación y Comunicación","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"74":{"codigo":"0113053","materia":"Dirección de Reuniones","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"75":{"codigo":"0113323","materia":"Geografía de Venezuela","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"76":{"codigo":"0114122","materia":"Teoría Económica","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"77":{"codigo":"0115312","materia":"Los Derechos Humanos en Venezuela","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False}}
-	elif carrera.lower() == 'produccion':
-		pensum = {"0":{"codigo":"0021111","materia":"Extraacadémica","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"1":{"codigo":"0061013","materia":"Comprensión y expresión Lingüística I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"2":{"codigo":"0081714","materia":"Matemática I","semestre":1,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"3":{"codigo":"0091012","materia":"Desarrollo de Destrezas para el Aprendizaje","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"4":{"codigo":"0101714","materia":"Química General","semestre":1,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"5":{"codigo":"0151111","materia":"Extraacadémica (Deportiva)","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"6":{"codigo":"0211111","materia":"Laboratorio Biología General","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"7":{"codigo":"0211113","materia":"Biología General","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"8":{"codigo":"0071723","materia":"Inglés Instrumental","semestre":2,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"9":{"codigo":"0081724","materia":"Matemáticas II","semestre":2,"creditos":4,"presedentes":{"p1":"0081714","p2":""},"aprobada":False,"elejida":False},"10":{"codigo":"0101724","materia":"Química Orgánica","semestre":2,"creditos":4,"presedentes":{"p1":"0101714","p2":""},"aprobada":False,"elejida":False},"11":{"codigo":"0201821","materia":"Introducción a la Agronomía","semestre":2,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"12":{"codigo":"0211121","materia":"Dibujo","semestre":2,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"13":{"codigo":"0211322","materia":"Introducción a La Producción Animal I","semestre":2,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"14":{"codigo":"0202033","materia":"Botánica Agrícola","semestre":3,"creditos":3,"presedentes":{"p1":"0211111","p2":"0211113"},"aprobada":False,"elejida":False},"15":{"codigo":"0212033","materia":"Bioquímica","semestre":3,"creditos":3,"presedentes":{"p1":"0101724","p2":""},"aprobada":False,"elejida":False},"16":{"codigo":"0212132","materia":"Introducción a la Producción Animal II","semestre":3,"creditos":2,"presedentes":{"p1":"0211322","p2":""},"aprobada":False,"elejida":False},"17":{"codigo":"0212134","materia":"Física","semestre":3,"creditos":4,"presedentes":{"p1":"0081724","p2":""},"aprobada":False,"elejida":False},"18":{"codigo":"0212533","materia":"Anatomia Animal General","semestre":3,"creditos":3,"presedentes":{"p1":"0211111","p2":"0211113"},"aprobada":False,"elejida":False},"19":{"codigo":"0212933","materia":"Zoología Agrícola","semestre":3,"creditos":3,"presedentes":{"p1":"0211111","p2":"0211113"},"aprobada":False,"elejida":False},"20":{"codigo":"0072742","materia":"Ingles Técnico","semestre":4,"creditos":2,"presedentes":{"p1":"0071723","p2":""},"aprobada":False,"elejida":False},"21":{"codigo":"0202943","materia":"Edafología","semestre":4,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"22":{"codigo":"0212043","materia":"Estadística","semestre":4,"creditos":3,"presedentes":{"p1":"0081724","p2":""},"aprobada":False,"elejida":False},"23":{"codigo":"0212241","materia":"Informática","semestre":4,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"24":{"codigo":"0212543","materia":"Microbiología","semestre":4,"creditos":3,"presedentes":{"p1":"0212033","p2":""},"aprobada":False,"elejida":False},"25":{"codigo":"0212643","materia":"Topografia","semestre":4,"creditos":3,"presedentes":{"p1":"0211121","p2":""},"aprobada":False,"elejida":False},"26":{"codigo":"0212743","materia":"Nutricion Animal General","semestre":4,"creditos":3,"presedentes":{"p1":"0212033","p2":""},"aprobada":False,"elejida":False},"27":{"codigo":"0203153","materia":"Economía y Mercadeo Agrícola","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"28":{"codigo":"0213053","materia":"Construcciones Rurales","semestre":5,"creditos":3,"presedentes":{"p1":"0212643","p2":""},"aprobada":False,"elejida":False},"29":{"codigo":"0213653","materia":"Nutricion y Alimentacion No Rumiantes","semestre":5,"creditos":3,"presedentes":{"p1":"0212743","p2":""},"aprobada":False,"elejida":False},"30":{"codigo":"0213753","materia":"Genética","semestre":5,"creditos":3,"presedentes":{"p1":"0212043","p2":""},"aprobada":False,"elejida":False},"31":{"codigo":"0213853","materia":"Fisiología Animal General","semestre":5,"creditos":3,"presedentes":{"p1":"0212533","p2":""},"aprobada":False,"elejida":False},"32":{"codigo":"0213952","materia":"Metodologia de La Investigación","semestre":5,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"33":{"codigo":"0213163","materia":"Diseño de Experimentos","semestre":6,"creditos":3,"presedentes":{"p1":"0212043","p2":""},"aprobada":False,"elejida":False},"34":{"codigo":"0213263","materia":"Mejoramiento Animal","semestre":6,"creditos":3,"presedentes":{"p1":"0213753","p2":""},"aprobada":False,"elejida":False},"35":{"codigo":"0213462","materia":"Fertilidad de Suelos","semestre":6,"creditos":2,"presedentes":{"p1":"0202943","p2":""},"aprobada":False,"elejida":False},"36":{"codigo":"0213763","materia":"Nutrición y Alimentación de Rumiantes","semestre":6,"creditos":3,"presedentes":{"p1":"0212743","p2":""},"aprobada":False,"elejida":False},"37":{"codigo":"0213963","materia":"Sanidad Animal","semestre":6,"creditos":3,"presedentes":{"p1":"0212543","p2":""},"aprobada":False,"elejida":False},"38":{"codigo":"0204183","materia":"Administración de Empresas Agrícolas","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"39":{"codigo":"0204583","materia":"Sociología y Desarrollo Rural","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"40":{"codigo":"0214083","materia":"Producción de Porcinos","semestre":8,"creditos":3,"presedentes":{"p1":"0213653","p2":""},"aprobada":False,"elejida":False},"41":{"codigo":"0214283","materia":"Forrajicultura Aplicada","semestre":8,"creditos":3,"presedentes":{"p1":"0214673","p2":""},"aprobada":False,"elejida":False},"42":{"codigo":"0214883","materia":"Producción de Ovinos y Caprinos","semestre":8,"creditos":3,"presedentes":{"p1":"0213763","p2":""},"aprobada":False,"elejida":False},"43":{"codigo":"0214983","materia":"Producción de Aves","semestre":8,"creditos":3,"presedentes":{"p1":"0213653","p2":""},"aprobada":False,"elejida":False},"44":{"codigo":"0204274","materia":"Maquinaria Agrícola","semestre":7,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"45":{"codigo":"0214073","materia":"Acuicultura","semestre":7,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"46":{"codigo":"0214673","materia":"Forrajicultura General","semestre":7,"creditos":3,"presedentes":{"p1":"0213462","p2":""},"aprobada":False,"elejida":False},"47":{"codigo":"0214873","materia":"Fisiología de la Reproducción","semestre":7,"creditos":3,"presedentes":{"p1":"0213853","p2":""},"aprobada":False,"elejida":False},"48":{"codigo":"0214973","materia":"Parasitología","semestre":7,"creditos":3,"presedentes":{"p1":"0213963","p2":""},"aprobada":False,"elejida":False},"49":{"codigo":"0205193","materia":"Extensión Rural","semestre":9,"creditos":3,"presedentes":{"p1":"0204583","p2":""},"aprobada":False,"elejida":False},"50":{"codigo":"0205392","materia":"Derecho y Legislación Agrícola","semestre":9,"creditos":2,"presedentes":{"p1":"0204583","p2":""},"aprobada":False,"elejida":False},"51":{"codigo":"0215091","materia":"Pasantía de Campo","semestre":9,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"52":{"codigo":"0215193","materia":"Producción de Bovinos de Carne","semestre":9,"creditos":3,"presedentes":{"p1":"0214873","p2":""},"aprobada":False,"elejida":False},"53":{"codigo":"0215293","materia":"Producción de Bovinos de Leche","semestre":9,"creditos":3,"presedentes":{"p1":"0214873","p2":""},"aprobada":False,"elejida":False},"54":{"codigo":"0215693","materia":"Formulación y Evaluación de Proyectos Agrícolas","semestre":9,"creditos":3,"presedentes":{"p1":"0204183","p2":""},"aprobada":False,"elejida":False},"55":{"codigo":"0215791","materia":"Seminario Trabajo de Grado","semestre":9,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"56":{"codigo":"0215209","materia":"Trabajo de Grado","semestre":10,"creditos":9,"presedentes":{"p1":"0215791","p2":""},"aprobada":False,"elejida":False},"57":{"codigo":"0214100","materia":"Servicio Comunitario","semestre":10,"creditos":0,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"58":{"codigo":"9099999","materia":"Áreas de Grado","semestre":10,"creditos":9,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"59":{"codigo":"0202633","materia":"Climatología","semestre":88,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"60":{"codigo":"0203552","materia":"Hidráulica","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"61":{"codigo":"0203662","materia":"Mecánica de Suelos","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"62":{"codigo":"0204674","materia":"Riego y Drenaje","semestre":88,"creditos":4,"presedentes":{"p1":"0203552","p2":""},"aprobada":False,"elejida":False},"63":{"codigo":"0205932","materia":"Parques y Jardines","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"64":{"codigo":"0213362","materia":"Apicultura","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"65":{"codigo":"0213662","materia":"Piscicultura","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"66":{"codigo":"0214272","materia":"Fisioclimatología","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"67":{"codigo":"0214372","materia":"Fisiología de la Lactancia","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"68":{"codigo":"0214382","materia":"Cunicultura","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"69":{"codigo":"0214472","materia":"Ectoparásitos","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"70":{"codigo":"0214572","materia":"Fisiología Digestiva de Rumiantes","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"71":{"codigo":"0214822","materia":"Producción de Búfalos","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"72":{"codigo":"0215592","materia":"Inseminación Articial","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"73":{"codigo":"2092512","materia":"Alimentos y Sociedad","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"74":{"codigo":"2093324","materia":"Tecnología de Productos Cárnicos","semestre":88,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"75":{"codigo":"2095314","materia":"Tecnología de Productos Lácteos","semestre":88,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"76":{"codigo":"0061222","materia":"Historia de la Cultura","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"77":{"codigo":"6812133","materia":"Introducción a la Gerencia de Recursos Humano","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"78":{"codigo":"6813453","materia":"Dinámica de Grupo","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"79":{"codigo":"6814182","materia":"Dirección de Reuniones","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"80":{"codigo":"6814472","materia":"Liderazgo, Motivación y Comunicación","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"81":{"codigo":"6815393","materia":"Ética Profesional","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"82":{"codigo":"6815493","materia":"Toma de Decisiones","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"83":{"codigo":"9032242","materia":"Educación Ambiental","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False}}
-	elif carrera.lower() == 'gerencia':
-		pensum = {"0":{"codigo":"0021111","materia":"Extraacadémica","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"1":{"codigo":"0061213","materia":"Comprensión y Expresión Lingüística I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"2":{"codigo":"0071513","materia":"Inglés I para Ciencias Administrativas","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"3":{"codigo":"0081613","materia":"Matemáticas I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"4":{"codigo":"0091012","materia":"Desarrollo de Destrezas para el Aprendizaje","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"5":{"codigo":"0061223","materia":"Comprensión y Expresión Lingüística II","semestre":2,"creditos":3,"presedentes":{"p1":"0061213","p2":""},"aprobada":False,"elejida":False},"6":{"codigo":"0071523","materia":"Inglés II para Ciencias Administrativas","semestre":2,"creditos":3,"presedentes":{"p1":"0071513","p2":""},"aprobada":False,"elejida":False},"7":{"codigo":"0081623","materia":"Matemáticas II","semestre":2,"creditos":3,"presedentes":{"p1":"0081613","p2":""},"aprobada":False,"elejida":False},"8":{"codigo":"6811123","materia":"Teoría Administrativa","semestre":2,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"9":{"codigo":"6811823","materia":"Informática","semestre":2,"creditos":3,"presedentes":{"p1":"0081613","p2":""},"aprobada":False,"elejida":False},"10":{"codigo":"6812133","materia":"Introducción a la Gerencia de Recursos Humanos","semestre":3,"creditos":3,"presedentes":{"p1":"6811123","p2":""},"aprobada":False,"elejida":False},"11":{"codigo":"6812333","materia":"Sociología del Trabajo","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"12":{"codigo":"6812434","materia":"Psicología General","semestre":3,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"13":{"codigo":"6812533","materia":"Estadística I","semestre":3,"creditos":3,"presedentes":{"p1":"0081623","p2":""},"aprobada":False,"elejida":False},"14":{"codigo":"6812633","materia":"Microeconomía","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"15":{"codigo":"6812043","materia":"Introducción a la Investigación","semestre":4,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"16":{"codigo":"6812144","materia":"Gestión de RRHH I","semestre":4,"creditos":4,"presedentes":{"p1":"6812133","p2":""},"aprobada":False,"elejida":False},"17":{"codigo":"6812444","materia":"Psicología Social","semestre":4,"creditos":4,"presedentes":{"p1":"6812434","p2":""},"aprobada":False,"elejida":False},"18":{"codigo":"6812543","materia":"Estadística Aplicada","semestre":4,"creditos":3,"presedentes":{"p1":"6812533","p2":""},"aprobada":False,"elejida":False},"19":{"codigo":"6812643","materia":"Macroeconomía","semestre":4,"creditos":3,"presedentes":{"p1":"6812633","p2":""},"aprobada":False,"elejida":False},"20":{"codigo":"6813053","materia":"Metodología de la Investigación","semestre":5,"creditos":3,"presedentes":{"p1":"6812043","p2":""},"aprobada":False,"elejida":False},"21":{"codigo":"6813154","materia":"Gestión de RRHH II","semestre":5,"creditos":4,"presedentes":{"p1":"6812144","p2":""},"aprobada":False,"elejida":False},"22":{"codigo":"6813353","materia":"Introducción al Derecho","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"23":{"codigo":"6813453","materia":"Dinámica de Grupo","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"24":{"codigo":"6813654","materia":"Contabilidad General","semestre":5,"creditos":4,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"25":{"codigo":"6813164","materia":"Gestión de RRHH III","semestre":6,"creditos":4,"presedentes":{"p1":"6813154","p2":""},"aprobada":False,"elejida":False},"26":{"codigo":"6813363","materia":"Legislación Laboral","semestre":6,"creditos":3,"presedentes":{"p1":"6813353","p2":""},"aprobada":False,"elejida":False},"27":{"codigo":"6813463","materia":"Comportamiento Organizacional","semestre":6,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"28":{"codigo":"6813663","materia":"Sueldos y Salarios I","semestre":6,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"29":{"codigo":"6814173","materia":"Gestión de RRHH en el Sector Público","semestre":7,"creditos":3,"presedentes":{"p1":"6813164","p2":""},"aprobada":False,"elejida":False},"30":{"codigo":"6814273","materia":"Fisiología y Ergonomía del Trabajo","semestre":7,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"31":{"codigo":"6814373","materia":"Derecho Colectivo del Trabajo","semestre":7,"creditos":3,"presedentes":{"p1":"6813363","p2":""},"aprobada":False,"elejida":False},"32":{"codigo":"6814673","materia":"Sueldos y Salarios II","semestre":7,"creditos":3,"presedentes":{"p1":"6813663","p2":""},"aprobada":False,"elejida":False},"33":{"codigo":"6814873","materia":"Seguridad Social","semestre":7,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"34":{"codigo":"6814183","materia":"Cambio y Estrategias Organizacionales","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"35":{"codigo":"6814283","materia":"Seguridad, Higiene y Ambiente","semestre":8,"creditos":3,"presedentes":{"p1":"6814273","p2":""},"aprobada":False,"elejida":False},"36":{"codigo":"6814383","materia":"Gestión Internacional del Trabajo","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"37":{"codigo":"6814683","materia":"Gestión Estratégica de Empresa","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"38":{"codigo":"6814883","materia":"Informática Gerencial","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"39":{"codigo":"6815093","materia":"Seminario de Proyecto de Tesis de Grado","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"40":{"codigo":"6815193","materia":"Sistemas y Proced. Administrativos de RRHH","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"41":{"codigo":"6815393","materia":"Ética Profesional","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"42":{"codigo":"6815493","materia":"Toma de Decisiones","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"43":{"codigo":"6815693","materia":"Presupuesto Empresarial","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"44":{"codigo":"6815009","materia":"Trabajo de Grado","semestre":10,"creditos":9,"presedentes":{"p1":"6815093","p2":""},"aprobada":False,"elejida":False},"45":{"codigo":"6814072","materia":"Programación Neurolingüística","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"46":{"codigo":"6814172","materia":"Problemas de Personal","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"47":{"codigo":"6814372","materia":"Procedimientos Administrativos del Trabajo","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"48":{"codigo":"6814472","materia":"Liderazgo, Motivación y Comunicación","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"49":{"codigo":"6814672","materia":"Calidad y Productividad en la Empresa","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"50":{"codigo":"6815092","materia":"Inteligencia Emocional","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"51":{"codigo":"6815192","materia":"Consultoría de Procesos","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"52":{"codigo":"6815292","materia":"Psicosociología del Trabajo","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"53":{"codigo":"6815392","materia":"Relaciones Laborales","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"54":{"codigo":"6815492","materia":"Estrategias Gerenciales","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"55":{"codigo":"6815592","materia":"Mercadeo Interno","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"56":{"codigo":"6815692","materia":"Impuesto Sobre la Renta","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"57":{"codigo":"6813662","materia":"Problemas Sociales y Económicos de Venezuela","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"58":{"codigo":"6814182","materia":"Dirección de Reuniones","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"59":{"codigo":"6814282","materia":"Gestión Ambiental","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"60":{"codigo":"6814682","materia":"Cooperativismo","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False}}
-	elif carrera.lower() == 'contaduria':
-		pensum = {"0":{"codigo":"0021111","materia":"Extraacadémica","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"1":{"codigo":"0061922","materia":"Expresión Oral y Escrita","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"2":{"codigo":"0071513","materia":"Inglés I para Ciencias Administrativas","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"3":{"codigo":"0081613","materia":"Matemáticas I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"4":{"codigo":"0091012","materia":"Desarrollo de Destrezas para el Aprendizaje","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"5":{"codigo":"0911013","materia":"Introd. a la Administración y Contaduría","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"6":{"codigo":"0071523","materia":"Inglés II para Ciencias Administrativas","semestre":2,"creditos":3,"presedentes":{"p1":"0071513","p2":""},"aprobada":False,"elejida":False},"7":{"codigo":"0081623","materia":"Matemáticas II","semestre":2,"creditos":3,"presedentes":{"p1":"0081613","p2":""},"aprobada":False,"elejida":False},"8":{"codigo":"0111623","materia":"Problematica del Desarrollo Socio-Económico de Vzla","semestre":2,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"9":{"codigo":"0911323","materia":"Contabilidad Básica I","semestre":2,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"10":{"codigo":"0911822","materia":"Informática I","semestre":2,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"11":{"codigo":"0921123","materia":"Planificación Administrativa","semestre":2,"creditos":3,"presedentes":{"p1":"0911013","p2":""},"aprobada":False,"elejida":False},"12":{"codigo":"0912333","materia":"Contabilidad Básica II","semestre":3,"creditos":3,"presedentes":{"p1":"0911323","p2":""},"aprobada":False,"elejida":False},"13":{"codigo":"0912833","materia":"Informática II","semestre":3,"creditos":3,"presedentes":{"p1":"0911822","p2":""},"aprobada":False,"elejida":False},"14":{"codigo":"0912933","materia":"Matemáticas Financieras I","semestre":3,"creditos":3,"presedentes":{"p1":"0081613","p2":""},"aprobada":False,"elejida":False},"15":{"codigo":"0922233","materia":"Administración de Empresas I","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"16":{"codigo":"0922633","materia":"Fundamentos del Derecho","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"17":{"codigo":"0922733","materia":"Economía I","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"18":{"codigo":"0912343","materia":"Contabilidad Avanzada I","semestre":4,"creditos":3,"presedentes":{"p1":"0912333","p2":""},"aprobada":False,"elejida":False},"19":{"codigo":"0912943","materia":"Matemáticas Financieras II","semestre":4,"creditos":3,"presedentes":{"p1":"0912933","p2":""},"aprobada":False,"elejida":False},"20":{"codigo":"0922243","materia":"Administración de Empresas II","semestre":4,"creditos":3,"presedentes":{"p1":"0922233","p2":""},"aprobada":False,"elejida":False},"21":{"codigo":"0922643","materia":"Derecho Mercantil","semestre":4,"creditos":3,"presedentes":{"p1":"0922633","p2":""},"aprobada":False,"elejida":False},"22":{"codigo":"0922743","materia":"Economía II","semestre":4,"creditos":3,"presedentes":{"p1":"0922733","p2":""},"aprobada":False,"elejida":False},"23":{"codigo":"0913353","materia":"Contabilidad Avanzada II","semestre":5,"creditos":3,"presedentes":{"p1":"0912343","p2":""},"aprobada":False,"elejida":False},"24":{"codigo":"0913853","materia":"Estadística I","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"25":{"codigo":"0923253","materia":"Administración de Recursos Humanos","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"26":{"codigo":"0923653","materia":"Derecho Laboral","semestre":5,"creditos":3,"presedentes":{"p1":"0922633","p2":""},"aprobada":False,"elejida":False},"27":{"codigo":"0923753","materia":"Moneda, Banca y Crédito","semestre":5,"creditos":3,"presedentes":{"p1":"0922743","p2":""},"aprobada":False,"elejida":False},"28":{"codigo":"0913362","materia":"Ajuste por Inflación","semestre":6,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"29":{"codigo":"0913363","materia":"Contabilidad Avanzada III","semestre":6,"creditos":3,"presedentes":{"p1":"0913353","p2":""},"aprobada":False,"elejida":False},"30":{"codigo":"0913563","materia":"Contabilidad de Costos I","semestre":6,"creditos":3,"presedentes":{"p1":"0913353","p2":""},"aprobada":False,"elejida":False},"31":{"codigo":"0913863","materia":"Estadística II","semestre":6,"creditos":3,"presedentes":{"p1":"0913853","p2":""},"aprobada":False,"elejida":False},"32":{"codigo":"0923062","materia":"Metodología de la Investigación","semestre":6,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"33":{"codigo":"0923763","materia":"Finanzas Públicas","semestre":6,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"34":{"codigo":"0914373","materia":"Tributos I","semestre":7,"creditos":3,"presedentes":{"p1":"0923763","p2":""},"aprobada":False,"elejida":False},"35":{"codigo":"0914474","materia":"Auditoría I","semestre":7,"creditos":4,"presedentes":{"p1":"0913363","p2":""},"aprobada":False,"elejida":False},"36":{"codigo":"0914573","materia":"Contabilidad de Costos II","semestre":7,"creditos":3,"presedentes":{"p1":"0913563","p2":""},"aprobada":False,"elejida":False},"37":{"codigo":"0914873","materia":"Análisis de los Estados Financieros","semestre":7,"creditos":3,"presedentes":{"p1":"0913362","p2":""},"aprobada":False,"elejida":False},"38":{"codigo":"0924972","materia":"Presupuesto Público","semestre":7,"creditos":2,"presedentes":{"p1":"0923763","p2":""},"aprobada":False,"elejida":False},"39":{"codigo":"0914382","materia":"Contabilidad Gubernamental","semestre":8,"creditos":2,"presedentes":{"p1":"0924972","p2":""},"aprobada":False,"elejida":False},"40":{"codigo":"0914383","materia":"Tributos II","semestre":8,"creditos":3,"presedentes":{"p1":"0914373","p2":""},"aprobada":False,"elejida":False},"41":{"codigo":"0914483","materia":"Auditoría II","semestre":8,"creditos":3,"presedentes":{"p1":"0914474","p2":""},"aprobada":False,"elejida":False},"42":{"codigo":"0914582","materia":"Contabilidad de Costos III","semestre":8,"creditos":2,"presedentes":{"p1":"0914573","p2":""},"aprobada":False,"elejida":False},"43":{"codigo":"0914583","materia":"Contabilidades Especiales I","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"44":{"codigo":"0924183","materia":"Sistemas y Procedimientos Administrativos y Contables","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"45":{"codigo":"0915392","materia":"Contabilidad Computarizada","semestre":9,"creditos":2,"presedentes":{"p1":"0924183","p2":""},"aprobada":False,"elejida":False},"46":{"codigo":"0915393","materia":"Tributos III","semestre":9,"creditos":3,"presedentes":{"p1":"0914373","p2":""},"aprobada":False,"elejida":False},"47":{"codigo":"0915493","materia":"Auditoría III","semestre":9,"creditos":3,"presedentes":{"p1":"0914483","p2":""},"aprobada":False,"elejida":False},"48":{"codigo":"0915509","materia":"Trabajo de Grado","semestre":10,"creditos":9,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"49":{"codigo":"0915603","materia":"Ética Profesional","semestre":10,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"50":{"codigo":"0913852","materia":"Telemática","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"51":{"codigo":"0915302","materia":"Política Tributaria","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"52":{"codigo":"0915402","materia":"Auditoría Interna","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"53":{"codigo":"0916092","materia":"Problemas de Impuesto Sobre la Renta","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"54":{"codigo":"0923162","materia":"Administración Pública","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"55":{"codigo":"0923662","materia":"Seminario de Contratos Bancarios","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"56":{"codigo":"0924682","materia":"Seminario de Instituciones Financieras","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"57":{"codigo":"0925092","materia":"Seminario de Trabajo de Grado","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"58":{"codigo":"0925602","materia":"Problemas Especiales de Derecho Mercantil","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"59":{"codigo":"0061183","materia":"Etica","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"60":{"codigo":"0061222","materia":"Historia de la Cultura","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"61":{"codigo":"0061822","materia":"Sexología Básica","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"62":{"codigo":"0062032","materia":"Expresión Escrita","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"63":{"codigo":"0062052","materia":"Dinámica de Grupos","semestre":99,"creditos":2,"presedentes":{"p1":"0061922","p2":""},"aprobada":False,"elejida":False},"64":{"codigo":"0062062","materia":"Introducción a la Literatura Contemporánea","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"65":{"codigo":"0062122","materia":"Comunicación y Sociedad","semestre":99,"creditos":2,"presedentes":{"p1":"0061922","p2":""},"aprobada":False,"elejida":False},"66":{"codigo":"0071112","materia":"Inglés Instrumental I","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"67":{"codigo":"0071222","materia":"Inglés Instrumental II","semestre":99,"creditos":2,"presedentes":{"p1":"0071112","p2":""},"aprobada":False,"elejida":False},"68":{"codigo":"0112832","materia":"Grupo y Liderazgo","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"69":{"codigo":"0112943","materia":"Introducción a la Filosofía de la Ciencia","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"70":{"codigo":"0113053","materia":"Dirección de Reuniones","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"71":{"codigo":"0113183","materia":"Sociología Urbana","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"72":{"codigo":"9032242","materia":"Educación Ambiental","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"73":{"codigo":"0915593","materia":"Contabilidad Especiales II","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"74":{"codigo":"0915992","materia":"Presupuesto de las Empresas","semestre":9,"creditos":2,"presedentes":{"p1":"0914582","p2":""},"aprobada":False,"elejida":False},"75":{"codigo":"0915993","materia":"Finanzas Corporativas","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False}}
-	elif carrera.lower() == 'agronomia':
-		pensum = {"0":{"codigo":"0204983","materia":"CEREALES Y LEGUMINOSAS","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"1":{"codigo":"0205593","materia":"FRUTALES","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"2":{"codigo":"0205803","materia":"HORTALIZAS","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"3":{"codigo":"0204813","materia":"SILVICULTURA","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"4":{"codigo":"0205283","materia":"CAFÉ Y CACAO","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"5":{"codigo":"0204193","materia":"RAÍCES Y TUBÉRCULOS","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"6":{"codigo":"0205913","materia":"TEXTILES Y OLEAGINOSAS","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"7":{"codigo":"0204103","materia":"PRODUCCIÓN DE SEMILLAS","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"8":{"codigo":"0214673","materia":"FORRAJICULTURA GENERAL","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"9":{"codigo":"0205993","materia":"CAÑA DE AZÚCAR Y PALMA ACEITERA","aprobada":False,"elejida":False,"creditos":3,"semestre":77,"presedentes":{"p1":"","p2":""}},"10":{"codigo":"0204902","materia":"FÍSICA DE SUELOS","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"11":{"codigo":"0204912","materia":"MAQUINARIA AGRÍCOLA AVANZADA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"0204274","p2":""}},"12":{"codigo":"0204922","materia":"BOMBAS Y BOMBEO","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"13":{"codigo":"0205912","materia":"QUÍMICA DE SUELOS","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"14":{"codigo":"0204942","materia":"DISEÑO  DE PRESAS Y PEQUEÑOS SISTEMAS DE RIEGO","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"15":{"codigo":"0204952","materia":"MÉTODOS MODERNOS DE RIEGO","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"0204674","p2":""}},"16":{"codigo":"0205902","materia":"CULTIVO DE TEJIDOS","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"17":{"codigo":"0204792","materia":"POLÍTICA Y DESARROLLO AGRÍCOLA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"0204583","p2":""}},"18":{"codigo":"0204892","materia":"COOPERATIVISMO","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"19":{"codigo":"0204992","materia":"CRÉDITO Y DESARROLLO AGRÍCOLA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"20":{"codigo":"0204932","materia":"OPERACIÓN Y MANTENIMIENTO DE SISTEMAS DE RIEGO","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"21":{"codigo":"0204962","materia":"ADMINISTRACIÓN DE LA FLORA Y LA FAUNA SILVESTRE","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"22":{"codigo":"0205922","materia":"FISIOLOGÍA POSTCOSECHA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"0203364","p2":""}},"23":{"codigo":"0205932","materia":"PARQUES Y JARDINES","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"24":{"codigo":"0205942","materia":"ESPECIES","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"25":{"codigo":"0205952","materia":"AGROLOGÍA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"0202943","p2":""}},"26":{"codigo":"0204772","materia":"MICROBIOLOGÍA AGRÍCOLA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"0203663","p2":""}},"27":{"codigo":"0205972","materia":"GERENCIA DE RECURSOS HUMANOS","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"28":{"codigo":"0205982","materia":"FITOMEJORAMIENTO AVANZADO","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"0204973","p2":""}},"29":{"codigo":"2092512","materia":"ALIMENTOS Y SOCIEDAD","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"30":{"codigo":"0214382","materia":"CUNICULTURA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"31":{"codigo":"0213362","materia":"APICULTURA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"32":{"codigo":"0215193","materia":"PRODUCCIÓN DE BOVINOS DE CARNE","aprobada":False,"elejida":False,"creditos":3,"semestre":88,"presedentes":{"p1":"","p2":""}},"33":{"codigo":"0214883","materia":"PRODUCCIÓN DE OVINOS Y CAPRINOS","aprobada":False,"elejida":False,"creditos":3,"semestre":88,"presedentes":{"p1":"","p2":""}},"34":{"codigo":"0214073","materia":"ACUICULTURA","aprobada":False,"elejida":False,"creditos":3,"semestre":88,"presedentes":{"p1":"","p2":""}},"35":{"codigo":"0635612","materia":"PETRÓLEO Y AMBIENTE","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"36":{"codigo":"0214083","materia":"PRODUCCIÓN DE PORCINOS","aprobada":False,"elejida":False,"creditos":3,"semestre":88,"presedentes":{"p1":"","p2":""}},"37":{"codigo":"0214983","materia":"PRODUCCIÓN DE AVES","aprobada":False,"elejida":False,"creditos":3,"semestre":88,"presedentes":{"p1":"","p2":""}},"38":{"codigo":"0213662","materia":"PISCICULTURA","aprobada":False,"elejida":False,"creditos":2,"semestre":88,"presedentes":{"p1":"","p2":""}},"39":{"codigo":"0215293","materia":"PRODUCCIÓN DE BOVINOS DE LECHE","aprobada":False,"elejida":False,"creditos":3,"semestre":88,"presedentes":{"p1":"","p2":""}},"40":{"codigo":"0061183","materia":"ÉTICA","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"41":{"codigo":"0061222","materia":"HISTORIA DE LA CULTURA","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"42":{"codigo":"0062032","materia":"EXPRESIÓN ESCRITA","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"43":{"codigo":"6813453","materia":"DINÁMICA DE GRUPOS","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"44":{"codigo":"6814472","materia":"LIDERAZGO, MOTIVACIÓN Y COMUNICACIÓN","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"45":{"codigo":"6814182","materia":"DIRECCIÓN DE REUNIONES","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"46":{"codigo":"0112943","materia":"INTROD. A LA FILOSOFÍA DE LA CIENCIA","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"47":{"codigo":"9032242","materia":"EDUCACIÓN AMBIENTAL","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"48":{"codigo":"0113183","materia":"SOCIOLOGÍA URBANA","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"49":{"codigo":"0071112","materia":"INGLÉS INSTRUMENTAL","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"50":{"codigo":"6815493","materia":"TOMA DE DECISIONES","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"51":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0081714","materia":"Matemática I","semestre":1,"presedentes":{"p1":"","p2":""}},"52":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0101714","materia":"Química General","semestre":1,"presedentes":{"p1":"","p2":""}},"53":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0031712","materia":"Biología I","semestre":1,"presedentes":{"p1":"","p2":""}},"54":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0061013","materia":"Comprensión y Expresión  Lingüística I","semestre":1,"presedentes":{"p1":"","p2":""}},"55":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0091012","materia":"DesarrollodeDestrezasparael\rAprendizaje","semestre":1,"presedentes":{"p1":"","p2":""}},"56":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0031711","materia":"Laboratorio de Biología I","semestre":1,"presedentes":{"p1":"","p2":""}},"57":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0021111","materia":"Extraacadémica","semestre":1,"presedentes":{"p1":"","p2":""}},"58":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0081724","materia":"Matemática II","semestre":2,"presedentes":{"p1":"0081714","p2":""}},"59":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0101724","materia":"Química Orgánica","semestre":2,"presedentes":{"p1":"0101714","p2":""}},"60":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0031723","materia":"Biología II","semestre":2,"presedentes":{"p1":"0031712","p2":""}},"61":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0031721","materia":"Laboratorio Biología II","semestre":2,"presedentes":{"p1":"0031711","p2":""}},"62":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0071723","materia":"Inglés Instrumental","semestre":2,"presedentes":{"p1":"","p2":""}},"63":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0101721","materia":"Laboratorio Química Orgánica","semestre":2,"presedentes":{"p1":"0101714","p2":""}},"64":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0201821","materia":"Introducción a la Agronomía","semestre":2,"presedentes":{"p1":"","p2":""}},"65":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0202132","materia":"Metodología de la Investigación","semestre":3,"presedentes":{"p1":"","p2":""}},"66":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202033","materia":"Botánica Agrícola","semestre":3,"presedentes":{"p1":"0031723","p2":"0031721"}},"67":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0212933","materia":"Zoología  Agrícola","semestre":3,"presedentes":{"p1":"0031723","p2":"0031721"}},"68":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202433","materia":"Física y Resistencia  de Materiales","semestre":3,"presedentes":{"p1":"0081724","p2":""}},"69":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202533","materia":"Bioquímica Vegetal","semestre":3,"presedentes":{"p1":"0101724","p2":""}},"70":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202633","materia":"Climatología","semestre":3,"presedentes":{"p1":"","p2":""}},"71":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0202731","materia":"Informática","semestre":3,"presedentes":{"p1":"","p2":""}},"72":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0212043","materia":"Estadística","semestre":4,"presedentes":{"p1":"0081724","p2":""}},"73":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202943","materia":"Edafología","semestre":4,"presedentes":{"p1":"0202633","p2":""}},"74":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202843","materia":"Anatomía Vegetal","semestre":4,"presedentes":{"p1":"0202033","p2":""}},"75":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202743","materia":"Taxonomía de Angiospermas","semestre":4,"presedentes":{"p1":"0202033","p2":""}},"76":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0202643","materia":"Dibujo y Construcciones Rurales","semestre":4,"presedentes":{"p1":"","p2":""}},"77":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0202542","materia":"Gestión de RRNN","semestre":4,"presedentes":{"p1":"","p2":""}},"78":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0203153","materia":"Economía y Mercadeo Agrícola","semestre":5,"presedentes":{"p1":"","p2":""}},"79":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0203254","materia":"Topografía y Vialidad Agrícola","semestre":5,"presedentes":{"p1":"0202643","p2":""}},"80":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0203553","materia":"Genética","semestre":5,"presedentes":{"p1":"0212043","p2":""}},"81":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0203753","materia":"Entomología General","semestre":5,"presedentes":{"p1":"0212933","p2":""}},"82":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0203853","materia":"Fertilizantes y Enmiendas","semestre":5,"presedentes":{"p1":"0202943","p2":""}},"83":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0203552","materia":"Hidráulica","semestre":5,"presedentes":{"p1":"","p2":""}},"84":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0203163","materia":"Manejo y Conservación de Suelos","semestre":6,"presedentes":{"p1":"0202943","p2":""}},"85":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0203263","materia":"Diseño de Experimentos","semestre":6,"presedentes":{"p1":"0212043","p2":""}},"86":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0203364","materia":"Fitofisiología","semestre":6,"presedentes":{"p1":"0202843","p2":""}},"87":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0203462","materia":"Desarrollo Agrícola y Ambiente","semestre":6,"presedentes":{"p1":"","p2":""}},"88":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0203662","materia":"Mecánica de Suelos","semestre":6,"presedentes":{"p1":"","p2":""}},"89":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0203663","materia":"Microbiología Vegetal","semestre":6,"presedentes":{"p1":"0202843","p2":""}},"90":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0204972","materia":"Entomología Aplicada","semestre":7,"presedentes":{"p1":"0203753","p2":""}},"91":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0204973","materia":"Fitomejoramiento","semestre":7,"presedentes":{"p1":"0203553","p2":""}},"92":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0204873","materia":"Biología y Combate de Malezas","semestre":7,"presedentes":{"p1":"","p2":""}},"93":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0204674","materia":"Riego y Drenaje","semestre":7,"presedentes":{"p1":"0203552","p2":""}},"94":{"creditos":4,"aprobada":False,"elejida":False,"codigo":"0204274","materia":"Maquinaria Agrícola","semestre":7,"presedentes":{"p1":"0203662","p2":""}},"95":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0204183","materia":"Administración de Empresas Agrícolas","semestre":8,"presedentes":{"p1":"","p2":""}},"96":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0204982","materia":"Formulación y Evaluación de Proyectos","semestre":8,"presedentes":{"p1":"","p2":""}},"97":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0204181","materia":"Capacitación Docente","semestre":8,"presedentes":{"p1":"","p2":""}},"98":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0204583","materia":"Sociología y Desarrollo Rural","semestre":8,"presedentes":{"p1":"","p2":""}},"99":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0204783","materia":"Fitopatología Aplicada","semestre":8,"presedentes":{"p1":"0203663","p2":""}},"100":{"creditos":1,"aprobada":False,"elejida":False,"codigo":"0214081","materia":"Introducción a la Zootecnia","semestre":8,"presedentes":{"p1":"","p2":""}},"101":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0205193","materia":"Extensión Rural","semestre":9,"presedentes":{"p1":"0204583","p2":""}},"102":{"creditos":2,"aprobada":False,"elejida":False,"codigo":"0205392","materia":"Derecho y Legislación Agrícola","semestre":9,"presedentes":{"p1":"0204583","p2":""}},"103":{"creditos":3,"aprobada":False,"elejida":False,"codigo":"0205093","materia":"Proyecto de Trabajo de Grado","semestre":9,"presedentes":{"p1":"0204982","p2":""}},"104":{"creditos":6,"aprobada":False,"elejida":False,"codigo":"0205006","materia":"Presentación y Discusión de Trabajo de Grado","semestre":10,"presedentes":{"p1":"0205093","p2":""}}}
-	elif carrera.lower() == 'administracion':
-		pensum = {"0":{"codigo":"0021111","materia":"Extraacadémica","semestre":1,"creditos":1,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"1":{"codigo":"0061922","materia":"Expresión Oral y Escrita","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"2":{"codigo":"0071513","materia":"Inglés I para Ciencias Administrativas","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"3":{"codigo":"0081613","materia":"Matemáticas I","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"4":{"codigo":"0091012","materia":"Desarrollo de Destrezas para el Aprendizaje","semestre":1,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"5":{"codigo":"0911013","materia":"Introd. a la Administración y Contaduría","semestre":1,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"6":{"codigo":"0071523","materia":"Inglés II para Ciencias Administrativas","semestre":2,"creditos":3,"presedentes":{"p1":"0071513","p2":""},"aprobada":False,"elejida":False},"7":{"codigo":"0081623","materia":"Matemáticas II","semestre":2,"creditos":3,"presedentes":{"p1":"0081613","p2":""},"aprobada":False,"elejida":False},"8":{"codigo":"0111623","materia":"Problematica del Desarrollo Socio-Económico de Vzla","semestre":2,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"9":{"codigo":"0911323","materia":"Contabilidad Básica I","semestre":2,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"10":{"codigo":"0911822","materia":"Informática I","semestre":2,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"11":{"codigo":"0921123","materia":"Planificación Administrativa","semestre":2,"creditos":3,"presedentes":{"p1":"0911013","p2":""},"aprobada":False,"elejida":False},"12":{"codigo":"0912333","materia":"Contabilidad Básica II","semestre":3,"creditos":3,"presedentes":{"p1":"0911323","p2":""},"aprobada":False,"elejida":False},"13":{"codigo":"0912833","materia":"Informática II","semestre":3,"creditos":3,"presedentes":{"p1":"0911822","p2":""},"aprobada":False,"elejida":False},"14":{"codigo":"0912933","materia":"Matemáticas Financieras I","semestre":3,"creditos":3,"presedentes":{"p1":"0081613","p2":""},"aprobada":False,"elejida":False},"15":{"codigo":"0922133","materia":"Organización Administrativa","semestre":3,"creditos":3,"presedentes":{"p1":"0921123","p2":""},"aprobada":False,"elejida":False},"16":{"codigo":"0922633","materia":"Fundamentos del Derecho","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"17":{"codigo":"0922733","materia":"Economía I","semestre":3,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"18":{"codigo":"0912343","materia":"Contabilidad Avanzada I","semestre":4,"creditos":3,"presedentes":{"p1":"0912333","p2":""},"aprobada":False,"elejida":False},"19":{"codigo":"0912943","materia":"Matemáticas Financieras II","semestre":4,"creditos":3,"presedentes":{"p1":"0912933","p2":""},"aprobada":False,"elejida":False},"20":{"codigo":"0922143","materia":"Dirección Administrativa","semestre":4,"creditos":3,"presedentes":{"p1":"0922133","p2":""},"aprobada":False,"elejida":False},"21":{"codigo":"0922643","materia":"Derecho Mercantil","semestre":4,"creditos":3,"presedentes":{"p1":"0922633","p2":""},"aprobada":False,"elejida":False},"22":{"codigo":"0922743","materia":"Economía II","semestre":4,"creditos":3,"presedentes":{"p1":"0922733","p2":""},"aprobada":False,"elejida":False},"23":{"codigo":"0913353","materia":"Contabilidad Avanzada II","semestre":5,"creditos":3,"presedentes":{"p1":"0912343","p2":""},"aprobada":False,"elejida":False},"24":{"codigo":"0913853","materia":"Estadística I","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"25":{"codigo":"0923153","materia":"Control Administrativo","semestre":5,"creditos":3,"presedentes":{"p1":"0922143","p2":""},"aprobada":False,"elejida":False},"26":{"codigo":"0923253","materia":"Administración de Recursos Humanos","semestre":5,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"27":{"codigo":"0923653","materia":"Derecho Laboral","semestre":5,"creditos":3,"presedentes":{"p1":"0922633","p2":""},"aprobada":False,"elejida":False},"28":{"codigo":"0923753","materia":"Moneda, Banca y Crédito","semestre":5,"creditos":3,"presedentes":{"p1":"0922743","p2":""},"aprobada":False,"elejida":False},"29":{"codigo":"0913563","materia":"Contabilidad de Costos I","semestre":6,"creditos":3,"presedentes":{"p1":"0913353","p2":""},"aprobada":False,"elejida":False},"30":{"codigo":"0913863","materia":"Estadística II","semestre":6,"creditos":3,"presedentes":{"p1":"0913853","p2":""},"aprobada":False,"elejida":False},"31":{"codigo":"0923062","materia":"Metodología de la Investigación","semestre":6,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"32":{"codigo":"0923162","materia":"Administración Pública","semestre":6,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"33":{"codigo":"0923763","materia":"Finanzas Públicas","semestre":6,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"34":{"codigo":"0914373","materia":"Tributos I","semestre":7,"creditos":3,"presedentes":{"p1":"0923763","p2":""},"aprobada":False,"elejida":False},"35":{"codigo":"0914573","materia":"Contabilidad de Costos II","semestre":7,"creditos":3,"presedentes":{"p1":"0913563","p2":""},"aprobada":False,"elejida":False},"36":{"codigo":"0914873","materia":"Análisis de los Estados Financieros","semestre":7,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"37":{"codigo":"0924173","materia":"Comportamiento Organizacional","semestre":7,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"38":{"codigo":"0924972","materia":"Presupuesto Público","semestre":7,"creditos":2,"presedentes":{"p1":"0923763","p2":""},"aprobada":False,"elejida":False},"39":{"codigo":"0914383","materia":"Tributos II","semestre":8,"creditos":3,"presedentes":{"p1":"0914373","p2":""},"aprobada":False,"elejida":False},"40":{"codigo":"0924183","materia":"Sistemas y Procedimientos Administrativos y Contables","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"41":{"codigo":"0924282","materia":"Responsabilidad Social y Ética","semestre":8,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"42":{"codigo":"0924783","materia":"Mercadeo","semestre":8,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"43":{"codigo":"0924883","materia":"Métodos Cuantitativos","semestre":8,"creditos":3,"presedentes":{"p1":"0913863","p2":""},"aprobada":False,"elejida":False},"44":{"codigo":"0915393","materia":"Tributos III","semestre":9,"creditos":3,"presedentes":{"p1":"0914373","p2":""},"aprobada":False,"elejida":False},"45":{"codigo":"0915992","materia":"Presupuesto de las Empresas","semestre":9,"creditos":2,"presedentes":{"p1":"0914573","p2":""},"aprobada":False,"elejida":False},"46":{"codigo":"0915993","materia":"Finanzas Corporativas","semestre":9,"creditos":3,"presedentes":{"p1":"0914873","p2":""},"aprobada":False,"elejida":False},"47":{"codigo":"0925293","materia":"Administración de la Producción","semestre":9,"creditos":3,"presedentes":{"p1":"0924883","p2":""},"aprobada":False,"elejida":False},"48":{"codigo":"0925009","materia":"Trabajo de Grado","semestre":10,"creditos":9,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"49":{"codigo":"0925103","materia":"Análisis de Gestión Administrativa","semestre":10,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"50":{"codigo":"0925202","materia":"Seminario de Gerencia Estratégica","semestre":10,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"51":{"codigo":"0913362","materia":"Ajuste por Inflación","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"52":{"codigo":"0913852","materia":"Telemática","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"53":{"codigo":"0915302","materia":"Política Tributaria","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"54":{"codigo":"0923662","materia":"Seminario de Contratos Bancarios","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"55":{"codigo":"0924682","materia":"Seminario de Instituciones Financieras","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"56":{"codigo":"0925092","materia":"Seminario de Trabajo de Grado","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"57":{"codigo":"0925392","materia":"Legislación Industrial","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"58":{"codigo":"0925502","materia":"Higiene y Seguridad Industrial","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"59":{"codigo":"0925602","materia":"Problemas Especiales de Derecho Mercantil","semestre":88,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"60":{"codigo":"0061183","materia":"Etica","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"61":{"codigo":"0061222","materia":"Historia de la Cultura","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"62":{"codigo":"0061822","materia":"Sexología Básica","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"63":{"codigo":"0062052","materia":"Dinámica de Grupos","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"64":{"codigo":"0062062","materia":"Introducción a la Literatura Contemporánea","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"65":{"codigo":"0071112","materia":"Inglés Instrumental I","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"66":{"codigo":"0112832","materia":"Grupo y Liderazgo","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"67":{"codigo":"0112943","materia":"Introducción a la Filosofía de la Ciencia","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"68":{"codigo":"0113053","materia":"Dirección de Reuniones","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"69":{"codigo":"0113183","materia":"Sociología Urbana","semestre":99,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"70":{"codigo":"9032242","materia":"Educación Ambiental","semestre":99,"creditos":2,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False},"71":{"codigo":"0925593","materia":"Contabilidad Gerencial","semestre":9,"creditos":3,"presedentes":{"p1":"0914573","p2":""},"aprobada":False,"elejida":False},"72":{"codigo":"0925793","materia":"Preparación y Evaluación de Proyectos","semestre":9,"creditos":3,"presedentes":{"p1":"","p2":""},"aprobada":False,"elejida":False}}
-	else:
-		raise ValueError(str("El campo 'carrera' no tiene el valor apropiado"))	
-	pensum_list:list = []
-	for indice, elemento in pensum.items():
-		pensum_list.append(elemento)
-	#print('-----------------------',len(pensum_list))
-	#print(pensum_list)
-	#print(type(pensum_list))
+		Valida qu el pensum sea una lista, leyendolo del archivo de datos de la carrera
+	"""
+	carrera = carrera.lower()
+	if carrera not in CARRERAS:
+		raise ValueError(str("El campo 'carrera' no tiene el valor apropiado"))
+	with open(os.path.join(DIRECTORIO_PENSUMS, carrera + '.json'), encoding='utf-8') as archivo:
+		pensum_list:list = json.load(archivo)
+	for materia in pensum_list:
+		materia['aprobada'] = False
+		materia['elejida'] = False
 	return pensum_list
 
+def validate_esquema_pensum(pensum:list)->bool:
+	"""
+		Valida que los datos de un pensum cumplan el esquema esperado antes de compilarlos
+	"""
+	if not isinstance(pensum, list) or len(pensum) == 0:
+		raise ValueError(str("El pensum debe ser una lista de materias no vacia"))
+	for indice, materia in enumerate(pensum):
+		if not isinstance(materia, dict):
+			raise ValueError(str("La materia %d del pensum debe ser un objeto" % indice))
+		for campo, tipo in ESQUEMA_MATERIA.items():
+			if campo not in materia:
+				raise ValueError(str("A la materia %d del pensum le falta el campo '%s'" % (indice, campo)))
+			if not isinstance(materia[campo], tipo) or isinstance(materia[campo], bool):
+				raise ValueError(str("El campo '%s' de la materia %d del pensum no tiene el tipo apropiado" % (campo, indice)))
+		if materia['codigo'] == '' or materia['creditos'] < 0 or materia['semestre'] <= 0:
+			raise ValueError(str("La materia %d del pensum tiene codigo, creditos o semestre invalidos" % indice))
+		presedentes = materia['presedentes']
+		if set(presedentes) != {'p1', 'p2'} or not all(isinstance(valor, str) for valor in presedentes.values()):
+			raise ValueError(str("Los presedentes de la materia %d deben tener solo 'p1' y 'p2' como texto" % indice))
+		if presedentes['p1'] == '' and presedentes['p2'] != '':
+			raise ValueError(str("La materia %d tiene 'p2' sin 'p1'" % indice))
+	return True
+
+CAMPOS_DATOS_PETICION = ('minimoCreditos', 'limiteCreditos', 'creditosaprobados')
+CAMPOS_MATERIA_PETICION = ('creditos', 'semestre')
+
+def es_numero(valor)->bool:
+	return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+def validate_peticion_generacion(datos:dict, materias:list)->bool:
+	"""
+		Valida que la clave "0" de una peticion de generacion traiga los creditos como
+		numeros y que cada materia tenga codigo, creditos y semestre numericos, antes de
+		que lleguen a la busqueda
+	"""
+	for campo in CAMPOS_DATOS_PETICION:
+		if not es_numero(datos.get(campo)):
+			raise ValueError(str("El campo '%s' de la clave '0' debe ser un numero" % campo))
+	for indice, materia in enumerate(materias, 1):
+		if materia.get('codigo') in (None, ''):
+			raise ValueError(str("A la materia %d de la peticion le falta el campo 'codigo'" % indice))
+		for campo in CAMPOS_MATERIA_PETICION:
+			if not es_numero(materia.get(campo)):
+				raise ValueError(str("El campo '%s' de la materia '%s' debe ser un numero" % (campo, materia['codigo'])))
+	return True
+
+def validate_horario_general(horario:dict)->bool:
+	"""
+		Valida que cada entrada del horario general sea una reunion con codigo, seccion,
+		dia, desde y hasta como texto
+	"""
+	if not isinstance(horario, dict):
+		raise ValueError(str("El horario debe ser un objeto con las reuniones de cada seccion"))
+	for clave, reunion in horario.items():
+		if not isinstance(reunion, dict):
+			raise ValueError(str("La entrada '%s' del horario debe ser un objeto" % clave))
+		for campo in CAMPOS_REUNION:
+			if not isinstance(reunion.get(campo), str):
+				raise ValueError(str("A la entrada '%s' del horario le falta el campo '%s'" % (clave, campo)))
+	return True
+
 def validar_horarios_semeste(horarios:dict):
 	horarios_list:list = []
 	for indice,elemento in horarios.items():
@@ -122,4 +175,38 @@ def validate_fecha(fecha:str)->bool:
 		fecha= datetime.strptime(fecha, '%Y-%m-%d')
 	except:
 		raise ValueError(str("La fecha debe de estar en el formato: 'YYYY-MM-DD' "))
-	return True
\ No newline at end of file
+	return True
+
+def validate_fecha_iso(fecha:str)->str:
+	"""
+		Valida la fecha y la devuelve siempre como 'YYYY-MM-DD', con el mes y el dia
+		rellenos con ceros ('2020-4-5' pasa a ser '2020-04-05')
+	"""
+	try:
+		return datetime.strptime(fecha, '%Y-%m-%d').date().isoformat()
+	except (TypeError, ValueError):
+		raise ValueError(str("La fecha debe de estar en el formato: 'YYYY-MM-DD' "))
+
+def validate_top_k(top_k)->int:
+	"""
+		Valida que el parametro top_k sea un entero positivo
+	"""
+	try:
+		top_k = int(top_k)
+	except (TypeError, ValueError):
+		raise ValueError(str("El parametro 'top_k' debe ser un numero entero"))
+	if top_k <= 0:
+		raise ValueError(str("El parametro 'top_k' debe ser mayor que cero"))
+	return top_k
+
+FORMATOS = ('completo', 'compacto')
+
+def validate_formato(formato)->str:
+	"""
+		Valida el formato pedido para los resultados de la generacion, por defecto 'completo'
+	"""
+	if formato is None or formato == '':
+		return 'completo'
+	if formato not in FORMATOS:
+		raise ValueError(str("El parametro 'formato' debe ser uno de: %s" % ', '.join(FORMATOS)))
+	return formato
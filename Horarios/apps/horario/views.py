@@ -1,12 +1,20 @@
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
 from rest_framework.views import APIView
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework import status
 from rest_framework import viewsets
 
+from apps.horario import medicion as horario_medicion
+from apps.horario import renderers as horario_renderers
 from apps.horario import services as horario_services
 from apps.horario import serializers as horario_serializers
+from apps.horario import tasks as horario_tasks
+from apps.horario import validations as horario_validations
 
 class HorarioParticular(APIView):
     """
@@ -45,9 +53,111 @@ class HorarioParticular(APIView):
         return Response(mensaje,status=status.HTTP_200_OK)
 
 @api_view(['POST'])
+@renderer_classes(api_settings.DEFAULT_RENDERER_CLASSES + [horario_renderers.NDJSONRenderer])
 def GenerarHorarioParticular(request):
+    # Con ?meta=1 o HORARIO_SERVER_TIMING se miden las fases y se devuelven en Server-Timing;
+    # ?meta=1 ademas envuelve los resultados junto a un bloque 'meta' con tiempos y contadores.
+    # Con Accept: application/x-ndjson cada combinacion se escribe en cuanto se genera; ahi
+    # no hay Server-Timing y el 'meta' llega como ultima linea. Con ?formato=compacto cada
+    # materia se envia una sola vez y las combinaciones llevan sus indices
+    meta = request.query_params.get('meta', '').lower() in ('1', 'true')
+    en_flujo = request.accepted_renderer.format == horario_renderers.NDJSONRenderer.format
+    medicion = horario_medicion.Medicion() if meta or (settings.HORARIO_SERVER_TIMING and not en_flujo) else None
     try:
-        horario = horario_services.iniciate(request.data)
+        compacto = horario_validations.validate_formato(request.query_params.get('formato')) == 'compacto'
+        if en_flujo:
+            resultados = horario_services.generar_horario_particular_en_flujo(request.data, request.query_params.get('top_k'), medicion)
+        else:
+            horario = horario_services.generar_horario_particular(request.data, request.query_params.get('top_k'), medicion)
+    except ValueError as e:
+        return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    if en_flujo:
+        if compacto:
+            resultados = horario_services.compactar_en_flujo(resultados)
+        return StreamingHttpResponse(lineas_generacion(resultados, medicion), content_type=horario_renderers.NDJSONRenderer.media_type)
+    if medicion is None:
+        if compacto:
+            horario = horario_services.compactar_resultados(horario)
+        return Response(horario, status=status.HTTP_200_OK)
+    with medicion.fase('serializacion'):
+        if compacto:
+            horario = horario_services.compactar_resultados(horario)
+        contenido = JSONRenderer().render(horario)
+    if meta:
+        contenido = b'{"resultados":%s,"meta":%s}' % (contenido, JSONRenderer().render(medicion.como_dict()))
+    response = HttpResponse(contenido, content_type='application/json', status=status.HTTP_200_OK)
+    response['Server-Timing'] = medicion.server_timing()
+    return response
+
+def lineas_generacion(resultados, medicion:horario_medicion.Medicion=None):
+    renderer = horario_renderers.NDJSONRenderer()
+    try:
+        yield from renderer.lineas(resultados)
+    except Exception as e:
+        # El estado 200 ya se envio, el error se informa como ultima linea
+        yield from renderer.lineas([{'detail': str(e)}])
+        return
+    if medicion is not None:
+        yield from renderer.lineas([{'meta': medicion.como_dict()}])
+
+@api_view(['POST'])
+@renderer_classes([horario_renderers.NDJSONRenderer] + api_settings.DEFAULT_RENDERER_CLASSES)
+def GenerarCohorte(request):
+    # Recibe una lista de {'estudiante','peticion'} (o {'estudiantes': [...]}) y responde en
+    # flujo NDJSON una linea por estudiante a medida que se terminan sus perfiles
+    datos = request.data.get('estudiantes') if isinstance(request.data, dict) else request.data
+    try:
+        compacto = horario_validations.validate_formato(request.query_params.get('formato')) == 'compacto'
+        lineas = horario_services.generar_cohorte(datos, request.query_params.get('top_k'))
+    except ValueError as e:
+        return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    if compacto:
+        lineas = (
+            dict(linea, resultados=horario_services.compactar_resultados(linea['resultados'])) if 'resultados' in linea else linea
+            for linea in lineas
+        )
+    return StreamingHttpResponse(lineas_generacion(lineas), content_type=horario_renderers.NDJSONRenderer.media_type)
+
+class TrabajoGeneracion(APIView):
+    """
+        Generacion asincrona: el POST registra el trabajo y lo encola en Celery, el GET
+        consulta su estado.
+    """
+    def post(self,request):
+        try:
+            trabajo = horario_services.crear_trabajo_generacion(request.data, request.query_params.get('top_k'))
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        try:
+            horario_tasks.generar_horario_particular.delay(trabajo.id)
+        except Exception as e:
+            # Sin encolar ningun worker lo va a tomar: queda en error en vez de 'pendiente'
+            detalle = 'No se pudo encolar el trabajo: %s' % e
+            horario_services.marcar_error_trabajo_generacion(trabajo.id, detalle)
+            return Response({"detail": detalle, "id": trabajo.id}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        serializer = horario_serializers.TrabajoGeneracion(horario_services.obtener_trabajo_generacion(trabajo.id),many=False).data
+        return Response(serializer, status=status.HTTP_202_ACCEPTED)
+
+    def get(self,request,id):
+        try:
+            trabajo = horario_services.obtener_trabajo_generacion(id)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        serializer = horario_serializers.TrabajoGeneracion(trabajo,many=False).data
+        return Response(serializer, status=status.HTTP_200_OK)
+
+@api_view(['GET'])
+def ResultadoTrabajoGeneracion(request,id):
+    try:
+        horario = horario_services.obtener_resultado_trabajo(id)
     except ValueError as e:
         return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
@@ -98,3 +208,32 @@ class HorarioGeneral(APIView):
         serializer = horario_serializers.HorarioGeneral(horario_a_editar,many=False).data
         serializer['detail'] = str("Has editado el horario exitosamente")
         return Response(serializer, status=status.HTTP_200_OK)
+
+class HorariosGenerales(APIView):
+    """
+        Registro y consulta de los horarios de varias carreras en una sola peticion. El POST
+        recibe una lista de horarios (o {'horarios': [...]}) y los registra o reemplaza en una
+        transaccion; el GET los obtiene por ?ids=1,2 o ?carreras=sistemas,petroleo (y
+        opcionalmente &fecha=YYYY-MM-DD).
+    """
+    def post(self,request):
+        datos = request.data.get('horarios') if isinstance(request.data, dict) else request.data
+        try:
+            horarios = horario_services.registrar_horarios_del_semestre(datos)
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        serializer = horario_serializers.HorarioGeneral(horarios,many=True).data
+        return Response({'horarios': serializer, 'detail': str("Has registrado %d horarios exitosamente" % len(serializer))}, status=status.HTTP_201_CREATED)
+
+    def get(self,request):
+        separar = lambda parametro: [valor for valor in request.query_params.get(parametro, '').split(',') if valor]
+        try:
+            horarios = horario_services.obtener_horarios_del_semestre(separar('ids'), separar('carreras'), request.query_params.get('fecha'))
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        serializer = horario_serializers.HorarioGeneral(horarios,many=True).data
+        return Response({'horarios': serializer, 'detail': str("Has obtenido los horarios exitosamente")}, status=status.HTTP_200_OK)